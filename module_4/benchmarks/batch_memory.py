@@ -0,0 +1,81 @@
+"""Compare memory used by a list of AdmissionResult against an AdmissionBatch.
+
+Run from module_4 with ``PYTHONPATH=src python benchmarks/batch_memory.py [rows]``.
+"""
+
+import random
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+from model import AdmissionBatch, AdmissionResult
+
+SCHOOLS = ["MIT", "Stanford University", "Johns Hopkins University", "UC Berkeley"]
+PROGRAMS = ["Computer Science", "Physics", "Mathematics", "Biology"]
+
+
+def make_result(index: int) -> AdmissionResult:
+    """Build a plausible scraped row.
+
+    :param index: Row number, used as the id.
+    :type index: int
+    :returns: Synthetic result.
+    :rtype: AdmissionResult
+    """
+    added_on = datetime(2024, 1, 1) + timedelta(days=index % 365)
+    # join() copies the picked name, like the parser does for every scraped row
+    return AdmissionResult(
+        id=index,
+        school="".join(random.choice(SCHOOLS)),
+        program_name="".join(random.choice(PROGRAMS)),
+        degree_type=random.choice(["masters", "phd"]),
+        added_on=added_on,
+        decision_status=random.choice(["accepted", "rejected", "interview"]),
+        decision_date=added_on,
+        season="fall",
+        year=2025,
+        applicant_region=random.choice(["american", "international"]),
+        gre_general=None,
+        gre_verbal=random.choice([None, 160]),
+        gre_analytical_writing=None,
+        gpa=random.choice([None, 3.5, 3.9]),
+        comments="",
+        full_info_url=f"/result/{index}",
+        llm_generated_program="".join(random.choice(PROGRAMS)),
+        llm_generated_university="".join(random.choice(SCHOOLS)),
+    )
+
+
+def measure(label: str, build, rows: int) -> None:
+    """Print memory held by the container that build() returns.
+
+    :param label: Name to print.
+    :type label: str
+    :param build: Callable taking the row count.
+    :param rows: Number of rows to build.
+    :type rows: int
+    """
+    random.seed(0)
+    tracemalloc.start()
+    container = build(rows)
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = snapshot.statistics("filename")
+    size = sum(stat.size for stat in stats)
+    blocks = sum(stat.count for stat in stats)
+
+    print(f"{label:>6}: {len(container)} rows, {size / rows:.0f} bytes/row, "
+          f"{blocks / rows:.1f} allocations/row")
+
+
+def main() -> None:
+    """Run the comparison."""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    measure("list", lambda n: [make_result(i) for i in range(n)], rows)
+    measure("batch", lambda n: AdmissionBatch.from_results(make_result(i) for i in range(n)), rows)
+
+
+if __name__ == "__main__":
+    main()
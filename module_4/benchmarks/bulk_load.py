@@ -0,0 +1,35 @@
+"""Compare load throughput with and without the bulk-load profile.
+
+Run from module_4 against a scratch database with
+``DB_TABLE=bulk_benchmark PYTHONPATH=src python benchmarks/bulk_load.py [rows]``. The tables
+named by DB_TABLE are dropped and recreated before every run.
+"""
+
+import random
+import sys
+
+import model
+from load_data import save_entries
+from load_from_dicts import make_entry
+
+
+def main() -> None:
+    """Run the comparison."""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    random.seed(0)
+    entries = [make_entry(i) for i in range(rows)]
+
+    for bulk, staging in [(False, False), (True, False), (True, True)]:
+        model.drop_tables()
+        model.init_tables()
+
+        elapsed = save_entries(entries, bulk=bulk, staging=staging)
+
+        print(f"bulk={bulk}, staging={staging}: {rows / elapsed:,.0f} rows/s")
+
+    model.drop_tables()
+
+
+if __name__ == "__main__":
+    main()
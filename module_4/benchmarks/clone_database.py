@@ -0,0 +1,43 @@
+"""Time cloning a seeded template database against loading the same rows.
+
+Run from module_4 with ``PYTHONPATH=src python benchmarks/clone_database.py [rows]``. The
+first run seeds the template (see postgres_manager.build_template()); later runs with the
+same row count reuse it and only clone.
+"""
+
+import random
+import sys
+import time
+
+import model
+import postgres_manager
+from load_data import save_entries
+from load_from_dicts import make_entry
+
+
+def main() -> None:
+    """Run the comparison."""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    def seed():
+        random.seed(0)
+        model.init_tables()
+        elapsed = save_entries([make_entry(i) for i in range(rows)], bulk=True)
+        print(f"Seeded {rows} rows in {elapsed:.2f} s")
+
+    postgres_manager.check_and_configure_postgres()
+    postgres_manager.build_template(seed, key=f"clone-benchmark:{rows}")
+
+    started = time.perf_counter()
+    clone = postgres_manager.clone_database()
+    print(f"Cloned {rows} rows in {time.perf_counter() - started:.3f} s")
+
+    postgres_manager.use_database(clone)
+    print(f"Clone holds {model.AdmissionResult.count(exact=True)} rows")
+
+    postgres_manager.use_database(postgres_manager.db_config["database"])
+    postgres_manager.drop_database(clone)
+
+
+if __name__ == "__main__":
+    main()
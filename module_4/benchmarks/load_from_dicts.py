@@ -0,0 +1,61 @@
+"""Compare per-row AdmissionResult.from_dict() with AdmissionBatch.from_dicts().
+
+Run from module_4 with ``PYTHONPATH=src python benchmarks/load_from_dicts.py [rows]``.
+"""
+
+import random
+import sys
+import timeit
+
+from model import AdmissionBatch, AdmissionResult
+
+
+def make_entry(index: int) -> dict:
+    """Build a record shaped like the entries in admissions_info.json.
+
+    :param index: Row number, used as the id.
+    :type index: int
+    :returns: Synthetic record.
+    :rtype: dict
+    """
+    return {
+        "id": index,
+        "school": random.choice(["MIT", "Stanford University", "UC Berkeley"]),
+        "program_name": random.choice(["Computer Science", "Physics", "Mathematics"]),
+        "degree_type": random.choice(["masters", "phd"]),
+        "added_on": f"2025-{random.randint(1, 12):02}-{random.randint(1, 28):02}T00:00:00",
+        "decision_status": random.choice(["accepted", "rejected", "interview"]),
+        "decision_date": random.choice(["", "2026-02-10T00:00:00"]),
+        "season": "fall",
+        "year": 2025,
+        "applicant_region": random.choice(["american", "international"]),
+        "gre_general": None,
+        "gre_verbal": random.choice([None, 160]),
+        "gre_analytical_writing": None,
+        "gpa": random.choice([None, 3.5, 3.9]),
+        "comments": "",
+        "full_info_url": f"/result/{index}",
+        "llm_generated_program": "Computer Science",
+        "llm_generated_university": "Stanford University",
+    }
+
+
+def main() -> None:
+    """Run the comparison."""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    random.seed(0)
+    entries = [make_entry(i) for i in range(rows)]
+
+    per_row = min(timeit.repeat(
+        lambda: AdmissionBatch.from_results(AdmissionResult.from_dict(e) for e in entries),
+        number=1, repeat=3,
+    ))
+    columnar = min(timeit.repeat(lambda: AdmissionBatch.from_dicts(entries), number=1, repeat=3))
+
+    print(f"from_dict: {rows / per_row:,.0f} rows/s")
+    print(f"from_dicts: {rows / columnar:,.0f} rows/s ({per_row / columnar:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,12 @@ This blueprint provides web routes for displaying and analyzing graduate
 admissions data.
 """
 
+import math
 import threading
+from contextlib import nullcontext
+import psycopg
 import scrape
-from flask import Blueprint, render_template, request
+from flask import Blueprint, jsonify, render_template, request
 from query_data import answer_questions
 import model
 import postgres_manager
@@ -23,6 +26,11 @@ bp = Blueprint(
 )
 
 
+# statement_timeout in milliseconds of the queries behind the JSON endpoints
+SEARCH_TIMEOUT_MS = 5000
+AUTOCOMPLETE_TIMEOUT_MS = 1000
+
+
 scrape_state = {
     "running": False,
     "entries": None,
@@ -44,19 +52,62 @@ def begin_refresh() -> None:
 
         entries = scrape.scrape_data(1, 30000, latest_id)
 
-        conn = postgres_manager.get_connection()
-        with conn.cursor() as cursor:
-            for entry in entries:
-                entry.clean_and_augment()
-                entry.save_to_db(cursor)
+        # Cleans each distinct program and school once, however many rows share it
+        entries.clean_and_augment()
 
-        conn.commit()
+        # A whole scrape may take longer to save than the pool's statement timeout
+        with postgres_manager.connection(timeout=0) as conn:
+            with conn.cursor() as cursor:
+                model.AdmissionResult.save_many(cursor, entries)
 
         scrape_state["entries"] = entries
     finally:
         scrape_state["running"] = False
 
 
+def _cancel_scope():
+    """Make the request's queries cancelable if the client sent an ``X-Request-ID``.
+
+    The client can then call ``POST /grad-data/cancel/<id>`` when it gives up on the
+    request, e.g. when the user navigates away or types another character. The server
+    can't tell when a client disconnects, since WSGI only notices once the response is
+    written, so cancellation is always up to the client.
+
+    :returns: Context manager wrapping the request's queries.
+    """
+    key = request.headers.get("X-Request-ID")
+
+    return postgres_manager.cancellable(key) if key else nullcontext()
+
+
+@bp.errorhandler(psycopg.errors.QueryCanceled)
+def query_canceled(error):
+    """Answer requests whose query timed out or was canceled.
+
+    :param error: The database error.
+    :returns: Error page for the dashboard, JSON error for the other routes; status 503.
+    :rtype: tuple
+    """
+    if request.endpoint == f"{blueprint_name}.analysis":
+        return render_template("query_canceled.html"), 503
+
+    return jsonify(error="Query timed out or was canceled"), 503
+
+
+@bp.route("/cancel/<request_id>", methods=["POST"])
+def cancel(request_id: str):
+    """Cancel the queries of a request sent with the given ``X-Request-ID``.
+
+    Works across worker processes, see postgres_manager.cancel().
+
+    :param request_id: The request's ``X-Request-ID`` header.
+    :type request_id: str
+    :returns: JSON with ``canceled``, false if no such request is running.
+    :rtype: flask.Response
+    """
+    return jsonify(canceled=postgres_manager.cancel(request_id))
+
+
 @bp.route("/analysis", methods=["GET", "POST"])
 def analysis():
     """Render admissions data analysis dashboard.
@@ -76,8 +127,11 @@ def analysis():
         threading.Thread(target=begin_refresh, daemon=True).start()
         
     # Get the list of questions and their pre-calculated answers.
+    with _cancel_scope():
+        questions = answer_questions()
+
     props = {
-        "questions": answer_questions(),
+        "questions": questions,
         "refresh": refresh,
         "poll": poll,
         "scrape_running": scrape_state["running"],
@@ -86,3 +140,76 @@ def analysis():
 
     # Render the HTML template with the prepared properties.
     return render_template("analysis.html", **props)
+
+
+@bp.route("/search")
+def search():
+    """Search applicant comments.
+
+    Query parameters are ``q`` (search terms), ``limit`` (1-100, default 20) and ``after``
+    (the ``next`` value of a previous response).
+
+    :returns: JSON with ``results`` and a ``next`` cursor (null on the last page), or a 400
+        response for bad parameters.
+    :rtype: flask.Response | tuple
+    """
+    text = request.args.get("q", "").strip()
+    if not text:
+        return jsonify(error="Missing search terms"), 400
+
+    try:
+        limit = min(max(int(request.args.get("limit", 20)), 1), 100)
+
+        after = request.args.get("after")
+        if after:
+            rank, p_id = after.split(":")
+            after = (float(rank), int(p_id))
+
+            # nan and inf parse as floats but match no page boundary
+            if not math.isfinite(after[0]):
+                raise ValueError(rank)
+    except ValueError:
+        return jsonify(error="Invalid limit or cursor"), 400
+
+    with _cancel_scope():
+        results = model.AdmissionResult.search(text, limit, after or None, SEARCH_TIMEOUT_MS)
+
+    next_cursor = None
+    if len(results) == limit:
+        next_cursor = f"{results[-1]['rank']}:{results[-1]['p_id']}"
+
+    return jsonify(results=results, next=next_cursor)
+
+
+# Autocomplete fields and the dimension tables their names come from
+AUTOCOMPLETE_FIELDS = {
+    "school": "schools",
+    "program": "programs",
+}
+
+
+@bp.route("/autocomplete")
+def autocomplete():
+    """Suggest school or program names for partially typed text.
+
+    Query parameters are ``field`` (``school`` or ``program``), ``q`` (typed text) and
+    ``limit`` (1-25, default 10).
+
+    :returns: JSON with ``matches``, or a 400 response for bad parameters.
+    :rtype: flask.Response | tuple
+    """
+    field = request.args.get("field", "school")
+    if field not in AUTOCOMPLETE_FIELDS:
+        return jsonify(error=f"Unknown field: {field}"), 400
+
+    try:
+        limit = min(max(int(request.args.get("limit", 10)), 1), 25)
+    except ValueError:
+        return jsonify(error="Invalid limit"), 400
+
+    with _cancel_scope():
+        matches = model.fuzzy_lookup(
+            AUTOCOMPLETE_FIELDS[field], request.args.get("q", ""), limit, AUTOCOMPLETE_TIMEOUT_MS
+        )
+
+    return jsonify(matches=[{"name": m["name"], "score": m["score"]} for m in matches])
@@ -7,15 +7,22 @@ and pattern-based normalization.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 from pathlib import Path
 import re
 import difflib
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Tuple
 
+import psycopg
 from huggingface_hub import hf_hub_download
 from llama_cpp import Llama
+from psycopg import sql
+
+import postgres_manager
 
 
 # ---------------- Model configuration ----------------
@@ -116,6 +123,179 @@ FEW_SHOTS: List[Tuple[Dict[str, str], Dict[str, str]]] = [
 ]
 
 
+# ---------------- Result cache ----------------
+# Bump whenever call_llm() post-processing changes in a way that alters its results; the
+# model, prompt and rules are folded into CLEANER_VERSION automatically.
+CLEANER_REVISION = 2
+
+CLEANER_VERSION = f"{CLEANER_REVISION}-" + hashlib.sha256(
+    json.dumps([MODEL_FILE, SYSTEM_PROMPT, FEW_SHOTS, NORMALIZATION_RULES]).encode()
+).hexdigest()[:12]
+
+# Table holding call_llm() results across runs, keyed on normalized input and version
+LLM_CACHE_TABLE = "llm_cache"
+
+# Results kept in memory in front of the table, least recently used evicted first
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "4096"))
+
+_memo: OrderedDict[str, Dict[str, str]] = OrderedDict()
+_memo_lock = threading.Lock()
+_cache_counts = {"memory_hits": 0, "table_hits": 0, "misses": 0, "fast_path": 0}
+
+# Minimum similarity of both program and university to a canonical name for call_llm() to
+# answer from the rules alone, without inference
+FAST_PATH_CONFIDENCE = float(os.getenv("LLM_FAST_PATH_CONFIDENCE", "0.92"))
+
+
+def create_cache_table(cur) -> None:
+    """Create the table behind the call_llm() result cache, if missing.
+
+    Called by model.init_tables(); bump model.SCHEMA_VERSION when changing the table.
+
+    :param cur: Database cursor.
+    """
+    cur.execute(sql.SQL("""
+        CREATE TABLE IF NOT EXISTS {} (
+            input TEXT NOT NULL,
+            cleaner_version TEXT NOT NULL,
+            standardized_program TEXT NOT NULL,
+            standardized_university TEXT NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            PRIMARY KEY (cleaner_version, input)
+        );
+    """).format(sql.Identifier(LLM_CACHE_TABLE)))
+
+
+def input_key(program_text: str) -> str:
+    """Normalize call_llm() input; inputs with the same key get the same result.
+
+    :param program_text: Input text with program and university.
+    :type program_text: str
+    :returns: Text with whitespace collapsed and case folded.
+    :rtype: str
+    """
+    return " ".join((program_text or "").split()).casefold()
+
+
+def _remember(key: str, result: Dict[str, str]) -> None:
+    """Put a result into the in-process cache, evicting the least recently used.
+
+    :param key: Normalized input.
+    :type key: str
+    :param result: call_llm() result.
+    :type result: Dict[str, str]
+    """
+    with _memo_lock:
+        _memo[key] = result
+        _memo.move_to_end(key)
+
+        while len(_memo) > LLM_CACHE_SIZE:
+            _memo.popitem(last=False)
+
+
+def _recall(key: str) -> Dict[str, str] | None:
+    """Look a result up in memory, then in LLM_CACHE_TABLE, counting hits and misses.
+
+    Table errors are printed and treated as misses, so cleaning works without the table.
+
+    :param key: Normalized input.
+    :type key: str
+    :returns: Cached result, or None.
+    :rtype: Dict[str, str] | None
+    """
+    with _memo_lock:
+        if key in _memo:
+            _memo.move_to_end(key)
+            _cache_counts["memory_hits"] += 1
+            return dict(_memo[key])
+
+    row = None
+
+    try:
+        with postgres_manager.connection() as conn:
+            row = conn.execute(sql.SQL("""
+                SELECT standardized_program, standardized_university FROM {}
+                WHERE cleaner_version = %s AND input = %s;
+            """).format(sql.Identifier(LLM_CACHE_TABLE)), [CLEANER_VERSION, key]).fetchone()
+    except psycopg.Error as e:
+        print(f"LLM cache lookup failed: {e}")
+
+    with _memo_lock:
+        _cache_counts["table_hits" if row else "misses"] += 1
+
+    if row is None:
+        return None
+
+    result = {"standardized_program": row[0], "standardized_university": row[1]}
+    _remember(key, result)
+
+    return dict(result)
+
+
+def _store(key: str, result: Dict[str, str]) -> None:
+    """Save a fresh result in memory and in LLM_CACHE_TABLE.
+
+    :param key: Normalized input.
+    :type key: str
+    :param result: call_llm() result.
+    :type result: Dict[str, str]
+    """
+    _remember(key, dict(result))
+
+    try:
+        with postgres_manager.connection() as conn:
+            conn.execute(sql.SQL("""
+                INSERT INTO {} (
+                    input, cleaner_version, standardized_program, standardized_university
+                ) VALUES (%s, %s, %s, %s)
+                ON CONFLICT DO NOTHING;
+            """).format(sql.Identifier(LLM_CACHE_TABLE)), [
+                key,
+                CLEANER_VERSION,
+                result["standardized_program"],
+                result["standardized_university"],
+            ])
+    except psycopg.Error as e:
+        print(f"LLM cache store failed: {e}")
+
+
+def cache_stats() -> Dict[str, float]:
+    """Report how often call_llm() was answered from its caches.
+
+    :returns: ``memory_hits``, ``table_hits``, ``misses`` (calls not served from a cache),
+        ``fast_path`` (misses answered by the rules without inference), ``hit_rate`` (share
+        of calls served from a cache), ``fast_path_rate`` (share of calls answered by the
+        rules) and ``memory_size``.
+    :rtype: Dict[str, float]
+    """
+    with _memo_lock:
+        stats = dict(_cache_counts, memory_size=len(_memo))
+
+    calls = stats["memory_hits"] + stats["table_hits"] + stats["misses"]
+    stats["hit_rate"] = (calls - stats["misses"]) / calls if calls else 0.0
+    stats["fast_path_rate"] = stats["fast_path"] / calls if calls else 0.0
+
+    return stats
+
+
+def clear_cache(persistent: bool = False) -> None:
+    """Empty the in-process cache and zero the counters.
+
+    :param persistent: Also delete every row of LLM_CACHE_TABLE.
+    :type persistent: bool
+    :raises psycopg.Error: If deleting the rows fails.
+    """
+    with _memo_lock:
+        _memo.clear()
+
+        for name in _cache_counts:
+            _cache_counts[name] = 0
+
+    if persistent:
+        with postgres_manager.connection() as conn:
+            conn.execute(sql.SQL("DELETE FROM {};").format(sql.Identifier(LLM_CACHE_TABLE)))
+
+
 _LLM: Llama | None = None
 
 
@@ -255,9 +435,95 @@ def _normalize_text(text: str, text_type: str) -> str:
         return match or normalized
 
 
+def _canonical_score(name: str, text_type: str) -> Tuple[str, float]:
+    """Score a name against the canonical list for programs or universities.
+
+    :param name: Name as split from the input by _split_fallback().
+    :type name: str
+    :param text_type: Type - "programs" or "universities".
+    :type text_type: str
+    :returns: Closest canonical name and its similarity, 1.0 for an exact match; the name
+        and 0.0 if nothing reaches FAST_PATH_CONFIDENCE.
+    :rtype: Tuple[str, float]
+    """
+    rules = NORMALIZATION_RULES[text_type]
+    name = rules["fixes"].get(name, name)
+    canonical = rules["canonical"]
+
+    if name in canonical:
+        return name, 1.0
+
+    match = _best_match(name, canonical, cutoff=FAST_PATH_CONFIDENCE)
+
+    if match is None:
+        return name, 0.0
+
+    return match, difflib.SequenceMatcher(None, name, match).ratio()
+
+
+def _pre_classify(program_text: str) -> Dict[str, str] | None:
+    """Standardize names by rules alone when they closely match the canonical lists.
+
+    The input is split and expanded like _split_fallback() does, then both parts are scored
+    with _canonical_score(). The lower score is the confidence.
+
+    :param program_text: Input text with program and university.
+    :type program_text: str
+    :returns: call_llm() result, or None if confidence is below FAST_PATH_CONFIDENCE.
+    :rtype: Dict[str, str] | None
+    """
+    prog, uni = _split_fallback(program_text)
+
+    if not prog or uni == "Unknown":
+        return None
+
+    prog, prog_score = _canonical_score(prog, "programs")
+    uni, uni_score = _canonical_score(uni, "universities")
+
+    if min(prog_score, uni_score) < FAST_PATH_CONFIDENCE:
+        return None
+
+    return {
+        "standardized_program": prog,
+        "standardized_university": uni,
+    }
+
+
 def call_llm(program_text: str) -> Dict[str, str]:
     """Standardize program and university names using LLM.
+
+    Results are cached by normalized input and CLEANER_VERSION, in memory and in
+    LLM_CACHE_TABLE, so repeated inputs skip inference. Inputs whose parts already match
+    canonical names closely are answered by _pre_classify() without inference; see
+    cache_stats().
     
+    :param program_text: Input text with program and university.
+    :type program_text: str
+    :returns: Dictionary with standardized_program and standardized_university keys.
+    :rtype: Dict[str, str]
+    :raises Exception: If LLM processing fails.
+    """
+    key = input_key(program_text)
+
+    if (cached := _recall(key)) is not None:
+        return cached
+
+    result = _pre_classify(program_text)
+
+    if result is not None:
+        with _memo_lock:
+            _cache_counts["fast_path"] += 1
+    else:
+        result = _run_llm(program_text)
+
+    _store(key, result)
+
+    return result
+
+
+def _run_llm(program_text: str) -> Dict[str, str]:
+    """Run inference and normalize its answer, see call_llm().
+
     :param program_text: Input text with program and university.
     :type program_text: str
     :returns: Dictionary with standardized_program and standardized_university keys.
@@ -1,21 +1,77 @@
 """Load admissions data from JSON files into PostgreSQL database."""
 
 import json
-from model import AdmissionResult, init_tables
+import os
+import time
+from contextlib import nullcontext
+from model import AdmissionBatch, AdmissionResult, analyze_tables, init_tables
 import postgres_manager
 
 
-def load_admissions_results(filename: str) -> None:
+def use_bulk_load() -> bool:
+    """Check whether loads should run with the bulk-load profile.
+
+    :returns: True if the DB_BULK_LOAD env var is set to a true value.
+    :rtype: bool
+    """
+    return os.environ.get("DB_BULK_LOAD", "").lower() in ("1", "true", "yes")
+
+
+def save_entries(entries: list[dict], bulk: bool = False, staging: bool = False) -> float:
+    """Save admission dictionaries to the database in one transaction.
+
+    :param entries: Dictionaries with admission data, as in the JSON files.
+    :type entries: list[dict]
+    :param bulk: Apply postgres_manager.bulk_load() and analyze the tables before committing.
+    :type bulk: bool
+    :param staging: Merge through a temporary staging table, see AdmissionResult.save_many().
+    :type staging: bool
+    :returns: Seconds taken, including the commit.
+    :rtype: float
+    :raises psycopg.Error: If database operations fail.
+    """
+    started = time.perf_counter()
+
+    # Large loads may run longer than the pool's statement timeout
+    with postgres_manager.connection(timeout=0) as conn:
+        with conn.cursor() as cursor:
+            with postgres_manager.bulk_load(cursor) if bulk else nullcontext():
+                AdmissionResult.save_many(
+                    cursor, AdmissionBatch.from_dicts(entries), staging=staging
+                )
+
+                if bulk:
+                    analyze_tables(cursor)
+
+    return time.perf_counter() - started
+
+
+def load_admissions_results(
+    filename: str,
+    bulk: bool | None = None,
+    staging: bool = False,
+) -> None:
     """Load admissions data from JSON file into database.
-    
+
+    With bulk, the load runs under postgres_manager.bulk_load() and the tables are
+    analyzed before committing, so queries are planned with fresh statistics right away.
+    The load rate is printed either way.
+
     :param filename: Path to JSON file with admission result data.
     :type filename: str
+    :param bulk: Apply the bulk-load profile; None to follow DB_BULK_LOAD.
+    :type bulk: bool | None
+    :param staging: Merge through a temporary staging table, see AdmissionResult.save_many().
+    :type staging: bool
     :raises FileNotFoundError: If JSON file doesn't exist.
     :raises json.JSONDecodeError: If file contains invalid JSON.
     :raises psycopg.Error: If database operations fail.
     """
     init_tables()
 
+    if bulk is None:
+        bulk = use_bulk_load()
+
     print("Beginning data ingestion...")
 
     # Read the data from the specified JSON file
@@ -24,15 +80,13 @@ def load_admissions_results(filename: str) -> None:
 
     print(f"Read {len(entries)} entries from JSON file {filename} ...")
 
-    # Save each entry to the database
-    conn = postgres_manager.get_connection()
-    with conn.cursor() as cursor:
-        for entry in entries:
-            AdmissionResult.from_dict(entry).save_to_db(cursor)
-
-    conn.commit()
+    # Save the entries to the database in one batch
+    elapsed = save_entries(entries, bulk, staging)
 
     count = AdmissionResult.count()
 
     print(f"Loaded {count} entries")
-
+    print(
+        f"Saved {len(entries)} entries in {elapsed:.2f} s "
+        f"({len(entries) / max(elapsed, 1e-9):,.0f} rows/s, bulk={bulk}, staging={staging})"
+    )
@@ -1,11 +1,22 @@
 """Data models and database operations for admission results."""
 
+import math
+import numpy as np
 import os
 import psycopg
 import psycopg.rows
 import re
+import sys
+import threading
+import time
+import weakref
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import dataclasses
 from dataclasses import dataclass
+from enum import Enum
+from typing import Iterator
 from bs4.element import Tag
 from psycopg import sql
 
@@ -15,8 +26,36 @@ import postgres_manager
 
 DB_TABLE = "admissions_info"
 
+# Bump whenever init_tables() creates different tables, including those it delegates to
+# clean.create_cache_table(); seeded template databases are rebuilt on a new version.
+SCHEMA_VERSION = 1
+
+# Dimension tables holding the school and program names shared by many rows.
+DIMENSIONS = ("schools", "programs")
+
+# Text search configuration for comments_tsv and search()
+SEARCH_CONFIG = "english"
+
+# Control characters standing in for markup while ts_headline() runs: the highlight tags
+# and the characters HTML escapes, see search()
+HEADLINE_MARKUP = {
+    "\x02": "<b>",
+    "\x03": "</b>",
+    "\x04": "&amp;",
+    "\x05": "&lt;",
+    "\x06": "&gt;",
+}
+_HEADLINE_TABLE = str.maketrans(HEADLINE_MARKUP)
+
+# Statements taking at least this many milliseconds are logged, see _timed_fetch()
+SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+
+
 def get_table() -> str:
     """Get database table name.
+
+    This is the name queries read from. It is a view over get_data_table() and the
+    dimension tables that exposes the original admissions columns.
     
     :returns: Table name from DB_TABLE env var or default.
     :rtype: str
@@ -24,42 +63,1152 @@ def get_table() -> str:
     return str(os.environ.get("DB_TABLE", DB_TABLE))
 
 
+def get_data_table() -> str:
+    """Get name of the table that stores admission rows.
+
+    :returns: Table name derived from get_table().
+    :rtype: str
+    """
+    return f"{get_table()}_data"
+
+
+def use_year_partitions() -> bool:
+    """Check whether new data tables should be partitioned by year.
+
+    Only consulted when init_tables() creates the data table; an existing table keeps
+    the layout it was created with.
+
+    :returns: True if the DB_PARTITION_BY_YEAR env var is set to a true value.
+    :rtype: bool
+    """
+    return os.environ.get("DB_PARTITION_BY_YEAR", "").lower() in ("1", "true", "yes")
+
+
+def capture_slow_queries() -> bool:
+    """Check whether slow statements should be recorded in get_slow_query_table().
+
+    Each capture re-runs the statement under EXPLAIN ANALYZE on a background thread, so
+    the caller doesn't wait, but the server does the statement's work twice; see
+    _timed_fetch().
+
+    :returns: True if the DB_CAPTURE_SLOW_QUERIES env var is set to a true value.
+    :rtype: bool
+    """
+    return os.environ.get("DB_CAPTURE_SLOW_QUERIES", "").lower() in ("1", "true", "yes")
+
+
+def get_dimension_table(dimension: str) -> str:
+    """Get name of a dimension table.
+
+    :param dimension: One of DIMENSIONS.
+    :type dimension: str
+    :returns: Table name derived from get_table().
+    :rtype: str
+    """
+    return f"{get_table()}_{dimension}"
+
+
+class DecisionStatus(Enum):
+    """Admission decision reported by the applicant."""
+
+    ACCEPTED = "accepted"
+    INTERVIEW_PENDING = "interview"
+    WAIT_LISTED = "wait_listed"
+    REJECTED = "rejected"
+    OTHER = "other"
+
+
+class SchoolSeason(Enum):
+    """Term the applicant applied for."""
+
+    FALL = "fall"
+    WINTER = "winter"
+    SPRING = "spring"
+    SUMMER = "summer"
+
+
+class SchoolRegion(Enum):
+    """Whether the applicant is an American or international student."""
+
+    INTERNATIONAL = "international"
+    AMERICAN = "american"
+
+
+class DegreeType(Enum):
+    """Degree the applicant applied for."""
+
+    MASTERS = "masters"
+    PHD = "phd"
+    EDD = "edd"
+    PSYD = "psyd"
+    MFA = "mfa"
+    MBA = "mba"
+    JD = "jd"
+    OTHER = "other"
+
+
+# Low-cardinality columns of the data table, mapped to the Postgres enum type they are stored
+# as and the Python enum naming their labels.
+ENUM_COLUMNS: dict[str, tuple[str, type[Enum]]] = {
+    "status": ("admission_status", DecisionStatus),
+    "season": ("admission_season", SchoolSeason),
+    "us_or_international": ("admission_region", SchoolRegion),
+    "degree": ("admission_degree", DegreeType),
+}
+
+
+def to_db_enum(enum_type: type[Enum], value) -> str | None:
+    """Map a parsed value onto the enum label stored in the database.
+
+    Values outside the enum become ``OTHER`` when the enum has it and None otherwise, so a
+    surprise label from the site never fails a whole batch.
+
+    :param enum_type: Enum naming the column's labels.
+    :type enum_type: type[Enum]
+    :param value: Enum member, label string, or a falsy value for missing data.
+    :returns: Label to store, or None.
+    :rtype: str | None
+    """
+    if not value:
+        return None
+
+    try:
+        return enum_type(value).value
+    except ValueError:
+        other = getattr(enum_type, "OTHER", None)
+        return other.value if other else None
+
+
+def _enum_cast(column: sql.Composable, column_name: str) -> sql.Composed:
+    """Build SQL casting a text column to its enum type with the same rules as to_db_enum().
+
+    :param column: Column reference to cast.
+    :type column: sql.Composable
+    :param column_name: Key from ENUM_COLUMNS.
+    :type column_name: str
+    :returns: CASE expression yielding the enum value.
+    :rtype: sql.Composed
+    """
+    type_name, enum_type = ENUM_COLUMNS[column_name]
+    other = getattr(enum_type, "OTHER", None)
+
+    return sql.SQL("""
+        CASE
+            WHEN {column} IS NULL OR {column} = '' THEN NULL
+            WHEN {column} = ANY(enum_range(NULL::{type})::text[]) THEN {column}::{type}
+            ELSE {other}::{type}
+        END
+    """).format(
+        column=column,
+        type=sql.Identifier(type_name),
+        other=sql.Literal(other.value if other else None),
+    )
+
+
+def _create_enum_types(cur) -> None:
+    """Create the enum types in ENUM_COLUMNS and add any labels they are missing.
+
+    :param cur: Database cursor.
+    """
+    for type_name, enum_type in ENUM_COLUMNS.values():
+        labels = [member.value for member in enum_type]
+
+        cur.execute(sql.SQL("""
+            DO $$ BEGIN
+                CREATE TYPE {} AS ENUM ({});
+            EXCEPTION WHEN duplicate_object OR unique_violation THEN NULL;
+            END $$;
+        """).format(
+            sql.Identifier(type_name),
+            sql.SQL(", ").join(map(sql.Literal, labels)),
+        ))
+
+        for label in labels:
+            cur.execute(sql.SQL("ALTER TYPE {} ADD VALUE IF NOT EXISTS {};").format(
+                sql.Identifier(type_name),
+                sql.Literal(label),
+            ))
+
+
+def _convert_enum_columns(cur) -> None:
+    """Convert TEXT columns written by older versions to their enum types.
+
+    :param cur: Database cursor.
+    """
+    cur.execute("""
+        SELECT column_name::text
+        FROM information_schema.columns
+        WHERE table_name = %s AND data_type = 'text' AND column_name = ANY(%s);
+    """, [get_data_table(), list(ENUM_COLUMNS)])
+
+    columns = [column for (column,) in cur.fetchall()]
+
+    if columns:
+        # Partial index predicates compare against text literals and can't be converted in
+        # place; sync_indexes() rebuilds them afterwards.
+        _drop_managed_indexes(cur)
+
+    for column in columns:
+        print(f"Converting column {column} to {ENUM_COLUMNS[column][0]}")
+
+        cur.execute(sql.SQL("ALTER TABLE {} ALTER COLUMN {} TYPE {} USING {};").format(
+            sql.Identifier(get_data_table()),
+            sql.Identifier(column),
+            sql.Identifier(ENUM_COLUMNS[column][0]),
+            _enum_cast(sql.Identifier(column), column),
+        ))
+
+
+def _is_partitioned(cur) -> bool:
+    """Check whether the data table is partitioned.
+
+    :param cur: Database cursor.
+    :returns: True if get_data_table() is a partitioned table.
+    :rtype: bool
+    """
+    cur.execute(
+        "SELECT relkind::text FROM pg_class WHERE oid = to_regclass(%s);",
+        [get_data_table()],
+    )
+
+    row = cur.fetchone()
+    return bool(row) and row[0] == "p"
+
+
+async def _is_partitioned_async(cur) -> bool:
+    """Async counterpart of _is_partitioned().
+
+    :param cur: Async database cursor.
+    :returns: True if get_data_table() is a partitioned table.
+    :rtype: bool
+    """
+    await cur.execute(
+        "SELECT relkind::text FROM pg_class WHERE oid = to_regclass(%s);",
+        [get_data_table()],
+    )
+
+    row = await cur.fetchone()
+    return bool(row) and row[0] == "p"
+
+
+def _year_partition_name(year: int | None) -> str:
+    """Get name of the partition holding one year's rows.
+
+    :param year: Application year, or None for rows without one.
+    :type year: int | None
+    :returns: Partition table name.
+    :rtype: str
+    """
+    return f"{get_data_table()}_y{'null' if year is None else year}"
+
+
+def _create_year_partitions(cur, years) -> None:
+    """Create partitions of the data table for the given years if they don't exist.
+
+    :param cur: Database cursor.
+    :param years: Iterable of years; None creates the partition for rows without a year.
+    """
+    for year in years:
+        cur.execute(_create_year_partition_query(year))
+
+
+def _create_year_partition_query(year: int | None) -> sql.Composed:
+    """Build the statement creating one year's partition if it doesn't exist.
+
+    :param year: Application year, or None for rows without one.
+    :type year: int | None
+    :returns: CREATE TABLE statement.
+    :rtype: sql.Composed
+    """
+    query = sql.SQL("CREATE TABLE IF NOT EXISTS {} PARTITION OF {} FOR VALUES IN ({});")
+
+    return query.format(
+        sql.Identifier(_year_partition_name(year)),
+        sql.Identifier(get_data_table()),
+        sql.Literal(year),
+    )
+
+
+def _missing_partitions_query(years) -> tuple[sql.Composed, list]:
+    """Build the query listing which of the given years have no partition yet.
+
+    :param years: Iterable of years, may include None.
+    :returns: Query and params; the query yields one partition name per row.
+    :rtype: tuple[sql.Composed, list]
+    """
+    return (
+        sql.SQL("SELECT name FROM unnest(%s::text[]) AS name WHERE to_regclass(name) IS NULL;"),
+        [[sql.Identifier(_year_partition_name(year)).as_string() for year in set(years)]],
+    )
+
+
+def ensure_year_partitions(cur, years) -> None:
+    """Make sure a partitioned data table has a partition for each of the given years.
+
+    Missing partitions are created on the caller's cursor, inside its transaction, so they
+    commit or roll back together with the rows written to them. Creating a partition locks
+    the parent table until that transaction ends; this only happens for a new year.
+
+    :param cur: Database cursor of the transaction that will write the rows.
+    :param years: Iterable of years, may include None.
+    :raises psycopg.Error: If partition creation fails.
+    """
+    years = set(years)
+
+    cur.execute(*_missing_partitions_query(years))
+    missing = {name for (name,) in cur.fetchall()}
+    if not missing:
+        return
+
+    # Serialize concurrent creation of the same partitions
+    cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s));", [get_data_table()])
+
+    _create_year_partitions(cur, [
+        year for year in years
+        if sql.Identifier(_year_partition_name(year)).as_string() in missing
+    ])
+
+
+async def ensure_year_partitions_async(cur, years) -> None:
+    """Async counterpart of ensure_year_partitions().
+
+    :param cur: Async database cursor of the transaction that will write the rows.
+    :param years: Iterable of years, may include None.
+    :raises psycopg.Error: If partition creation fails.
+    """
+    years = set(years)
+
+    await cur.execute(*_missing_partitions_query(years))
+    missing = {name for (name,) in await cur.fetchall()}
+    if not missing:
+        return
+
+    await cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s));", [get_data_table()])
+
+    for year in years:
+        if sql.Identifier(_year_partition_name(year)).as_string() in missing:
+            await cur.execute(_create_year_partition_query(year))
+
+
+def detach_year_partition(year: int | None) -> str:
+    """Detach one year's partition from the data table.
+
+    The detached table keeps its rows and name, so it can be archived, dumped or dropped
+    without touching the other years. Rows for that year are no longer visible through
+    get_table(); rename or drop the table before loading that year again.
+
+    :param year: Year whose partition to detach.
+    :type year: int | None
+    :returns: Name of the detached table.
+    :rtype: str
+    :raises psycopg.Error: If the table isn't partitioned or has no such partition.
+    """
+    name = _year_partition_name(year)
+
+    with postgres_manager.get_connection() as conn:
+        # CONCURRENTLY can't run inside a transaction block
+        conn.autocommit = True
+
+        conn.execute(sql.SQL("ALTER TABLE {} DETACH PARTITION {} CONCURRENTLY;").format(
+            sql.Identifier(get_data_table()),
+            sql.Identifier(name),
+        ))
+
+    refresh_stats()
+
+    return name
+
+
+def _detach_legacy_table(cur) -> str | None:
+    """Rename a pre-dimension admissions table out of the way of the view.
+
+    :param cur: Database cursor.
+    :returns: New name of the legacy table, or None if there was nothing to migrate.
+    :rtype: str | None
+    """
+    cur.execute(
+        "SELECT relkind::text FROM pg_class WHERE oid = to_regclass(%s);",
+        [get_table()],
+    )
+
+    row = cur.fetchone()
+    if not row or row[0] != "r":
+        return None
+
+    legacy = f"{get_table()}_legacy"
+
+    print(f"Migrating table {get_table()} (renamed to {legacy})...")
+
+    cur.execute(sql.SQL("ALTER TABLE {} RENAME TO {};").format(
+        sql.Identifier(get_table()),
+        sql.Identifier(legacy),
+    ))
+
+    return legacy
+
+
+def _migrate_legacy_table(cur, legacy: str) -> None:
+    """Copy rows from a legacy admissions table into the dimension schema, then drop it.
+
+    :param cur: Database cursor.
+    :param legacy: Name of the legacy table.
+    :type legacy: str
+    """
+    for dimension, columns in [
+        ("schools", ["school", "llm_generated_university"]),
+        ("programs", ["program_name", "llm_generated_program"]),
+    ]:
+        cur.execute(sql.SQL("""
+            INSERT INTO {} (name)
+            SELECT DISTINCT v.name
+            FROM {} l, LATERAL (VALUES {}) AS v(name)
+            WHERE v.name IS NOT NULL
+            ON CONFLICT (name) DO NOTHING;
+        """).format(
+            sql.Identifier(get_dimension_table(dimension)),
+            sql.Identifier(legacy),
+            sql.SQL(", ").join(sql.SQL("(l.{})").format(sql.Identifier(c)) for c in columns),
+        ))
+
+    if _is_partitioned(cur):
+        cur.execute(sql.SQL("SELECT DISTINCT year FROM {};").format(sql.Identifier(legacy)))
+        _create_year_partitions(cur, [year for (year,) in cur.fetchall()])
+
+    cur.execute(sql.SQL("""
+        INSERT INTO {data} (
+            p_id, school_id, program_name_id, comments, date_added, url,
+            status, decision_date, season, year, us_or_international,
+            gpa, gre, gre_v, gre_aw, degree,
+            llm_generated_program_id, llm_generated_university_id
+        )
+        SELECT
+            l.p_id, s.id, pn.id, l.comments, l.date_added, l.url,
+            {status}, l.decision_date, {season}, l.year, {region},
+            l.gpa, l.gre, l.gre_v, l.gre_aw, {degree},
+            lp.id, lu.id
+        FROM {legacy} l
+        LEFT JOIN {schools} s ON s.name = l.school
+        LEFT JOIN {programs} pn ON pn.name = l.program_name
+        LEFT JOIN {programs} lp ON lp.name = l.llm_generated_program
+        LEFT JOIN {schools} lu ON lu.name = l.llm_generated_university
+        ON CONFLICT DO NOTHING;
+    """).format(
+        data=sql.Identifier(get_data_table()),
+        legacy=sql.Identifier(legacy),
+        schools=sql.Identifier(get_dimension_table("schools")),
+        programs=sql.Identifier(get_dimension_table("programs")),
+        status=_enum_cast(sql.SQL("l.status"), "status"),
+        season=_enum_cast(sql.SQL("l.season"), "season"),
+        region=_enum_cast(sql.SQL("l.us_or_international"), "us_or_international"),
+        degree=_enum_cast(sql.SQL("l.degree"), "degree"),
+    ))
+
+    print(f"Migrated {cur.rowcount} rows from {legacy}")
+
+    cur.execute(sql.SQL("DROP TABLE {};").format(sql.Identifier(legacy)))
+
+
+def get_stats_table() -> str:
+    """Get name of the table holding row count and latest ID of the data table.
+
+    :returns: Table name derived from get_table().
+    :rtype: str
+    """
+    return f"{get_table()}_stats"
+
+
+def get_slow_query_table() -> str:
+    """Get name of the diagnostics table holding captured slow statements.
+
+    :returns: Table name derived from get_table().
+    :rtype: str
+    """
+    return f"{get_table()}_slow_queries"
+
+
+def _create_stats(cur) -> None:
+    """Create the stats table and the triggers that keep it current.
+
+    Statement-level triggers read the changed rows from transition tables, so a bulk write
+    updates the single stats row once rather than once per row. The row is filled with
+    exact values the first time, covering rows written before the triggers existed.
+
+    :param cur: Database cursor.
+    """
+    cur.execute(sql.SQL("""
+        CREATE TABLE IF NOT EXISTS {stats} (
+            singleton BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (singleton),
+            row_count BIGINT NOT NULL,
+            max_p_id INTEGER,
+            last_modified TIMESTAMPTZ NOT NULL DEFAULT now()
+        );
+
+        INSERT INTO {stats} (row_count, max_p_id)
+        SELECT COUNT(*), MAX(p_id) FROM {data}
+        ON CONFLICT DO NOTHING;
+
+        CREATE OR REPLACE FUNCTION {function}() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                IF NOT EXISTS (SELECT 1 FROM new_rows) THEN
+                    RETURN NULL;
+                END IF;
+
+                UPDATE {stats} s SET
+                    row_count = s.row_count + n.row_count,
+                    max_p_id = GREATEST(s.max_p_id, n.max_p_id),
+                    last_modified = now()
+                FROM (SELECT COUNT(*) AS row_count, MAX(p_id) AS max_p_id FROM new_rows) n;
+            ELSIF TG_OP = 'UPDATE' THEN
+                IF NOT EXISTS (SELECT 1 FROM new_rows) THEN
+                    RETURN NULL;
+                END IF;
+
+                UPDATE {stats} SET
+                    max_p_id = (SELECT MAX(p_id) FROM {data}),
+                    last_modified = now();
+            ELSIF TG_OP = 'DELETE' THEN
+                IF NOT EXISTS (SELECT 1 FROM old_rows) THEN
+                    RETURN NULL;
+                END IF;
+
+                UPDATE {stats} SET
+                    row_count = row_count - (SELECT COUNT(*) FROM old_rows),
+                    max_p_id = (SELECT MAX(p_id) FROM {data}),
+                    last_modified = now();
+            ELSE
+                UPDATE {stats} SET row_count = 0, max_p_id = NULL, last_modified = now();
+            END IF;
+
+            RETURN NULL;
+        END;
+        $$;
+    """).format(
+        stats=sql.Identifier(get_stats_table()),
+        data=sql.Identifier(get_data_table()),
+        function=sql.Identifier(f"{get_stats_table()}_track"),
+    ))
+
+    for event, referencing in (
+        ("INSERT", "REFERENCING NEW TABLE AS new_rows"),
+        ("UPDATE", "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+        ("DELETE", "REFERENCING OLD TABLE AS old_rows"),
+        ("TRUNCATE", ""),
+    ):
+        cur.execute(sql.SQL("""
+            CREATE OR REPLACE TRIGGER {trigger}
+            AFTER {event} ON {data} {referencing}
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}();
+        """).format(
+            trigger=sql.Identifier(f"{get_stats_table()}_{event.lower()}"),
+            event=sql.SQL(event),
+            data=sql.Identifier(get_data_table()),
+            referencing=sql.SQL(referencing),
+            function=sql.Identifier(f"{get_stats_table()}_track"),
+        ))
+
+
+def get_stats(primary: bool = False) -> dict | None:
+    """Read the trigger-maintained stats of the data table.
+
+    :param primary: Read from the primary even if a read replica is in use.
+    :type primary: bool
+    :returns: ``row_count``, ``max_p_id`` and ``last_modified``, or None if init_tables()
+        hasn't filled the stats table.
+    :rtype: dict | None
+    :raises psycopg.Error: If the query fails.
+    """
+    with postgres_manager.read_connection(primary) as conn:
+        with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:
+            rows = _timed_fetch(cur, sql.SQL(
+                "SELECT row_count, max_p_id, last_modified FROM {};"
+            ).format(
+                sql.Identifier(get_stats_table())
+            ), label="get_stats")
+
+            return rows[0] if rows else None
+
+
+async def get_stats_async(primary: bool = False) -> dict | None:
+    """Async counterpart of get_stats().
+
+    :param primary: Read from the primary even if a read replica is in use.
+    :type primary: bool
+    :returns: ``row_count``, ``max_p_id`` and ``last_modified``, or None if init_tables()
+        hasn't filled the stats table.
+    :rtype: dict | None
+    :raises psycopg.Error: If the query fails.
+    """
+    async with postgres_manager.async_read_connection(primary) as conn:
+        async with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:
+            rows = await _timed_fetch_async(cur, sql.SQL(
+                "SELECT row_count, max_p_id, last_modified FROM {};"
+            ).format(
+                sql.Identifier(get_stats_table())
+            ), label="get_stats")
+
+            return rows[0] if rows else None
+
+
+def refresh_stats() -> None:
+    """Recompute the stats row from the data table.
+
+    Needed after changes the triggers can't see, such as detaching a partition or
+    writing to a partition directly.
+
+    :raises psycopg.Error: If the update fails.
+    """
+    with postgres_manager.connection() as conn:
+        conn.execute(sql.SQL("""
+            UPDATE {stats} s SET
+                row_count = d.row_count,
+                max_p_id = d.max_p_id,
+                last_modified = now()
+            FROM (SELECT COUNT(*) AS row_count, MAX(p_id) AS max_p_id FROM {data}) d;
+        """).format(
+            stats=sql.Identifier(get_stats_table()),
+            data=sql.Identifier(get_data_table()),
+        ))
+
+
+def analyze_tables(cur) -> None:
+    """Refresh planner statistics of the data and dimension tables, e.g. after a bulk load.
+
+    :param cur: Database cursor; ANALYZE runs inside its transaction and sees its rows.
+    :raises psycopg.Error: If ANALYZE fails.
+    """
+    tables = [get_data_table(), *(get_dimension_table(d) for d in DIMENSIONS)]
+
+    cur.execute(sql.SQL("ANALYZE {};").format(sql.SQL(", ").join(map(sql.Identifier, tables))))
+
+
 def init_tables() -> None:
-    """Create admissions table if it doesn't exist.
+    """Create admissions tables and view if they don't exist.
+
+    School and program names live in dimension tables and are referenced by integer keys
+    from get_data_table(). The get_table() view joins them back so readers keep the
+    original column names. A plain table left under the get_table() name by an older
+    version is migrated into the new layout.
+
+    With DB_PARTITION_BY_YEAR set, a new data table is list-partitioned by year so that
+    queries for a few years only scan those partitions; see ensure_year_partitions() and
+    detach_year_partition().
     
     :raises psycopg.Error: If table creation fails.
     """
-    conn = postgres_manager.get_connection()
+    # Migrating a legacy table may take longer than the pool's statement timeout
+    with postgres_manager.connection(timeout=0) as conn:
+        with conn.cursor() as cur:
+            # Serialize concurrent initialization of the same tables
+            cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s));", [get_table()])
+
+            legacy = _detach_legacy_table(cur)
+
+            _create_enum_types(cur)
+
+            for dimension in DIMENSIONS:
+                cur.execute(sql.SQL("""
+                    CREATE TABLE IF NOT EXISTS {} (
+                        id SERIAL PRIMARY KEY,
+                        name TEXT NOT NULL UNIQUE
+                    );
+                """).format(
+                    sql.Identifier(get_dimension_table(dimension))
+                ))
+
+            _enable_trigram(cur)
+
+            # Kept by drop_tables(), so cleaning results outlive reloads of the data
+            clean.create_cache_table(cur)
+
+            # Recreated below rather than replaced so column types are free to change
+            cur.execute(sql.SQL("DROP VIEW IF EXISTS {};").format(sql.Identifier(get_table())))
+
+            partitioned = use_year_partitions()
+
+            # A partitioned table's unique keys must include the partition key, and year
+            # may be NULL, hence UNIQUE NULLS NOT DISTINCT instead of a primary key.
+            cur.execute(sql.SQL("""
+                CREATE TABLE IF NOT EXISTS {data} (
+                    p_id INTEGER {p_id_constraint},
+                    school_id INTEGER REFERENCES {schools},
+                    program_name_id INTEGER REFERENCES {programs},
+                    comments TEXT,
+                    date_added DATE,
+                    url TEXT,
+                    status admission_status,
+                    decision_date DATE,
+                    season admission_season,
+                    year INTEGER,
+                    us_or_international admission_region,
+                    gpa FLOAT,
+                    gre FLOAT,
+                    gre_v FLOAT,
+                    gre_aw FLOAT,
+                    degree admission_degree,
+                    llm_generated_program_id INTEGER REFERENCES {programs},
+                    llm_generated_university_id INTEGER REFERENCES {schools}{unique}
+                ){partition};
+            """).format(
+                data=sql.Identifier(get_data_table()),
+                schools=sql.Identifier(get_dimension_table("schools")),
+                programs=sql.Identifier(get_dimension_table("programs")),
+                p_id_constraint=sql.SQL("NOT NULL" if partitioned else "PRIMARY KEY"),
+                unique=sql.SQL(", UNIQUE NULLS NOT DISTINCT (p_id, year)" if partitioned else ""),
+                partition=sql.SQL(" PARTITION BY LIST (year)" if partitioned else ""),
+            ))
+
+            if _is_partitioned(cur):
+                # Lets save_many() find rows by ID across partitions
+                cur.execute(sql.SQL("CREATE INDEX IF NOT EXISTS {} ON {} (p_id);").format(
+                    sql.Identifier(f"{get_data_table()}_p_id"),
+                    sql.Identifier(get_data_table()),
+                ))
+            elif partitioned:
+                print(f"Table {get_data_table()} already exists and is not partitioned")
+
+            _convert_enum_columns(cur)
+
+            # program and term are derived in the view now; comments_tsv feeds search()
+            cur.execute(sql.SQL("""
+                ALTER TABLE {data}
+                    DROP COLUMN IF EXISTS program_id,
+                    DROP COLUMN IF EXISTS term,
+                    ADD COLUMN IF NOT EXISTS comments_tsv tsvector
+                        GENERATED ALWAYS AS (to_tsvector({config}, coalesce(comments, ''))) STORED;
+            """).format(
+                data=sql.Identifier(get_data_table()),
+                config=sql.Literal(SEARCH_CONFIG),
+            ))
+
+            _create_stats(cur)
+
+            cur.execute(sql.SQL("""
+                CREATE VIEW {view} AS
+                SELECT
+                    a.p_id,
+                    s.name AS school,
+                    pn.name AS program_name,
+                    s.name || ' ' || pn.name AS program,
+                    a.comments,
+                    a.date_added,
+                    a.url,
+                    a.status,
+                    a.decision_date,
+                    a.season,
+                    a.year,
+                    a.season::text || ' ' || a.year AS term,
+                    a.us_or_international,
+                    a.gpa,
+                    a.gre,
+                    a.gre_v,
+                    a.gre_aw,
+                    a.degree,
+                    lp.name AS llm_generated_program,
+                    lu.name AS llm_generated_university
+                FROM {data} a
+                LEFT JOIN {schools} s ON s.id = a.school_id
+                LEFT JOIN {programs} pn ON pn.id = a.program_name_id
+                LEFT JOIN {programs} lp ON lp.id = a.llm_generated_program_id
+                LEFT JOIN {schools} lu ON lu.id = a.llm_generated_university_id;
+            """).format(
+                view=sql.Identifier(get_table()),
+                data=sql.Identifier(get_data_table()),
+                schools=sql.Identifier(get_dimension_table("schools")),
+                programs=sql.Identifier(get_dimension_table("programs")),
+            ))
+
+            cur.execute(sql.SQL("""
+                CREATE TABLE IF NOT EXISTS {} (
+                    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+                    captured_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                    label TEXT,
+                    query TEXT NOT NULL,
+                    params TEXT,
+                    elapsed_ms DOUBLE PRECISION NOT NULL,
+                    plan TEXT
+                );
+            """).format(sql.Identifier(get_slow_query_table())))
+
+            if legacy:
+                _migrate_legacy_table(cur, legacy)
+
+    _clear_caches()
+
+    sync_indexes()
+
+
+def drop_tables() -> None:
+    """Drop the admissions view and the tables behind it.
+
+    :raises psycopg.Error: If the drop fails.
+    """
+    with postgres_manager.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql.SQL("DROP VIEW IF EXISTS {};").format(sql.Identifier(get_table())))
+            cur.execute(sql.SQL("DROP TABLE IF EXISTS {} CASCADE;").format(
+                sql.SQL(", ").join(
+                    sql.Identifier(name)
+                    for name in [get_data_table(), get_stats_table(), get_slow_query_table()]
+                    + [get_dimension_table(d) for d in DIMENSIONS]
+                )
+            ))
+            cur.execute(sql.SQL("DROP FUNCTION IF EXISTS {};").format(
+                sql.Identifier(f"{get_stats_table()}_track")
+            ))
+
+    _clear_caches()
+
+
+class DimensionCache:
+    """In-process name to surrogate key lookup for one dimension table.
+
+    Known names resolve from memory. Unknown names in a batch are inserted and fetched with
+    one pair of statements, so ingest never pays a round trip per row.
+    """
 
-    with conn.cursor() as cur:
-        cur.execute(sql.SQL("""
-            CREATE TABLE IF NOT EXISTS {} (
-                p_id INTEGER PRIMARY KEY,
-                school TEXT,
-                program_name TEXT,
-                program TEXT,
-                comments TEXT,
-                date_added DATE,
-                url TEXT,
-                status TEXT,
-                decision_date DATE,
-                season TEXT,
-                year INTEGER,
-                term TEXT,
-                us_or_international TEXT,
-                gpa FLOAT,
-                gre FLOAT,
-                gre_v FLOAT,
-                gre_aw FLOAT,
-                degree TEXT,
-                llm_generated_program TEXT,
-                llm_generated_university TEXT
-            );
-        """).format(
-            sql.Identifier(get_table())
+    def __init__(self, table: str):
+        """Create an empty cache.
+
+        :param table: Dimension table name.
+        :type table: str
+        """
+        self.table = table
+        self.ids: dict[str, int] = {}
+
+    def resolve(self, names) -> None:
+        """Load keys for the given names, inserting any the table doesn't have yet.
+
+        Runs on its own connection and commits right away, so cached keys stay valid even
+        if the caller's transaction is rolled back.
+
+        :param names: Iterable of names; None values are ignored.
+        :raises psycopg.Error: If the lookup fails.
+        """
+        missing = sorted({name for name in names if name is not None} - self.ids.keys())
+        if not missing:
+            return
+
+        insert, select = self._queries()
+
+        with postgres_manager.connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(insert, [missing])
+                cur.execute(select, [missing])
+
+                self.ids.update(cur.fetchall())
+
+    async def resolve_async(self, names) -> None:
+        """Async counterpart of resolve(), using the async pool.
+
+        :param names: Iterable of names; None values are ignored.
+        :raises psycopg.Error: If the lookup fails.
+        """
+        missing = sorted({name for name in names if name is not None} - self.ids.keys())
+        if not missing:
+            return
+
+        insert, select = self._queries()
+
+        async with postgres_manager.async_connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(insert, [missing])
+                await cur.execute(select, [missing])
+
+                self.ids.update(await cur.fetchall())
+
+    def _queries(self) -> tuple[sql.Composed, sql.Composed]:
+        """Build the statements that add missing names and read their keys back.
+
+        :returns: INSERT and SELECT statements, each taking the list of names.
+        :rtype: tuple[sql.Composed, sql.Composed]
+        """
+        return (
+            sql.SQL("""
+                INSERT INTO {} (name) SELECT unnest(%s::text[])
+                ON CONFLICT (name) DO NOTHING;
+            """).format(sql.Identifier(self.table)),
+            sql.SQL("SELECT name, id FROM {} WHERE name = ANY(%s);").format(
+                sql.Identifier(self.table)
+            ),
+        )
+
+    def get(self, name: str | None) -> int | None:
+        """Get the key for a resolved name.
+
+        :param name: Name passed to resolve() earlier, or None.
+        :type name: str | None
+        :returns: Surrogate key, or None for a None name.
+        :rtype: int | None
+        """
+        return None if name is None else self.ids[name]
+
+
+_dimension_caches: dict[str, DimensionCache] = {}
+
+
+def get_dimension_cache(dimension: str) -> DimensionCache:
+    """Get the shared lookup cache for a dimension of the current table.
+
+    :param dimension: One of DIMENSIONS.
+    :type dimension: str
+    :returns: Cache for get_dimension_table(dimension).
+    :rtype: DimensionCache
+    """
+    table = get_dimension_table(dimension)
+
+    if table not in _dimension_caches:
+        _dimension_caches[table] = DimensionCache(table)
+
+    return _dimension_caches[table]
+
+
+# Trigram support per data table, looked up once; pg_trgm is optional
+_trigram_available: dict[str, bool] = {}
+
+
+def _enable_trigram(cur) -> bool:
+    """Install pg_trgm if possible and index the dimension names with it.
+
+    Runs in a savepoint, so a server without the extension (or a role that can't create
+    it) leaves the surrounding transaction usable.
+
+    :param cur: Database cursor.
+    :returns: Whether trigram indexes are in place.
+    :rtype: bool
+    """
+    try:
+        with cur.connection.transaction():
+            cur.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+    except psycopg.Error as e:
+        print(f"pg_trgm unavailable, fuzzy lookup falls back to ILIKE: {e}")
+        return False
+
+    for dimension in DIMENSIONS:
+        query = sql.SQL("CREATE INDEX IF NOT EXISTS {} ON {} USING GIN (name gin_trgm_ops);")
+
+        cur.execute(query.format(
+            sql.Identifier(f"{get_dimension_table(dimension)}_name_trgm"),
+            sql.Identifier(get_dimension_table(dimension)),
         ))
 
-        conn.commit()
+    return True
+
+
+def _like_pattern(text: str) -> str:
+    """Escape LIKE wildcards in user input.
+
+    :param text: Raw text.
+    :type text: str
+    :returns: Text matching itself literally in a LIKE pattern.
+    :rtype: str
+    """
+    return re.sub(r"([\\%_])", r"\\\1", text)
+
+
+def fuzzy_lookup(
+    dimension: str, text: str, limit: int = 10, timeout: int | None = None
+) -> list[dict]:
+    """Find school or program names resembling the given text, best first.
+
+    With pg_trgm, names are ranked by word_similarity() and matched either by trigram
+    similarity or by prefix, both served by the trigram GIN index. Without it, names are
+    ranked by the share of the text's words starting a word of the name, so "johns hopkins
+    cs" still finds "Johns Hopkins University"; prefix matches and shorter names break ties.
+
+    :param dimension: One of DIMENSIONS.
+    :type dimension: str
+    :param text: Partial or misspelled name, e.g. "johns hopkins".
+    :type text: str
+    :param limit: Maximum matches to return.
+    :type limit: int
+    :param timeout: statement_timeout in milliseconds, see AdmissionResult.execute_raw().
+    :type timeout: int | None
+    :returns: Matches with ``id``, ``name`` and a ``score`` between 0 and 1.
+    :rtype: list[dict]
+    :raises ValueError: If dimension isn't one of DIMENSIONS.
+    :raises psycopg.Error: If query fails.
+    """
+    if dimension not in DIMENSIONS:
+        raise ValueError(f"Unknown dimension: {dimension}")
+
+    words = text.split()
+    if not words:
+        return []
+
+    table = sql.Identifier(get_dimension_table(dimension))
+    prefix = _like_pattern(" ".join(words)) + "%"
+
+    with postgres_manager.read_connection(timeout=timeout) as conn:
+        with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:
+            if get_data_table() not in _trigram_available:
+                cur.execute("SELECT EXISTS (SELECT FROM pg_extension WHERE extname = 'pg_trgm');")
+                _trigram_available[get_data_table()] = cur.fetchone()["exists"]
+
+            if _trigram_available[get_data_table()]:
+                return _timed_fetch(cur, sql.SQL("""
+                    SELECT id, name, word_similarity(%(text)s, name) AS score
+                    FROM {}
+                    WHERE name ILIKE %(prefix)s OR %(text)s <%% name
+                    ORDER BY score DESC, name
+                    LIMIT %(limit)s;
+                """).format(table), {
+                    "text": " ".join(words),
+                    "prefix": prefix,
+                    "limit": limit,
+                }, "fuzzy_lookup")
+
+            return _timed_fetch(cur, sql.SQL("""
+                SELECT id, name, score
+                FROM (
+                    SELECT id, name, (
+                        SELECT COUNT(*) FROM unnest(%(patterns)s::text[]) AS pattern
+                        WHERE name ~* pattern
+                    )::float / %(words)s AS score
+                    FROM {}
+                ) matches
+                WHERE score > 0
+                ORDER BY score DESC, name ILIKE %(prefix)s DESC, length(name), name
+                LIMIT %(limit)s;
+            """).format(table), {
+                "patterns": [rf"\m{re.escape(word)}" for word in words],
+                "words": len(words),
+                "prefix": prefix,
+                "limit": limit,
+            }, "fuzzy_lookup")
+
+
+def _clear_caches() -> None:
+    """Forget cached dimension keys and trigram support for the current table.
+
+    Called whenever the tables may have been recreated.
+    """
+    for dimension in DIMENSIONS:
+        _dimension_caches.pop(get_dimension_table(dimension), None)
+
+    _trigram_available.pop(get_data_table(), None)
+
+
+# Bump whenever INDEXES changes so init_tables() replaces the previous set.
+INDEX_VERSION = 3
+
+# Secondary indexes chosen from the filters in query_data.answer_questions(). Keys are name
+# suffixes, values are the column list (and optional predicate) for CREATE INDEX.
+INDEXES = {
+    # Fall 2025 counts/averages and the per-year GRE averages
+    "term_status": "(year, season, status) INCLUDE (gpa, gre, us_or_international)",
+    # Accepted GPA averages for one term
+    "accepted_term": "(year, season) INCLUDE (gpa) WHERE status = 'accepted'",
+    # School/program/degree counts (JHU, Georgetown)
+    "university_program": (
+        "(llm_generated_university_id, llm_generated_program_id, degree, year, status)"
+    ),
+    # UCLA vs USC acceptance GPA
+    "status_university": "(status, llm_generated_university_id) INCLUDE (gpa)",
+    # Full-text search over comments
+    "comments_search": "USING GIN (comments_tsv)",
+}
+
+# Suffixes dropped from INDEXES; listed so sync_indexes() still removes their old versions.
+RETIRED_INDEXES: tuple[str, ...] = ()
+
+
+def _index_name(suffix: str) -> str:
+    """Build the versioned name of a managed index.
+
+    :param suffix: Key from INDEXES.
+    :type suffix: str
+    :returns: Index name scoped to the current data table and INDEX_VERSION.
+    :rtype: str
+    """
+    return f"{get_data_table()}_{suffix}_v{INDEX_VERSION}"
+
+
+def _managed_index_pattern() -> re.Pattern:
+    """Match names of indexes created by sync_indexes() for the current data table.
+
+    Only suffixes from INDEXES and RETIRED_INDEXES match, so hand-made indexes that happen
+    to end in a version number are left alone.
+
+    :returns: Compiled pattern.
+    :rtype: re.Pattern
+    """
+    suffixes = "|".join(re.escape(suffix) for suffix in [*INDEXES, *RETIRED_INDEXES])
+
+    return re.compile(rf"^{re.escape(get_data_table())}_(?:{suffixes})_v\d+$")
+
+
+def _drop_managed_indexes(cur) -> None:
+    """Drop every index created by sync_indexes() inside the current transaction.
+
+    :param cur: Database cursor.
+    """
+    cur.execute("SELECT indexname::text FROM pg_indexes WHERE tablename = %s;", [get_data_table()])
+
+    for (name,) in cur.fetchall():
+        if _managed_index_pattern().match(name):
+            cur.execute(sql.SQL("DROP INDEX {};").format(sql.Identifier(name)))
+
+
+def sync_indexes() -> None:
+    """Create the managed index set and drop indexes left over from older versions.
+
+    Indexes are built with CREATE INDEX CONCURRENTLY so writers are never blocked, and an
+    advisory lock keeps two processes from building the same set at once. Invalid indexes
+    left behind by an interrupted concurrent build are dropped and rebuilt.
+
+    Postgres can't build indexes concurrently on a partitioned table, so for one the
+    indexes are built normally; they cascade to partitions created later.
+
+    :raises psycopg.Error: If index creation fails.
+    """
+    table = get_data_table()
+    wanted = {_index_name(suffix): definition for suffix, definition in INDEXES.items()}
+    managed = _managed_index_pattern()
+
+    with postgres_manager.get_connection() as conn:
+        # CONCURRENTLY can't run inside a transaction block
+        conn.autocommit = True
+
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_lock(hashtext(%s));", [table])
+
+            try:
+                concurrently = sql.SQL("" if _is_partitioned(cur) else "CONCURRENTLY")
+
+                cur.execute("""
+                    SELECT i.relname::text, x.indisvalid
+                    FROM pg_index x
+                    JOIN pg_class i ON i.oid = x.indexrelid
+                    WHERE x.indrelid = to_regclass(%s) AND NOT x.indisprimary;
+                """, [table])
+
+                existing = dict(cur.fetchall())
+
+                for name, valid in existing.items():
+                    if managed.match(name) and (name not in wanted or not valid):
+                        print(f"Dropping index {name}")
+                        cur.execute(sql.SQL("DROP INDEX {} IF EXISTS {};").format(
+                            concurrently,
+                            sql.Identifier(name),
+                        ))
+
+                for name, definition in wanted.items():
+                    if existing.get(name):
+                        continue
+
+                    print(f"Creating index {name}")
+                    query = sql.SQL("CREATE INDEX {} IF NOT EXISTS {} ON {} {};")
+
+                    cur.execute(query.format(
+                        concurrently,
+                        sql.Identifier(name),
+                        sql.Identifier(table),
+                        sql.SQL(definition),
+                    ))
+            finally:
+                cur.execute("SELECT pg_advisory_unlock(hashtext(%s));", [table])
 
 
 def _tags_from_soup(tags: set[str]) -> dict[str, any]:
@@ -118,7 +1267,7 @@ def _tags_from_soup(tags: set[str]) -> dict[str, any]:
 
             for season_category in ["fall", "winter", "spring", "summer"]:
                 if season_category.startswith(season):
-                    expanded["season"] = season
+                    expanded["season"] = season_category
                     break
 
             year = term_match.group("year")
@@ -172,7 +1321,395 @@ def _decision_from_soup(decision_str: str, added_on_year: int) -> tuple[str | No
     return status, date
 
 
-@dataclass
+# View columns backing each AdmissionResult field, in field order.
+RESULT_COLUMNS = {
+    "id": "p_id",
+    "school": "school",
+    "program_name": "program_name",
+    "degree_type": "degree",
+    "added_on": "date_added",
+    "decision_status": "status",
+    "decision_date": "decision_date",
+    "season": "season",
+    "year": "year",
+    "applicant_region": "us_or_international",
+    "gre_general": "gre",
+    "gre_verbal": "gre_v",
+    "gre_analytical_writing": "gre_aw",
+    "gpa": "gpa",
+    "comments": "comments",
+    "full_info_url": "url",
+    "llm_generated_program": "llm_generated_program",
+    "llm_generated_university": "llm_generated_university",
+}
+
+# Columns of the get_table() view that iter_where() accepts as filters.
+FILTER_COLUMNS = set(RESULT_COLUMNS.values()) | {"program", "term"}
+
+
+def _known_labels(enum_type: type[Enum], value) -> list[str]:
+    """Keep the values that are labels of an enum.
+
+    :param enum_type: Enum naming the column's labels.
+    :type enum_type: type[Enum]
+    :param value: Enum member or label, or a list, tuple or set of them.
+    :returns: Matching labels; empty when none are valid.
+    :rtype: list[str]
+    """
+    values = value if isinstance(value, (list, tuple, set)) else [value]
+    labels = {member.value for member in enum_type}
+
+    return [
+        label for label in (v.value if isinstance(v, Enum) else v for v in values)
+        if label in labels
+    ]
+
+
+def _where_clause(filters: dict) -> tuple[sql.Composable, list]:
+    """Build a WHERE clause matching every filter.
+
+    Enum columns are compared as enums so their indexes stay usable. Labels are checked
+    here first, since Postgres rejects a label outside the enum; those simply match nothing.
+
+    :param filters: View column name to value. Lists, tuples and sets match any of their
+        values; None matches NULL.
+    :type filters: dict
+    :returns: Tuple of (SQL clause, parameters).
+    :rtype: tuple[sql.Composable, list]
+    :raises ValueError: If a filter names an unknown column.
+    """
+    conditions = []
+    params = []
+
+    for column, value in filters.items():
+        if column not in FILTER_COLUMNS:
+            raise ValueError(f"Cannot filter on unknown column: {column}")
+
+        if column in ENUM_COLUMNS and value is not None:
+            value = _known_labels(ENUM_COLUMNS[column][1], value)
+
+        if value is None:
+            conditions.append(sql.SQL("{} IS NULL").format(sql.Identifier(column)))
+        elif isinstance(value, (list, tuple, set)):
+            conditions.append(sql.SQL("{} = ANY(%s)").format(sql.Identifier(column)))
+            params.append(list(value))
+        else:
+            conditions.append(sql.SQL("{} = %s").format(sql.Identifier(column)))
+            params.append(value)
+
+    if not conditions:
+        return sql.SQL(""), params
+
+    return sql.SQL("WHERE {}").format(sql.SQL(" AND ").join(conditions)), params
+
+
+@dataclass(slots=True)
+class NamedQuery:
+    """A statement registered with register_query() and its execution counters."""
+
+    name: str
+    query: str | sql.Composable
+    calls: int = 0
+    first_runs: int = 0
+    total_time: float = 0.0
+    # Connections the statement has run on. Held weakly, so a connection the pool replaces
+    # drops out, and a new one reusing its backend PID still counts as a first run.
+    connections: weakref.WeakSet = dataclasses.field(default_factory=weakref.WeakSet)
+
+
+# Statements run through AdmissionResult.execute_named(), by name
+_named_queries: dict[str, NamedQuery] = {}
+_named_queries_lock = threading.Lock()
+
+
+def register_query(name: str, query: str | sql.Composable) -> None:
+    """Register a statement to run by name with AdmissionResult.execute_named().
+
+    Registering a name again with different text replaces the statement, keeping its
+    counters; each connection prepares the new text on its next run.
+
+    :param name: Name to run the statement by.
+    :type name: str
+    :param query: SQL with ``%s`` placeholders.
+    :type query: str | sql.Composable
+    """
+    with _named_queries_lock:
+        named = _named_queries.get(name)
+
+        if named is None:
+            _named_queries[name] = NamedQuery(name, query)
+        elif named.query != query:
+            named.query = query
+            named.connections.clear()
+
+
+def _named_query(name: str) -> NamedQuery:
+    """Look up a registered statement.
+
+    :param name: Name given to register_query().
+    :type name: str
+    :returns: The statement.
+    :rtype: NamedQuery
+    :raises ValueError: If no statement has that name.
+    """
+    try:
+        return _named_queries[name]
+    except KeyError:
+        raise ValueError(f"Unknown query: {name}") from None
+
+
+def _record_named_call(named: NamedQuery, conn, elapsed: float) -> None:
+    """Count one run of a registered statement.
+
+    :param named: The statement.
+    :type named: NamedQuery
+    :param conn: Connection it ran on.
+    :param elapsed: Seconds taken.
+    :type elapsed: float
+    """
+    with _named_queries_lock:
+        named.calls += 1
+        named.total_time += elapsed
+
+        if conn not in named.connections:
+            named.connections.add(conn)
+            named.first_runs += 1
+
+
+def query_stats() -> list[dict]:
+    """Report how often each registered statement ran and how long it took.
+
+    ``first_runs`` and ``repeat_runs`` are client-side estimates of parse work saved:
+    a repeat run executed a statement psycopg had already prepared on that connection,
+    unless psycopg evicted it from its per-connection cache in the meantime. They say
+    nothing about planning; the server uses custom plans for the first five executions of
+    a prepared statement and may never switch to a generic one. For the server's own
+    counts, read ``generic_plans`` and ``custom_plans`` from ``pg_prepared_statements``
+    (PostgreSQL 14+) on a connection.
+
+    :returns: One row per statement with ``name``, ``calls``, ``first_runs`` (runs on a
+        connection it hadn't run on before), ``repeat_runs``, ``total_ms`` and ``mean_ms``,
+        most expensive first.
+    :rtype: list[dict]
+    """
+    with _named_queries_lock:
+        stats = [
+            {
+                "name": named.name,
+                "calls": named.calls,
+                "first_runs": named.first_runs,
+                "repeat_runs": named.calls - named.first_runs,
+                "total_ms": named.total_time * 1000,
+                "mean_ms": named.total_time * 1000 / named.calls if named.calls else 0.0,
+            }
+            for named in _named_queries.values()
+        ]
+
+    return sorted(stats, key=lambda row: row["total_ms"], reverse=True)
+
+
+def reset_query_stats() -> None:
+    """Zero the counters of every registered statement."""
+    with _named_queries_lock:
+        for named in _named_queries.values():
+            named.calls = named.first_runs = 0
+            named.total_time = 0.0
+            named.connections.clear()
+
+
+def _query_text(query, conn) -> str:
+    """Render a statement for logs, on one line.
+
+    :param query: SQL string or composed statement.
+    :param conn: Connection the statement ran on, for quoting composed parts.
+    :returns: Statement text with whitespace collapsed.
+    :rtype: str
+    """
+    text = query if isinstance(query, str) else query.as_string(conn)
+
+    return " ".join(text.split())
+
+
+def _explain_query(query, text: str):
+    """Build the EXPLAIN (ANALYZE, BUFFERS) of a read statement.
+
+    ANALYZE runs the statement again, so nothing is explained unless it only reads.
+
+    :param query: SQL string or composed statement.
+    :param text: The statement as rendered by _query_text().
+    :type text: str
+    :returns: The EXPLAIN statement, of the same kind as query, or None if the statement
+        may write.
+    :rtype: str | sql.Composed | None
+    """
+    if not re.match(r"(SELECT|WITH)\b", text, re.IGNORECASE) or re.search(
+        r"\b(INSERT|UPDATE|DELETE|MERGE)\b", text, re.IGNORECASE
+    ):
+        return None
+
+    if isinstance(query, str):
+        return "EXPLAIN (ANALYZE, BUFFERS) " + query
+
+    return sql.SQL("EXPLAIN (ANALYZE, BUFFERS) ") + query
+
+
+def _slow_query_insert(label, text, params, elapsed, plan) -> tuple[sql.Composed, list]:
+    """Build the statement recording a slow statement in get_slow_query_table().
+
+    :returns: Query and parameters.
+    :rtype: tuple[sql.Composed, list]
+    """
+    query = sql.SQL(
+        "INSERT INTO {} (label, query, params, elapsed_ms, plan) VALUES (%s, %s, %s, %s, %s);"
+    ).format(sql.Identifier(get_slow_query_table()))
+
+    return query, [label, text, repr(params), elapsed * 1000, plan]
+
+
+# Records slow statements and their plans off the request path, one at a time
+_capture_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-capture")
+
+
+def _capture_slow_query(label, query, text, params, elapsed) -> None:
+    """Record a slow statement in get_slow_query_table(), with its plan if it only reads.
+
+    Runs on _capture_executor with pooled connections, so the statement timeouts apply.
+    The plan comes from read_connection(), which is where model reads normally run.
+    Failures are printed, never raised.
+
+    :param label: Name to group the statement by in slow_query_report().
+    :type label: str | None
+    :param query: SQL string or composed statement.
+    :param text: The statement as rendered by _query_text().
+    :type text: str
+    :param params: Query parameters.
+    :param elapsed: Seconds the statement took.
+    :type elapsed: float
+    """
+    try:
+        plan = None
+
+        if (explain := _explain_query(query, text)) is not None:
+            with postgres_manager.read_connection() as conn:
+                with conn.cursor(row_factory=psycopg.rows.tuple_row) as cur:
+                    plan = "\n".join(row[0] for row in cur.execute(explain, params))
+
+        with postgres_manager.connection() as conn:
+            conn.execute(*_slow_query_insert(label, text, params, elapsed, plan))
+    except psycopg.Error as e:
+        print(f"Could not capture slow query: {e}")
+
+
+def flush_slow_queries() -> None:
+    """Wait until the slow statements logged so far are recorded."""
+    _capture_executor.submit(lambda: None).result()
+
+
+def _log_slow_query(cur, query, params, label: str | None, elapsed: float) -> None:
+    """Print a statement that took SLOW_QUERY_MS or longer and queue its capture.
+
+    :param cur: Cursor the statement ran on, sync or async.
+    :param query: SQL string or composed statement.
+    :param params: Query parameters.
+    :param label: Name to group the statement by in slow_query_report().
+    :type label: str | None
+    :param elapsed: Seconds taken.
+    :type elapsed: float
+    """
+    if elapsed * 1000 < SLOW_QUERY_MS:
+        return
+
+    text = _query_text(query, cur.connection)
+    name = f" {label}" if label else ""
+    print(f"Slow query{name} ({elapsed * 1000:.1f} ms): {text} params={params!r}")
+
+    if capture_slow_queries():
+        _capture_executor.submit(_capture_slow_query, label, query, text, params, elapsed)
+
+
+def _timed_fetch(cur, query, params=None, label: str | None = None, **kwargs) -> list:
+    """Run a read statement on the cursor, timing it and logging it if slow.
+
+    Statements taking SLOW_QUERY_MS or longer are printed with their parameters. With
+    capture_slow_queries(), they are also recorded in get_slow_query_table() together with
+    their EXPLAIN (ANALYZE, BUFFERS) output. That happens on a background thread, so it
+    adds no latency to the caller, but EXPLAIN ANALYZE runs the statement a second time
+    and so doubles its load on the server. Call flush_slow_queries() to wait for it.
+
+    :param cur: Database cursor.
+    :param query: SQL string or composed statement.
+    :param params: Query parameters.
+    :param label: Name to group the statement by in slow_query_report(), e.g. the method
+        or registered query name.
+    :type label: str | None
+    :param kwargs: Passed to cursor.execute(), e.g. ``prepare``.
+    :returns: All result rows.
+    :rtype: list
+    :raises psycopg.Error: If the statement fails.
+    """
+    started = time.perf_counter()
+    rows = cur.execute(query, params, **kwargs).fetchall()
+    _log_slow_query(cur, query, params, label, time.perf_counter() - started)
+
+    return rows
+
+
+async def _timed_fetch_async(
+    cur, query, params=None, label: str | None = None, **kwargs
+) -> list:
+    """Async counterpart of _timed_fetch().
+
+    :param cur: Async database cursor.
+    :param query: SQL string or composed statement.
+    :param params: Query parameters.
+    :param label: Name to group the statement by in slow_query_report().
+    :type label: str | None
+    :param kwargs: Passed to cursor.execute(), e.g. ``prepare``.
+    :returns: All result rows.
+    :rtype: list
+    :raises psycopg.Error: If the statement fails.
+    """
+    started = time.perf_counter()
+    await cur.execute(query, params, **kwargs)
+    rows = await cur.fetchall()
+    _log_slow_query(cur, query, params, label, time.perf_counter() - started)
+
+    return rows
+
+
+def slow_query_report(limit: int = 10) -> list[dict]:
+    """Summarize the statements captured in get_slow_query_table(), worst first.
+
+    :param limit: Maximum statements to report.
+    :type limit: int
+    :returns: One row per label and statement with ``label``, ``query``, ``calls``,
+        ``total_ms``, ``mean_ms``, ``max_ms``, ``last_seen`` and the latest ``plan``,
+        ordered by total time.
+    :rtype: list[dict]
+    :raises psycopg.Error: If the query fails.
+    """
+    flush_slow_queries()
+
+    with postgres_manager.connection() as conn:
+        with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:
+            return cur.execute(sql.SQL("""
+                SELECT
+                    label,
+                    query,
+                    COUNT(*) AS calls,
+                    SUM(elapsed_ms) AS total_ms,
+                    AVG(elapsed_ms) AS mean_ms,
+                    MAX(elapsed_ms) AS max_ms,
+                    MAX(captured_at) AS last_seen,
+                    (array_agg(plan ORDER BY id DESC) FILTER (WHERE plan IS NOT NULL))[1] AS plan
+                FROM {}
+                GROUP BY label, query
+                ORDER BY total_ms DESC
+                LIMIT %s;
+            """).format(sql.Identifier(get_slow_query_table())), [limit]).fetchall()
+
+
+@dataclass(slots=True)
 class AdmissionResult:
     """Admission result data model with application details and test scores."""
 
@@ -196,56 +1733,336 @@ class AdmissionResult:
     llm_generated_university: str | None
 
     @classmethod
-    def count(cls) -> int:
+    def count(cls, exact: bool = False) -> int:
         """Count admission results in database.
+
+        Reads the trigger-maintained row count from get_stats_table() unless an exact
+        count is requested or the stats row is missing.
         
+        :param exact: Count the data table with COUNT(*) instead.
+        :type exact: bool
         :returns: Total record count.
         :rtype: int
         :raises psycopg.Error: If query fails.
         """
-        with postgres_manager.get_connection().cursor() as cur:
+        if not exact and (stats := get_stats()) is not None:
+            return stats["row_count"]
+
+        with postgres_manager.read_connection() as conn:
             query = sql.SQL("SELECT COUNT(*) FROM {};").format(
-                sql.Identifier(get_table())
+                sql.Identifier(get_data_table())
             )
 
-            cur.execute(query)
+            with conn.cursor() as cur:
+                return _timed_fetch(cur, query, label="count")[0][0]
 
-            return cur.fetchone()[0]  # type: ignore
+    @classmethod
+    async def count_async(cls, exact: bool = False) -> int:
+        """Async counterpart of count().
+
+        :param exact: Count the data table with COUNT(*) instead.
+        :type exact: bool
+        :returns: Total record count.
+        :rtype: int
+        :raises psycopg.Error: If query fails.
+        """
+        if not exact and (stats := await get_stats_async()) is not None:
+            return stats["row_count"]
+
+        rows = await cls.execute_raw_async(
+            sql.SQL("SELECT COUNT(*) AS count FROM {};").format(sql.Identifier(get_data_table())),
+            [],
+        )
 
+        return rows[0]["count"]
 
     @classmethod
-    def execute_raw(cls, query: str, params: list) -> list[dict]:
+    def execute_raw(
+        cls, query: str, params: list, primary: bool = False, timeout: int | None = None
+    ) -> list[dict]:
         """Execute raw SQL query.
+
+        Runs on the read replica if one is configured, see postgres_manager.read_connection(),
+        so the query must not write.
         
         :param query: SQL query string.
         :type query: str
         :param params: Query parameters.
         :type params: list
+        :param primary: Run on the primary even if a read replica is in use.
+        :type primary: bool
+        :param timeout: statement_timeout in milliseconds, 0 for none; None to keep the
+            pool's, see postgres_manager.STATEMENT_TIMEOUT_MS.
+        :type timeout: int | None
+        :returns: Query results as dictionaries.
+        :rtype: list[dict]
+        :raises psycopg.errors.QueryCanceled: If the query times out or is canceled.
+        :raises psycopg.Error: If query fails.
+        """
+        with postgres_manager.read_connection(primary, timeout) as conn:
+            with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:
+                return _timed_fetch(cur, query, params, "execute_raw")
+
+    @classmethod
+    def execute_named(cls, name: str, params: list, timeout: int | None = None) -> list[dict]:
+        """Run a statement registered with register_query().
+
+        The statement is prepared the first time it runs on each pooled connection; later
+        runs on that connection only send its name and parameters, skipping the parse.
+        See query_stats() for the counters.
+
+        :param name: Name given to register_query().
+        :type name: str
+        :param params: Query parameters.
+        :type params: list
+        :param timeout: statement_timeout in milliseconds, 0 for none; None to keep the
+            pool's, see postgres_manager.STATEMENT_TIMEOUT_MS.
+        :type timeout: int | None
+        :returns: Query results as dictionaries.
+        :rtype: list[dict]
+        :raises ValueError: If no statement has that name.
+        :raises psycopg.errors.QueryCanceled: If the query times out or is canceled.
+        :raises psycopg.Error: If query fails.
+        """
+        named = _named_query(name)
+
+        with postgres_manager.read_connection(timeout=timeout) as conn:
+            started = time.perf_counter()
+
+            with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:
+                rows = _timed_fetch(cur, named.query, params, name, prepare=True)
+
+            _record_named_call(named, conn, time.perf_counter() - started)
+
+        return rows
+
+    @classmethod
+    async def execute_named_async(
+        cls, name: str, params: list, timeout: int | None = None
+    ) -> list[dict]:
+        """Async counterpart of execute_named(), using the async pool.
+
+        :param name: Name given to register_query().
+        :type name: str
+        :param params: Query parameters.
+        :type params: list
+        :param timeout: statement_timeout in milliseconds, 0 for none; None to keep the
+            pool's, see postgres_manager.STATEMENT_TIMEOUT_MS.
+        :type timeout: int | None
+        :returns: Query results as dictionaries.
+        :rtype: list[dict]
+        :raises ValueError: If no statement has that name.
+        :raises psycopg.errors.QueryCanceled: If the query times out or is canceled.
+        :raises psycopg.Error: If query fails.
+        """
+        named = _named_query(name)
+
+        async with postgres_manager.async_read_connection(timeout=timeout) as conn:
+            started = time.perf_counter()
+
+            async with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:
+                rows = await _timed_fetch_async(cur, named.query, params, name, prepare=True)
+
+            _record_named_call(named, conn, time.perf_counter() - started)
+
+        return rows
+
+    @classmethod
+    async def execute_raw_async(
+        cls, query: str, params: list, primary: bool = False, timeout: int | None = None
+    ) -> list[dict]:
+        """Async counterpart of execute_raw(), using the async pool.
+
+        Independent calls can be awaited together, e.g. with asyncio.gather(), and run on
+        separate pooled connections at the same time.
+
+        :param query: SQL query string.
+        :type query: str
+        :param params: Query parameters.
+        :type params: list
+        :param primary: Run on the primary even if a read replica is in use.
+        :type primary: bool
+        :param timeout: statement_timeout in milliseconds, 0 for none; None to keep the
+            pool's, see postgres_manager.STATEMENT_TIMEOUT_MS.
+        :type timeout: int | None
         :returns: Query results as dictionaries.
         :rtype: list[dict]
+        :raises psycopg.errors.QueryCanceled: If the query times out or is canceled.
         :raises psycopg.Error: If query fails.
         """
-        with postgres_manager.get_connection().cursor(row_factory=psycopg.rows.dict_row) as cur:
-            return cur.execute(query, params).fetchall()
+        async with postgres_manager.async_read_connection(primary, timeout) as conn:
+            async with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:
+                return await _timed_fetch_async(cur, query, params, "execute_raw")
 
     @classmethod
-    def get_latest_id(cls) -> int | None:
+    def get_latest_id(cls, exact: bool = False) -> int | None:
         """Get highest admission ID from database.
+
+        Reads the trigger-maintained ID from get_stats_table() unless an exact lookup is
+        requested or the stats row is missing. Always reads from the primary, since
+        refreshes scrape from this ID onwards.
         
+        :param exact: Query MAX(p_id) on the data table instead.
+        :type exact: bool
         :returns: Highest ID or None.
         :rtype: int | None
         :raises psycopg.Error: If query fails.
         """
-        with postgres_manager.get_connection().cursor() as cur:
+        if not exact and (stats := get_stats(primary=True)) is not None:
+            return stats["max_p_id"]
+
+        with postgres_manager.connection() as conn:
             query = sql.SQL("SELECT MAX(p_id) FROM {};").format(
-                sql.Identifier(get_table()),
+                sql.Identifier(get_data_table()),
+            )
+
+            with conn.cursor() as cur:
+                return _timed_fetch(cur, query, label="get_latest_id")[0][0]
+
+    @classmethod
+    async def get_latest_id_async(cls, exact: bool = False) -> int | None:
+        """Async counterpart of get_latest_id().
+
+        :param exact: Query MAX(p_id) on the data table instead.
+        :type exact: bool
+        :returns: Highest ID or None.
+        :rtype: int | None
+        :raises psycopg.Error: If query fails.
+        """
+        if not exact and (stats := await get_stats_async(primary=True)) is not None:
+            return stats["max_p_id"]
+
+        rows = await cls.execute_raw_async(
+            sql.SQL("SELECT MAX(p_id) AS max_p_id FROM {};").format(
+                sql.Identifier(get_data_table())
+            ),
+            [],
+            primary=True,
+        )
+
+        return rows[0]["max_p_id"]
+
+    @classmethod
+    def iter_where(
+        cls,
+        filters: dict | None = None,
+        batch_size: int = 1000,
+        as_tuples: bool = False,
+    ) -> Iterator['AdmissionResult | tuple']:
+        """Stream admission results matching the filters, in ID order.
+
+        Rows come from a named server-side cursor and are fetched batch_size at a time, so
+        memory stays flat no matter how many rows match. The cursor lives on a dedicated
+        connection rather than a pooled one, so iterators left half-consumed can't drain
+        the pool; that connection stays open until the iterator is exhausted or closed.
+        Call ``close()`` on the iterator (or wrap it in ``contextlib.closing()``) when
+        stopping early instead of waiting for garbage collection.
+
+        :param filters: View column name to value, see FILTER_COLUMNS. Lists, tuples and
+            sets match any of their values; None matches NULL.
+        :type filters: dict | None
+        :param batch_size: Rows fetched from the server per round trip.
+        :type batch_size: int
+        :param as_tuples: Yield plain tuples in AdmissionResult field order instead of
+            AdmissionResult instances.
+        :type as_tuples: bool
+        :returns: Iterator over matching results.
+        :rtype: Iterator[AdmissionResult | tuple]
+        :raises ValueError: If a filter names an unknown column.
+        :raises psycopg.Error: If query fails.
+        """
+        where, params = _where_clause(filters or {})
+
+        query = sql.SQL("SELECT {} FROM {} {} ORDER BY p_id;").format(
+            sql.SQL(", ").join(map(sql.Identifier, RESULT_COLUMNS.values())),
+            sql.Identifier(get_table()),
+            where,
+        )
+
+        with postgres_manager.get_connection(read=True) as conn:
+            with conn.cursor(name="admission_results_iter") as cur:
+                cur.itersize = batch_size
+                cur.execute(query, params)
+
+                for row in cur:
+                    yield row if as_tuples else cls(*row)
+
+    @classmethod
+    def search(
+        cls,
+        text: str,
+        limit: int = 20,
+        after: tuple[float, int] | None = None,
+        timeout: int | None = None,
+    ) -> list[dict]:
+        """Search applicant comments, best matches first.
+
+        ``text`` uses web search syntax: quoted phrases, ``or`` and ``-excluded`` words.
+        Matches are found through the GIN index on comments_tsv and ranked with
+        ts_rank_cd(); highlights are only built for the rows on the returned page. Pages
+        are keyed on (rank, p_id), so pass the ``rank`` and ``p_id`` of the last row as
+        ``after`` to get the next page.
+
+        :param text: Search terms.
+        :type text: str
+        :param limit: Maximum rows to return.
+        :type limit: int
+        :param after: (rank, p_id) of the last row of the previous page.
+        :type after: tuple[float, int] | None
+        :param timeout: statement_timeout in milliseconds, see execute_raw().
+        :type timeout: int | None
+        :returns: Rows with p_id, school, program, degree, status, term, url, rank and
+            headline; headline is HTML-escaped comment text with matched words wrapped in
+            ``<b>`` tags, safe to insert into a page.
+        :rtype: list[dict]
+        :raises psycopg.Error: If query fails.
+        """
+        # Compared as real, the type ts_rank_cd() returns, so the boundary row is excluded
+        keyset = sql.SQL(
+            "AND (ts_rank_cd(a.comments_tsv, q.query), a.p_id) < (%s::real, %s)"
+            if after else ""
+        )
+
+        query = sql.SQL("""
+            WITH q AS (SELECT websearch_to_tsquery({config}, %s) AS query),
+            page AS (
+                SELECT a.p_id, ts_rank_cd(a.comments_tsv, q.query) AS rank
+                FROM {data} a, q
+                WHERE a.comments_tsv @@ q.query {keyset}
+                ORDER BY rank DESC, a.p_id DESC
+                LIMIT %s
             )
+            SELECT
+                v.p_id, v.school, v.program, v.degree, v.status, v.term, v.url, page.rank,
+                ts_headline({config}, {comments}, q.query, {options}) AS headline
+            FROM page
+            JOIN {view} v ON v.p_id = page.p_id
+            CROSS JOIN q
+            ORDER BY page.rank DESC, page.p_id DESC;
+        """).format(
+            config=sql.Literal(SEARCH_CONFIG),
+            data=sql.Identifier(get_data_table()),
+            view=sql.Identifier(get_table()),
+            keyset=keyset,
+            # Comments are user-submitted, so only the highlight tags may become markup. Their
+            # &, < and > are swapped for placeholders rather than escaped, which would let
+            # searches for "amp" or "lt" match inside the entities, and tags in the text
+            # survive since ts_headline() drops what its parser reads as tags
+            comments=sql.SQL(
+                "translate(translate(v.comments, {markup}, ''), '&<>', {escapes})"
+            ).format(
+                markup=sql.Literal("".join(HEADLINE_MARKUP)),
+                escapes=sql.Literal("\x04\x05\x06"),
+            ),
+            options=sql.Literal("StartSel=\x02, StopSel=\x03"),
+        )
 
-            cur.execute(query)
+        rows = cls.execute_raw(query, [text, *(after or ()), limit], timeout=timeout)
 
-            result = cur.fetchone()
+        for row in rows:
+            row["headline"] = (row["headline"] or "").translate(_HEADLINE_TABLE)
 
-            return result[0] if result else None
+        return rows
 
 
     @classmethod
@@ -347,26 +2164,203 @@ class AdmissionResult:
         return AdmissionResult(**values)
 
 
-    def save_to_db(self, cursor) -> None:
-        """Save admission result to database using UPSERT.
+    @classmethod
+    def save_many(cls, cursor, results, staging: bool = False) -> None:
+        """Save admission results to database in one batch using UPSERT.
+
+        School and program names are resolved to dimension keys for the whole batch up
+        front. The batch columns are then sent as arrays and expanded server-side with
+        unnest(), so the whole batch is a single statement. If an id appears more than
+        once, the last row wins. On a year-partitioned data table, partitions for new years
+        are created first, and rows whose year changed are removed from their old partition.
+
+        With staging, the rows are first written to a temporary table, which is never
+        WAL-logged, and merged into the data table from there. This is meant for large
+        loads, together with postgres_manager.bulk_load().
 
         :param cursor: Database cursor.
+        :param results: Admission results to save.
+        :type results: AdmissionBatch | list[AdmissionResult]
+        :param staging: Merge through a temporary staging table.
+        :type staging: bool
+        :raises psycopg.Error: If database operation fails.
+        """
+        batch = _as_batch(results)
+
+        for cache, names in _dimension_names(batch):
+            cache.resolve(names)
+
+        partitioned = _is_partitioned(cursor)
+
+        if partitioned:
+            ensure_year_partitions(cursor, batch.values("year"))
+
+        for query, params in cls._upsert_statements(batch, partitioned, staging):
+            cursor.execute(query, params)
+
+        postgres_manager.note_write()
+
+    @classmethod
+    async def save_many_async(cls, cursor, results) -> None:
+        """Async counterpart of save_many().
+
+        Dimension names are resolved over the async pool; missing year partitions are
+        created on the given cursor, as in save_many().
+
+        :param cursor: Async database cursor.
+        :type cursor: psycopg.AsyncCursor
+        :param results: Admission results to save.
+        :type results: AdmissionBatch | list[AdmissionResult]
         :raises psycopg.Error: If database operation fails.
         """
-        cursor.execute(sql.SQL("""
-            INSERT INTO {} (
-                p_id, school, program_name, program, comments, date_added, url,
-                status, decision_date, season, year, term, us_or_international,
+        batch = _as_batch(results)
+
+        for cache, names in _dimension_names(batch):
+            await cache.resolve_async(names)
+
+        partitioned = await _is_partitioned_async(cursor)
+
+        if partitioned:
+            await ensure_year_partitions_async(cursor, batch.values("year"))
+
+        for query, params in cls._upsert_statements(batch, partitioned):
+            await cursor.execute(query, params)
+
+        postgres_manager.note_write()
+
+    @classmethod
+    def _upsert_statements(
+        cls,
+        batch: 'AdmissionBatch',
+        partitioned: bool,
+        staging: bool = False,
+    ) -> list[tuple]:
+        """Build the statements that write a batch whose dimension names are resolved.
+
+        :param batch: Results to save.
+        :type batch: AdmissionBatch
+        :param partitioned: Whether the data table is partitioned by year.
+        :type partitioned: bool
+        :param staging: Load the rows into a temporary table before merging them.
+        :type staging: bool
+        :returns: (query, params) pairs to execute in order.
+        :rtype: list[tuple]
+        """
+        columns = batch.columns
+
+        schools = get_dimension_cache("schools")
+        programs = get_dimension_cache("programs")
+
+        def enum_column(column: str, field: str) -> list:
+            enum_type = ENUM_COLUMNS[column][1]
+            mapping = {name: to_db_enum(enum_type, name) for name in set(columns[field])}
+            return [mapping[name] for name in columns[field]]
+
+        def enum_array(column: str) -> sql.Composable:
+            return sql.SQL("%s::{}[]").format(sql.Identifier(ENUM_COLUMNS[column][0]))
+
+        statements = []
+
+        if partitioned:
+            statements.append((sql.SQL("""
+                DELETE FROM {} d
+                USING unnest(%s::int[], %s::int[]) AS n(p_id, year)
+                WHERE d.p_id = n.p_id AND d.year IS DISTINCT FROM n.year;
+            """).format(
+                sql.Identifier(get_data_table())
+            ), [columns["id"].tolist(), batch.values("year")]))
+
+        data = sql.Identifier(get_data_table())
+        stage = sql.Identifier(f"{get_data_table()}_staging")
+        target = sql.SQL("""
+            p_id, school_id, program_name_id, comments, date_added, url,
+            status, decision_date, season, year, us_or_international,
+            gpa, gre, gre_v, gre_aw, degree,
+            llm_generated_program_id, llm_generated_university_id
+        """)
+
+        if staging:
+            statements.append((sql.SQL("""
+                DROP TABLE IF EXISTS pg_temp.{stage};
+                CREATE TEMP TABLE {stage} ON COMMIT DROP AS
+                    SELECT {target} FROM {data} WITH NO DATA;
+            """).format(stage=stage, target=target, data=data), []))
+
+        # Dates arrive as day ordinals (0 for missing) and numbers as doubles (NaN for missing)
+        statements.append((sql.SQL("""
+            INSERT INTO {data} ({target})
+            SELECT DISTINCT ON (p_id)
+                p_id, school_id, program_name_id, comments,
+                DATE '0001-01-01' + NULLIF(date_added, 0) - 1, url,
+                status, DATE '0001-01-01' + NULLIF(decision_date, 0) - 1, season,
+                NULLIF(year, 'NaN')::int, us_or_international,
+                NULLIF(gpa, 'NaN'), NULLIF(gre, 'NaN'), NULLIF(gre_v, 'NaN'),
+                NULLIF(gre_aw, 'NaN'), degree,
+                llm_generated_program_id, llm_generated_university_id
+            FROM unnest(
+                %s::int[], %s::int[], %s::int[], %s::text[], %s::int[], %s::text[],
+                {status}, %s::int[], {season}, %s::float8[], {region},
+                %s::float8[], %s::float8[], %s::float8[], %s::float8[], {degree},
+                %s::int[], %s::int[]
+            ) WITH ORDINALITY AS n(
+                p_id, school_id, program_name_id, comments, date_added, url,
+                status, decision_date, season, year, us_or_international,
                 gpa, gre, gre_v, gre_aw, degree,
-                llm_generated_program, llm_generated_university
-            )
-            VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                %s,%s, %s, %s, %s, %s, %s, %s, %s, %s
+                llm_generated_program_id, llm_generated_university_id, ord
             )
-            ON CONFLICT (p_id) DO UPDATE SET
-                school = EXCLUDED.school,
-                program_name = EXCLUDED.program_name,
+            ORDER BY p_id, ord DESC
+            {upsert};
+        """).format(
+            data=stage if staging else data,
+            target=target,
+            status=enum_array("status"),
+            season=enum_array("season"),
+            region=enum_array("us_or_international"),
+            degree=enum_array("degree"),
+            upsert=sql.SQL("") if staging else cls._on_conflict(partitioned),
+        ), [
+            columns["id"].tolist(),
+            [schools.get(name) for name in columns["school"]],
+            [programs.get(name) for name in columns["program_name"]],
+            columns["comments"],
+            columns["added_on"].tolist(),
+            columns["full_info_url"],
+            enum_column("status", "decision_status"),
+            columns["decision_date"].tolist(),
+            enum_column("season", "season"),
+            columns["year"].tolist(),
+            enum_column("us_or_international", "applicant_region"),
+            columns["gpa"].tolist(),
+            columns["gre_general"].tolist(),
+            columns["gre_verbal"].tolist(),
+            columns["gre_analytical_writing"].tolist(),
+            enum_column("degree", "degree_type"),
+            [programs.get(name) for name in columns["llm_generated_program"]],
+            [schools.get(name) for name in columns["llm_generated_university"]],
+        ]))
+
+        if staging:
+            statements.append((sql.SQL("""
+                INSERT INTO {data} ({target}) SELECT {target} FROM {stage} {upsert};
+            """).format(
+                data=data, target=target, stage=stage, upsert=cls._on_conflict(partitioned)
+            ), []))
+
+        return statements
+
+    @staticmethod
+    def _on_conflict(partitioned: bool) -> sql.Composed:
+        """Build the ON CONFLICT clause that makes an insert into the data table an UPSERT.
+
+        :param partitioned: Whether the data table is partitioned by year.
+        :type partitioned: bool
+        :returns: Clause overwriting every column of an existing row.
+        :rtype: sql.Composed
+        """
+        return sql.SQL("""
+            ON CONFLICT ({key}) DO UPDATE SET
+                school_id = EXCLUDED.school_id,
+                program_name_id = EXCLUDED.program_name_id,
                 comments = EXCLUDED.comments,
                 date_added = EXCLUDED.date_added,
                 url = EXCLUDED.url,
@@ -374,41 +2368,23 @@ class AdmissionResult:
                 decision_date = EXCLUDED.decision_date,
                 season = EXCLUDED.season,
                 year = EXCLUDED.year,
-                term = EXCLUDED.term,
                 us_or_international = EXCLUDED.us_or_international,
                 gpa = EXCLUDED.gpa,
                 gre = EXCLUDED.gre,
                 gre_v = EXCLUDED.gre_v,
                 gre_aw = EXCLUDED.gre_aw,
                 degree = EXCLUDED.degree,
-                llm_generated_program = EXCLUDED.llm_generated_program,
-                llm_generated_university = EXCLUDED.llm_generated_university;
-        """).format(
-            sql.Identifier(get_table())
-        ), (
-            self.id,
-            self.school,
-            self.program_name,
-            # Redundant but the assignment calls for it
-            f"{self.school} {self.program_name}",
-            self.comments,
-            self.added_on,
-            self.full_info_url,
-            self.decision_status,
-            self.decision_date,
-            self.season,
-            self.year,
-            # Redundant but the assignment calls for it
-            f"{self.season} {self.year}",
-            self.applicant_region,
-            self.gpa,
-            self.gre_general,
-            self.gre_verbal,
-            self.gre_analytical_writing,
-            self.degree_type,
-            self.llm_generated_program,
-            self.llm_generated_university,
-        ))
+                llm_generated_program_id = EXCLUDED.llm_generated_program_id,
+                llm_generated_university_id = EXCLUDED.llm_generated_university_id
+        """).format(key=sql.SQL("p_id, year" if partitioned else "p_id"))
+
+    def save_to_db(self, cursor) -> None:
+        """Save admission result to database using UPSERT.
+
+        :param cursor: Database cursor.
+        :raises psycopg.Error: If database operation fails.
+        """
+        self.save_many(cursor, [self])
 
     def clean_and_augment(self) -> None:
         """Apply LLM-based data cleaning.
@@ -427,3 +2403,284 @@ class AdmissionResult:
         self.llm_generated_university = result["standardized_university"]
 
 
+# How AdmissionBatch stores each AdmissionResult field:
+#   "id"     - array of 64-bit ints
+#   "int"    - array of doubles, NaN for None, converted back to int on read
+#   "float"  - array of doubles, NaN for None
+#   "date"   - array of proleptic Gregorian day ordinals, 0 for None
+#   "name"   - list of interned strings (few distinct values shared by many rows)
+#   "text"   - list of strings
+BATCH_COLUMNS = {
+    "id": "id",
+    "school": "name",
+    "program_name": "name",
+    "degree_type": "name",
+    "added_on": "date",
+    "decision_status": "name",
+    "decision_date": "date",
+    "season": "name",
+    "year": "int",
+    "applicant_region": "name",
+    "gre_general": "int",
+    "gre_verbal": "int",
+    "gre_analytical_writing": "float",
+    "gpa": "float",
+    "comments": "text",
+    "full_info_url": "text",
+    "llm_generated_program": "name",
+    "llm_generated_university": "name",
+}
+
+# Ordinal of 1970-01-01, for converting NumPy days since the epoch to date ordinals
+EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+
+
+def _pack(kind: str, value):
+    """Convert a field value to its AdmissionBatch storage form.
+
+    :param kind: Storage kind from BATCH_COLUMNS.
+    :type kind: str
+    :param value: Field value.
+    :returns: Value to store in the column.
+    """
+    if kind in ("int", "float"):
+        return math.nan if value is None else value
+    if kind == "date":
+        return value.toordinal() if value else 0
+    if kind == "name" and isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+def _unpack(kind: str, value):
+    """Convert a stored AdmissionBatch value back to its field value.
+
+    :param kind: Storage kind from BATCH_COLUMNS.
+    :type kind: str
+    :param value: Stored value.
+    :returns: Field value.
+    """
+    if kind in ("int", "float"):
+        if math.isnan(value):
+            return None
+        return int(value) if kind == "int" else value
+    if kind == "date":
+        return datetime.fromordinal(value) if value else None
+    return value
+
+
+class AdmissionBatch:
+    """Column-oriented buffer of admission results.
+
+    Holds one column per AdmissionResult field instead of one object per row: numbers and
+    dates are packed into ``array`` instances and repeated names are interned. Rows are
+    materialized as AdmissionResult only when indexed or iterated.
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self):
+        """Create an empty batch."""
+        self.columns: dict[str, list | array] = {
+            field: (
+                array("q") if kind == "id"
+                else array("d") if kind in ("int", "float")
+                else array("q") if kind == "date"
+                else []
+            )
+            for field, kind in BATCH_COLUMNS.items()
+        }
+
+    @classmethod
+    def from_results(cls, results) -> 'AdmissionBatch':
+        """Create a batch holding the given results.
+
+        :param results: Iterable of AdmissionResult.
+        :returns: New batch.
+        :rtype: AdmissionBatch
+        """
+        batch = cls()
+        batch.extend(results)
+        return batch
+
+    @classmethod
+    def from_dicts(cls, entries) -> 'AdmissionBatch':
+        """Create a batch from plain dictionaries without building AdmissionResult objects.
+
+        Accepts the same keys and ISO date strings as AdmissionResult.from_dict(). Each
+        field is gathered across all entries at once; numbers and dates are converted by
+        NumPy. Only the date part of a date string is parsed, so a UTC offset or time of day
+        never moves the stored day, matching from_dict().
+
+        :param entries: Iterable of dictionaries with admission data.
+        :returns: New batch.
+        :rtype: AdmissionBatch
+        """
+        entries = list(entries)
+        batch = cls()
+
+        for field, kind in BATCH_COLUMNS.items():
+            values = [entry.get(field) for entry in entries]
+
+            if kind == "id":
+                column = array("q", values)
+            elif kind in ("int", "float"):
+                column = array("d", np.array(values, dtype=np.float64).tobytes())
+            elif kind == "date":
+                # Missing values and empty strings both parse as NaT. Slicing off the time
+                # also drops any offset, which NumPy would otherwise apply (converting to UTC)
+                days = np.array([value[:10] if value else None for value in values],
+                                dtype="datetime64[D]")
+                ordinals = np.where(np.isnat(days), 0, days.astype(np.int64) + EPOCH_ORDINAL)
+                column = array("q", ordinals.astype(np.int64).tobytes())
+            elif kind == "name":
+                column = [sys.intern(value) if isinstance(value, str) else value
+                          for value in values]
+            else:
+                column = values
+
+            batch.columns[field] = column
+
+        return batch
+
+    def __len__(self) -> int:
+        """Count rows in the batch.
+
+        :returns: Row count.
+        :rtype: int
+        """
+        return len(self.columns["id"])
+
+    def __getitem__(self, index: int) -> AdmissionResult:
+        """Materialize one row.
+
+        :param index: Row index.
+        :type index: int
+        :returns: Copy of the row; changes to it aren't reflected in the batch.
+        :rtype: AdmissionResult
+        """
+        return AdmissionResult(*(
+            _unpack(kind, self.columns[field][index])
+            for field, kind in BATCH_COLUMNS.items()
+        ))
+
+    def __setitem__(self, index: int, result: AdmissionResult) -> None:
+        """Overwrite one row.
+
+        :param index: Row index.
+        :type index: int
+        :param result: New row values.
+        :type result: AdmissionResult
+        """
+        for field, kind in BATCH_COLUMNS.items():
+            self.columns[field][index] = _pack(kind, getattr(result, field))
+
+    def __iter__(self) -> Iterator[AdmissionResult]:
+        """Materialize the rows one at a time.
+
+        :returns: Iterator over row copies.
+        :rtype: Iterator[AdmissionResult]
+        """
+        return (self[index] for index in range(len(self)))
+
+    def append(self, result: AdmissionResult) -> None:
+        """Add a row.
+
+        :param result: Row to add.
+        :type result: AdmissionResult
+        """
+        for field, kind in BATCH_COLUMNS.items():
+            self.columns[field].append(_pack(kind, getattr(result, field)))
+
+    def extend(self, results) -> None:
+        """Add several rows.
+
+        :param results: Iterable of AdmissionResult.
+        """
+        for result in results:
+            self.append(result)
+
+    def clean_and_augment(self) -> int:
+        """Apply LLM-based data cleaning to every row.
+
+        Rows are grouped by their normalized ``"{program_name}, {school}"`` (see
+        clean.input_key()) and each group is cleaned once, so the work scales with the
+        distinct inputs rather than the rows.
+
+        :returns: Number of distinct inputs cleaned.
+        :rtype: int
+        :raises Exception: If LLM processing fails.
+        """
+        columns = self.columns
+        groups: dict[str, list[int]] = {}
+
+        for index, (program, school) in enumerate(zip(columns["program_name"], columns["school"])):
+            groups.setdefault(clean.input_key(f"{program}, {school}"), []).append(index)
+
+        print(f"Running cleaner on {len(groups)} distinct inputs for {len(self)} entries")
+
+        for indexes in groups.values():
+            first = indexes[0]
+            result = clean.call_llm(f"{columns['program_name'][first]}, {columns['school'][first]}")
+
+            print(f"Got cleaned fields for {len(indexes)} entries: {result}")
+
+            program = _pack("name", result["standardized_program"])
+            university = _pack("name", result["standardized_university"])
+
+            for index in indexes:
+                columns["llm_generated_program"][index] = program
+                columns["llm_generated_university"][index] = university
+
+        stats = clean.cache_stats()
+        print(f"Cleaner: {stats['hit_rate']:.0%} cached, "
+              f"{stats['fast_path_rate']:.0%} matched by rules without the LLM")
+
+        return len(groups)
+
+    def values(self, field: str) -> list:
+        """Get one column as field values.
+
+        :param field: AdmissionResult field name.
+        :type field: str
+        :returns: Column values, with None for missing ones.
+        :rtype: list
+        """
+        kind = BATCH_COLUMNS[field]
+
+        if kind in ("id", "name", "text"):
+            return list(self.columns[field])
+
+        return [_unpack(kind, value) for value in self.columns[field]]
+
+
+def _as_batch(results) -> AdmissionBatch:
+    """Get results as a batch, converting a list if needed.
+
+    :param results: AdmissionBatch or iterable of AdmissionResult.
+    :returns: Batch holding the results.
+    :rtype: AdmissionBatch
+    """
+    return results if isinstance(results, AdmissionBatch) else AdmissionBatch.from_results(results)
+
+
+def _dimension_names(batch: AdmissionBatch) -> list[tuple[DimensionCache, list]]:
+    """Pair each dimension cache with the names a batch needs from it.
+
+    :param batch: Results about to be saved.
+    :type batch: AdmissionBatch
+    :returns: (cache, names) pairs for schools and programs.
+    :rtype: list[tuple[DimensionCache, list]]
+    """
+    columns = batch.columns
+
+    return [
+        (
+            get_dimension_cache("schools"),
+            columns["school"] + columns["llm_generated_university"],
+        ),
+        (
+            get_dimension_cache("programs"),
+            columns["program_name"] + columns["llm_generated_program"],
+        ),
+    ]
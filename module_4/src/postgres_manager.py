@@ -4,13 +4,22 @@ Manages PostgreSQL server lifecycle, database initialization, and connections.
 """
 
 import subprocess
+import hashlib
 import os
 import atexit
+import fcntl
+import signal
 import time
 import shutil
 import sys
+import asyncio
+import threading
 import psycopg
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from psycopg import sql
+from psycopg_pool import AsyncConnectionPool, ConnectionPool
+from typing import AsyncIterator, Callable, Iterator
 from urllib.parse import urlparse
 
 
@@ -42,22 +51,129 @@ PG_USER = db_config['user']
 PG_PASSWORD = db_config['password']
 PG_DB = db_config['database']
 
+# Optional read replica for queries that tolerate replication lag; unset to read from the
+# primary too
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+read_db_config = parse_database_url(DATABASE_READ_URL) if DATABASE_READ_URL else None
+
+# How long reads stay on the primary after this process writes, so a refresh's own
+# results are visible right away even if the replica lags behind
+READ_YOUR_WRITES_WINDOW = float(os.getenv("PG_READ_YOUR_WRITES_WINDOW", "10"))
+
+# Seeded database that build_template() creates and clone_database() copies
+TEMPLATE_DB = os.getenv("PG_TEMPLATE_DB", f"{PG_DB}_template")
+
 # Data directory for local PostgreSQL server
 DATA_DIR = os.getenv("PG_DATA_DIR", "pgdata")
 
+# How long to wait for the server to accept connections, and the bounds of the
+# exponential backoff between readiness checks
+STARTUP_TIMEOUT = float(os.getenv("PG_STARTUP_TIMEOUT", "15"))
+STARTUP_POLL_MIN = 0.005
+STARTUP_POLL_MAX = 0.25
+
+# Private (0700) directory for the Unix socket of the server started on DATA_DIR; empty
+# to only listen on TCP
+SOCKET_DIR = os.getenv("PG_SOCKET_DIR", os.path.join(DATA_DIR, "sockets"))
+
+# Host names that refer to this machine, for which a local server's socket is preferred
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
+
+# PIDs of the processes using the server on DATA_DIR, one per line, next to postmaster.pid
+CLIENTS_FILE = "postmaster.clients"
+
+# Settings applied to the loading transaction by bulk_load()
+BULK_LOAD_SETTINGS = {
+    # Commits return before the WAL is flushed; a crash may lose the last few commits
+    "synchronous_commit": "off",
+    # Memory for ANALYZE and index builds
+    "maintenance_work_mem": os.getenv("PG_BULK_MAINTENANCE_WORK_MEM", "512MB"),
+    # A load is one long statement by design
+    "statement_timeout": "0",
+}
+
+# Connection pool bounds and how long a checkout may wait for a free connection
+POOL_MIN_SIZE = int(os.getenv("PG_POOL_MIN_SIZE", "1"))
+POOL_MAX_SIZE = int(os.getenv("PG_POOL_MAX_SIZE", "10"))
+POOL_TIMEOUT = float(os.getenv("PG_POOL_TIMEOUT", "30"))
+
+# statement_timeout in milliseconds of the primary's and the read replica's pooled
+# connections, so one stuck statement can't hold a connection forever; 0 disables it.
+# Callers can override it per transaction, see connection().
+STATEMENT_TIMEOUT_MS = int(os.getenv("PG_STATEMENT_TIMEOUT_MS", "30000"))
+READ_STATEMENT_TIMEOUT_MS = int(
+    os.getenv("PG_READ_STATEMENT_TIMEOUT_MS", str(STATEMENT_TIMEOUT_MS))
+)
+
+# Created on first use by get_pool()
+_pool: ConnectionPool | None = None
+
+# Async pools are bound to the event loop that opened them; one per running loop
+_async_pools: dict[asyncio.AbstractEventLoop, AsyncConnectionPool] = {}
+
+# Replica counterparts of _pool and _async_pools, opened on first routed read
+_read_pool: ConnectionPool | None = None
+_async_read_pools: dict[asyncio.AbstractEventLoop, AsyncConnectionPool] = {}
+
+# time.monotonic() of this process's last write, see note_write()
+_last_write: float | None = None
+
+# Key of the enclosing cancellable() block, and the pooled connections checked out under
+# each active key. Those connections also carry an application_name derived from the key,
+# so cancel() can find them from other processes through pg_stat_activity.
+CANCEL_APPLICATION_PREFIX = "cancellable:"
+_cancel_key: ContextVar[str | None] = ContextVar("cancel_key", default=None)
+_cancellable: dict[str, list] = {}
+_canceled: set[str] = set()
+_cancel_lock = threading.Lock()
+
+
+def local_socket_dir() -> str | None:
+    """Find the socket directory of a server running on DATA_DIR and serving PG_PORT.
+
+    The postmaster records its port and first socket directory on the 4th and 5th lines
+    of postmaster.pid.
+
+    :returns: Directory holding the server's socket, or None if there's no such server.
+    :rtype: str | None
+    """
+    try:
+        with open(os.path.join(DATA_DIR, "postmaster.pid")) as f:
+            lines = f.read().splitlines()
+
+        pid, port, socket_dir = int(lines[0]), int(lines[3]), lines[4].strip()
+    except (OSError, ValueError, IndexError):
+        return None
+
+    if port != PG_PORT or not socket_dir or not _pid_alive(pid):
+        return None
+
+    if not os.path.exists(os.path.join(socket_dir, f".s.PGSQL.{port}")):
+        return None
+
+    return socket_dir
+
 
 def get_connection_params(dbname: str | None = None) -> dict:
     """Build PostgreSQL connection parameters.
+
+    When the configured host is this machine and a server on DATA_DIR listens on a Unix
+    socket for the same port, the socket is used instead of TCP.
     
     :param dbname: Database name (defaults to PG_DB)
     :type dbname: str | None
     :returns: Connection parameters dictionary
     :rtype: dict
     """
+    host = PG_HOST
+
+    if PG_HOST in LOCAL_HOSTS and (socket_dir := local_socket_dir()) is not None:
+        host = socket_dir
+
     return {
         'dbname': dbname or PG_DB,
         'user': PG_USER,
-        'host': PG_HOST,
+        'host': host,
         'port': PG_PORT,
         'password': PG_PASSWORD
     }
@@ -118,49 +234,774 @@ def setup_db() -> None:
     conn.close()
 
 
-def get_connection():
+def _maintenance_connection() -> psycopg.Connection:
+    """Connect to the server's 'postgres' database in autocommit mode.
+
+    CREATE and DROP DATABASE can't run inside a transaction, nor while connected to the
+    database they act on.
+
+    :returns: Autocommit connection.
+    :rtype: psycopg.Connection
+    """
+    conn = psycopg.connect(**get_connection_params('postgres'))
+    conn.autocommit = True
+
+    return conn
+
+
+def use_database(name: str) -> None:
+    """Point this process's connections at another database on the same server.
+
+    The pools are closed so they reconnect to the new database on next use. Close the
+    async pools of still-running event loops first with close_async_pool().
+
+    :param name: Database name, e.g. from clone_database().
+    :type name: str
+    """
+    global PG_DB
+    PG_DB = name
+
+    close_pool()
+
+    for pools in (_async_pools, _async_read_pools):
+        for loop in [loop for loop in pools if loop.is_closed()]:
+            del pools[loop]
+
+
+def build_template(seed: Callable[[], None], name: str | None = None, key: str = "") -> bool:
+    """Create a seeded template database for clone_database(), unless it's up to date.
+
+    seed runs with the process pointed at the new database (see use_database()), e.g.
+    ``model.init_tables()`` followed by a large load. The key is recorded in the database
+    comment once seeding succeeds; a template with a different key, or whose seeding
+    failed, is rebuilt. Pass something that changes with the schema or seed data, such as
+    a hash of them. Concurrent callers, like parallel test workers, wait on an advisory
+    lock and only the first one builds.
+
+    :param seed: Function filling the current database.
+    :type seed: Callable[[], None]
+    :param name: Template database name (defaults to TEMPLATE_DB).
+    :type name: str | None
+    :param key: Version of the seeded contents.
+    :type key: str
+    :returns: Whether the template was (re)built.
+    :rtype: bool
+    :raises psycopg.Error: If creating the database fails.
+    """
+    name = name or TEMPLATE_DB
+    comment = f"seeded:{key}"
+
+    with _maintenance_connection() as conn:
+        # Session-level lock, released when the connection closes
+        conn.execute("SELECT pg_advisory_lock(hashtext(%s));", [name])
+
+        row = conn.execute(
+            "SELECT shobj_description(oid, 'pg_database') FROM pg_database WHERE datname = %s;",
+            [name],
+        ).fetchone()
+
+        if row is not None and row[0] == comment:
+            return False
+
+        print(f"Building template database '{name}'...")
+
+        conn.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE);").format(
+            sql.Identifier(name)
+        ))
+        conn.execute(sql.SQL("CREATE DATABASE {} OWNER {};").format(
+            sql.Identifier(name), sql.Identifier(PG_USER)
+        ))
+
+        previous = PG_DB
+        use_database(name)
+
+        try:
+            seed()
+        finally:
+            use_database(previous)
+
+        conn.execute(sql.SQL("COMMENT ON DATABASE {} IS {};").format(
+            sql.Identifier(name), sql.Literal(comment)
+        ))
+
+    return True
+
+
+def clone_database(name: str | None = None, template: str | None = None) -> str:
+    """Create a database as a copy of a template made by build_template().
+
+    The server copies the template's files instead of replaying its rows, so even a large
+    seeded dataset is ready in well under a second. An existing database of the same name
+    is replaced.
+
+    :param name: Clone name (defaults to PG_DB suffixed with this process's PID, so
+        parallel workers get separate clones).
+    :type name: str | None
+    :param template: Template database name (defaults to TEMPLATE_DB).
+    :type template: str | None
+    :returns: Name of the new database.
+    :rtype: str
+    :raises psycopg.Error: If the template doesn't exist or another session is connected
+        to it.
+    """
+    template = template or TEMPLATE_DB
+    name = name or f"{PG_DB}_{os.getpid()}"
+
+    with _maintenance_connection() as conn:
+        # Waits for a build_template() in progress
+        conn.execute("SELECT pg_advisory_lock(hashtext(%s));", [template])
+
+        conn.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE);").format(
+            sql.Identifier(name)
+        ))
+        conn.execute(sql.SQL("CREATE DATABASE {} TEMPLATE {} OWNER {};").format(
+            sql.Identifier(name), sql.Identifier(template), sql.Identifier(PG_USER)
+        ))
+
+    return name
+
+
+def drop_database(name: str) -> None:
+    """Drop a database, e.g. a clone, disconnecting any sessions still using it.
+
+    :param name: Database name.
+    :type name: str
+    :raises psycopg.Error: If the drop fails.
+    """
+    with _maintenance_connection() as conn:
+        conn.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE);").format(
+            sql.Identifier(name)
+        ))
+
+
+def get_connection(read: bool = False):
     """Create database connection.
     
+    :param read: Connect to the read replica if reads_from_replica() allows it.
+    :type read: bool
     :returns: Connection to project database.
     :rtype: psycopg.Connection
     :raises psycopg.Error: If connection fails.
     """
+    if read and reads_from_replica():
+        return psycopg.connect(**get_read_connection_params())
+
     return psycopg.connect(**get_connection_params())
 
 
-def test_postgres_connection():
-    """Test PostgreSQL server connectivity with retry logic.
-    
-    Attempts to establish a connection to the PostgreSQL server for up to 15 seconds
-    with 1-second intervals between attempts. This function is typically used during
-    startup to ensure the database server is ready before proceeding with application
-    initialization.
-    
-    :raises SystemExit: If PostgreSQL server is not accessible after 15 seconds
+def get_read_connection_params() -> dict:
+    """Build connection parameters for the read replica.
+
+    :returns: Connection parameters from DATABASE_READ_URL, or get_connection_params() if
+        no replica is configured.
+    :rtype: dict
     """
-    # Wait until Postgres is ready to accept connections
-    for i in range(15):  # try for up to 15 seconds
-        try:
-            conn = psycopg.connect(**get_connection_params('postgres'))
-            conn.close()
-            print("Postgres is ready.")
+    if read_db_config is None:
+        return get_connection_params()
+
+    return {
+        'dbname': read_db_config['database'],
+        'user': read_db_config['user'],
+        'host': read_db_config['host'],
+        'port': int(read_db_config['port']),
+        'password': read_db_config['password']
+    }
+
+
+def note_write() -> None:
+    """Record that this process just wrote to the primary.
+
+    For READ_YOUR_WRITES_WINDOW seconds afterwards, reads go to the primary so they see
+    the write even if the replica hasn't replayed it yet.
+    """
+    global _last_write
+    _last_write = time.monotonic()
+
+
+def reads_from_replica() -> bool:
+    """Check whether routed reads should go to the read replica right now.
+
+    :returns: Whether a replica is configured and this process hasn't written within
+        READ_YOUR_WRITES_WINDOW.
+    :rtype: bool
+    """
+    if read_db_config is None:
+        return False
+
+    return _last_write is None or time.monotonic() - _last_write >= READ_YOUR_WRITES_WINDOW
+
+
+def _pool_params(params: dict, timeout_ms: int) -> dict:
+    """Add a default statement_timeout to the connection parameters of a pool.
+
+    :param params: Connection parameters.
+    :type params: dict
+    :param timeout_ms: Timeout in milliseconds; 0 for none.
+    :type timeout_ms: int
+    :returns: Parameters with libpq ``options`` setting the timeout.
+    :rtype: dict
+    """
+    return {**params, 'options': f"-c statement_timeout={int(timeout_ms)}"}
+
+
+def _cancel_application_name(key: str) -> str:
+    """Get the application_name marking connections of a cancellable() block.
+
+    The key is hashed, since application_name is cut at 63 bytes and limited to ASCII.
+
+    :param key: Key given to cancellable().
+    :type key: str
+    :returns: Application name.
+    :rtype: str
+    """
+    return CANCEL_APPLICATION_PREFIX + hashlib.sha256(key.encode()).hexdigest()[:32]
+
+
+def _checkout_settings(timeout: int | None) -> tuple[str, list] | None:
+    """Build the statement applying per-checkout settings to the current transaction.
+
+    Sets statement_timeout when a timeout is given, and application_name inside a
+    cancellable() block. Both revert when the transaction ends.
+
+    :param timeout: Timeout in milliseconds, 0 for none; None to keep the pool's.
+    :type timeout: int | None
+    :returns: Query and parameters, or None if there's nothing to set.
+    :rtype: tuple[str, list] | None
+    """
+    settings = []
+
+    if timeout is not None:
+        settings += ["statement_timeout", str(int(timeout))]
+
+    if (key := _cancel_key.get()) is not None:
+        settings += ["application_name", _cancel_application_name(key)]
+
+    if not settings:
+        return None
+
+    calls = ", ".join(["set_config(%s, %s, true)"] * (len(settings) // 2))
+
+    return f"SELECT {calls};", settings
+
+
+@contextmanager
+def _track(conn) -> Iterator[None]:
+    """Register a checked-out connection with the enclosing cancellable() block, if any.
+
+    :param conn: Pooled connection, sync or async.
+    :returns: Context manager covering the checkout.
+    :rtype: Iterator[None]
+    :raises psycopg.errors.QueryCanceled: If the block was already canceled.
+    """
+    key = _cancel_key.get()
+
+    if key is None:
+        yield
+        return
+
+    with _cancel_lock:
+        if key in _canceled:
+            raise psycopg.errors.QueryCanceled(f"Request {key} was canceled")
+
+        _cancellable.setdefault(key, []).append(conn)
+
+    try:
+        yield
+    finally:
+        with _cancel_lock:
+            _cancellable[key].remove(conn)
+
+
+@contextmanager
+def cancellable(key: str) -> Iterator[None]:
+    """Make the statements run in this block cancelable with cancel(key).
+
+    Covers pooled connections checked out in the block, sync or async, in this thread or
+    task. Once canceled, running statements fail and further checkouts in the block raise
+    ``QueryCanceled`` too, so the connections go back to the pool right away.
+
+    :param key: Identifies the work, e.g. a request ID chosen by the client.
+    :type key: str
+    :returns: Context manager.
+    :rtype: Iterator[None]
+    """
+    token = _cancel_key.set(key)
+
+    with _cancel_lock:
+        _cancellable.setdefault(key, [])
+
+    try:
+        yield
+    finally:
+        _cancel_key.reset(token)
+
+        with _cancel_lock:
+            # Blocks with the same key may still run in other threads
+            if not _cancellable.get(key):
+                _cancellable.pop(key, None)
+                _canceled.discard(key)
+
+
+def cancel(key: str) -> bool:
+    """Cancel the statements running in a cancellable() block.
+
+    Meant for the web layer to call when the client that started the work goes away.
+    A block in this process is canceled directly: cancel requests are sent while holding
+    the registry lock, so a connection can't go back to the pool and pick up someone
+    else's statement in between, and later checkouts in the block fail too. Otherwise the
+    block may run in another process, e.g. another web worker, so its backends are looked
+    up by application_name in pg_stat_activity, on the primary and the read replica, and
+    canceled with pg_cancel_backend(). That only interrupts statements already running,
+    and a backend finishing its transaction between lookup and cancel could have its next
+    statement canceled instead.
+
+    :param key: Key given to cancellable().
+    :type key: str
+    :returns: Whether a block with that key was active in this process, or a statement of
+        one was running elsewhere.
+    :rtype: bool
+    :raises psycopg.Error: If looking up other processes' statements fails.
+    """
+    with _cancel_lock:
+        if key in _cancellable:
+            _canceled.add(key)
+
+            for conn in _cancellable[key]:
+                conn.cancel()
+
+            return True
+
+    canceled = False
+    servers = [get_connection_params()]
+
+    if read_db_config is not None:
+        servers.append(get_read_connection_params())
+
+    for params in servers:
+        with psycopg.connect(**params) as conn:
+            row = conn.execute("""
+                SELECT COUNT(*) FILTER (WHERE pg_cancel_backend(pid)) FROM pg_stat_activity
+                WHERE application_name = %s AND pid <> pg_backend_pid();
+            """, [_cancel_application_name(key)]).fetchone()
+
+        canceled = canceled or row[0] > 0
+
+    return canceled
+
+
+def get_pool() -> ConnectionPool:
+    """Get the shared connection pool, opening it on first use.
+
+    Connections are checked with a round trip before being handed out, so ones dropped by
+    a server restart are replaced instead of failing the caller.
+
+    :returns: Pool of connections to the project database.
+    :rtype: psycopg_pool.ConnectionPool
+    """
+    global _pool
+
+    if _pool is None:
+        _pool = ConnectionPool(
+            kwargs=_pool_params(get_connection_params(), STATEMENT_TIMEOUT_MS),
+            min_size=POOL_MIN_SIZE,
+            max_size=POOL_MAX_SIZE,
+            timeout=POOL_TIMEOUT,
+            check=ConnectionPool.check_connection,
+            name="admissions",
+            open=True,
+        )
+        atexit.register(close_pool)
+
+    return _pool
+
+
+@contextmanager
+def connection(timeout: int | None = None) -> Iterator[psycopg.Connection]:
+    """Check out a pooled connection for the duration of a ``with`` block.
+
+    The transaction is committed when the block exits normally and rolled back if it
+    raises; either way the connection goes back to the pool. Use get_connection() instead
+    for autocommit work or session-level state that shouldn't leak to other callers.
+    Statements that exceed the timeout fail with ``QueryCanceled``.
+
+    :param timeout: statement_timeout in milliseconds for this transaction, 0 for none;
+        None to keep STATEMENT_TIMEOUT_MS.
+    :type timeout: int | None
+    :returns: Context manager yielding a connection.
+    :rtype: Iterator[psycopg.Connection]
+    :raises psycopg_pool.PoolTimeout: If no connection frees up within POOL_TIMEOUT.
+    """
+    with get_pool().connection() as conn, _track(conn):
+        if (settings := _checkout_settings(timeout)) is not None:
+            conn.execute(*settings)
+
+        yield conn
+
+
+def get_read_pool() -> ConnectionPool:
+    """Get the connection pool of the read replica, opening it on first use.
+
+    Uses the same size, timeout and health check settings as get_pool().
+
+    :returns: Pool of connections to the DATABASE_READ_URL database.
+    :rtype: psycopg_pool.ConnectionPool
+    """
+    global _read_pool
+
+    if _read_pool is None:
+        _read_pool = ConnectionPool(
+            kwargs=_pool_params(get_read_connection_params(), READ_STATEMENT_TIMEOUT_MS),
+            min_size=POOL_MIN_SIZE,
+            max_size=POOL_MAX_SIZE,
+            timeout=POOL_TIMEOUT,
+            check=ConnectionPool.check_connection,
+            name="admissions-read",
+            open=True,
+        )
+        atexit.register(close_pool)
+
+    return _read_pool
+
+
+@contextmanager
+def read_connection(
+    primary: bool = False, timeout: int | None = None
+) -> Iterator[psycopg.Connection]:
+    """Check out a pooled connection for read-only work.
+
+    The connection comes from the read replica's pool when reads_from_replica() allows
+    it, and from the primary's pool otherwise. Don't write through it.
+
+    :param primary: Read from the primary regardless, e.g. when the caller must see the
+        latest committed data.
+    :type primary: bool
+    :param timeout: statement_timeout in milliseconds for this transaction, as in
+        connection(); None to keep the pool's.
+    :type timeout: int | None
+    :returns: Context manager yielding a connection.
+    :rtype: Iterator[psycopg.Connection]
+    :raises psycopg_pool.PoolTimeout: If no connection frees up within POOL_TIMEOUT.
+    """
+    pool = get_read_pool() if not primary and reads_from_replica() else get_pool()
+
+    with pool.connection() as conn, _track(conn):
+        if (settings := _checkout_settings(timeout)) is not None:
+            conn.execute(*settings)
+
+        yield conn
+
+
+def pool_stats(read: bool = False) -> dict[str, int]:
+    """Report pool size and usage counters for monitoring.
+
+    :param read: Report on the read replica's pool instead of the primary's.
+    :type read: bool
+    :returns: Counters from psycopg_pool, e.g. ``pool_size``, ``pool_available``,
+        ``requests_waiting`` and ``requests_num``; empty if the pool isn't open.
+    :rtype: dict[str, int]
+    """
+    pool = _read_pool if read else _pool
+
+    return pool.get_stats() if pool is not None else {}
+
+
+def close_pool() -> None:
+    """Close the shared connection pools of the primary and read replica, if open."""
+    global _pool, _read_pool
+
+    if _pool is not None:
+        _pool.close()
+        _pool = None
+
+    if _read_pool is not None:
+        _read_pool.close()
+        _read_pool = None
+
+
+async def get_async_pool(read: bool = False) -> AsyncConnectionPool:
+    """Get the async connection pool of the running event loop, opening it on first use.
+
+    Uses the same size, timeout and health check settings as get_pool().
+
+    :param read: Get the pool of the read replica instead of the primary.
+    :type read: bool
+    :returns: Pool of async connections to the project database.
+    :rtype: psycopg_pool.AsyncConnectionPool
+    """
+    loop = asyncio.get_running_loop()
+    pools = _async_read_pools if read else _async_pools
+
+    # Pools of loops that have since closed can't be used or closed any more
+    for stale in [other for other in pools if other.is_closed()]:
+        del pools[stale]
+
+    if loop not in pools:
+        pool = AsyncConnectionPool(
+            kwargs=_pool_params(
+                get_read_connection_params() if read else get_connection_params(),
+                READ_STATEMENT_TIMEOUT_MS if read else STATEMENT_TIMEOUT_MS,
+            ),
+            min_size=POOL_MIN_SIZE,
+            max_size=POOL_MAX_SIZE,
+            timeout=POOL_TIMEOUT,
+            check=AsyncConnectionPool.check_connection,
+            name="admissions-async-read" if read else "admissions-async",
+            open=False,
+        )
+        await pool.open()
+        pools[loop] = pool
+
+    return pools[loop]
+
+
+@asynccontextmanager
+async def async_connection(
+    timeout: int | None = None,
+) -> AsyncIterator[psycopg.AsyncConnection]:
+    """Check out a pooled async connection for the duration of an ``async with`` block.
+
+    Commits or rolls back on exit like connection().
+
+    :param timeout: statement_timeout in milliseconds for this transaction, as in
+        connection().
+    :type timeout: int | None
+    :returns: Async context manager yielding a connection.
+    :rtype: AsyncIterator[psycopg.AsyncConnection]
+    :raises psycopg_pool.PoolTimeout: If no connection frees up within POOL_TIMEOUT.
+    """
+    async with (await get_async_pool()).connection() as conn:
+        with _track(conn):
+            if (settings := _checkout_settings(timeout)) is not None:
+                await conn.execute(*settings)
+
+            yield conn
+
+
+@asynccontextmanager
+async def async_read_connection(
+    primary: bool = False, timeout: int | None = None
+) -> AsyncIterator[psycopg.AsyncConnection]:
+    """Async counterpart of read_connection().
+
+    :param primary: Read from the primary regardless.
+    :type primary: bool
+    :param timeout: statement_timeout in milliseconds for this transaction, as in
+        connection().
+    :type timeout: int | None
+    :returns: Async context manager yielding a connection.
+    :rtype: AsyncIterator[psycopg.AsyncConnection]
+    :raises psycopg_pool.PoolTimeout: If no connection frees up within POOL_TIMEOUT.
+    """
+    pool = await get_async_pool(read=not primary and reads_from_replica())
+
+    async with pool.connection() as conn:
+        with _track(conn):
+            if (settings := _checkout_settings(timeout)) is not None:
+                await conn.execute(*settings)
+
+            yield conn
+
+
+async def close_async_pool() -> None:
+    """Close the async pools of the running event loop, if open."""
+    loop = asyncio.get_running_loop()
+
+    for pools in (_async_pools, _async_read_pools):
+        pool = pools.pop(loop, None)
+
+        if pool is not None:
+            await pool.close()
+
+
+@contextmanager
+def bulk_load(cursor) -> Iterator[None]:
+    """Apply the bulk-load profile while a large load runs on the cursor's transaction.
+
+    BULK_LOAD_SETTINGS are set with SET LOCAL semantics, so they revert by themselves when
+    the transaction ends and never affect other sessions.
+
+    :param cursor: Cursor of the transaction doing the load.
+    :returns: Context manager applying the profile.
+    :rtype: Iterator[None]
+    """
+    for name, value in BULK_LOAD_SETTINGS.items():
+        cursor.execute("SELECT set_config(%s, %s, true);", [name, value])
+
+    yield
+
+
+def postmaster_ready() -> bool:
+    """Check whether the server on DATA_DIR reports that it accepts connections.
+
+    The postmaster writes its state to the 8th line of postmaster.pid; it reads ``ready``
+    once startup has finished.
+
+    :returns: Whether postmaster.pid exists and reports ready.
+    :rtype: bool
+    """
+    try:
+        with open(os.path.join(DATA_DIR, "postmaster.pid")) as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return False
+
+    return len(lines) > 7 and lines[7].strip() == "ready"
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process exists.
+
+    :param pid: Process ID.
+    :type pid: int
+    :returns: Whether the process exists, even if owned by another user.
+    :rtype: bool
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+
+    return True
+
+
+def running_postmaster_pid() -> int | None:
+    """Find a live server on DATA_DIR from its postmaster.pid.
+
+    :returns: PID of the server, or None if none is running (a stale file is ignored).
+    :rtype: int | None
+    """
+    try:
+        with open(os.path.join(DATA_DIR, "postmaster.pid")) as f:
+            pid = int(f.readline())
+    except (OSError, ValueError):
+        return None
+
+    return pid if _pid_alive(pid) else None
+
+
+@contextmanager
+def _clients() -> Iterator[set[int]]:
+    """Lock the registry of processes using the server on DATA_DIR.
+
+    The lock is held for the whole block, so starting, attaching and stopping are
+    serialized across processes. PIDs of processes that died without releasing the server
+    are dropped; changes to the yielded set are written back on exit.
+
+    :returns: Context manager yielding the set of live client PIDs.
+    :rtype: Iterator[set[int]]
+    """
+    with open(os.path.join(DATA_DIR, CLIENTS_FILE), "a+") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+
+        f.seek(0)
+        clients = {int(pid) for pid in f.read().split() if _pid_alive(int(pid))}
+
+        yield clients
+
+        f.seek(0)
+        f.truncate()
+        f.write("".join(f"{pid}\n" for pid in sorted(clients)))
+
+
+def _stop_postmaster(pid: int) -> None:
+    """Shut down a server this process didn't start and wait for it to exit.
+
+    :param pid: PID of the server.
+    :type pid: int
+    """
+    print("Stopping Postgres...")
+
+    os.kill(pid, signal.SIGTERM)
+
+    delay = STARTUP_POLL_MIN
+    waited = 0.0
+
+    while _pid_alive(pid):
+        if waited >= STARTUP_TIMEOUT:
+            print(f"Warning: Postgres (pid {pid}) is still shutting down.")
+            return
+
+        time.sleep(delay)
+        waited += delay
+        delay = min(delay * 2, STARTUP_POLL_MAX)
+
+
+def release_postgres(process: subprocess.Popen | None = None) -> None:
+    """Stop using the server on DATA_DIR, shutting it down if no other process uses it.
+
+    :param process: Server process, if this process started it.
+    :type process: subprocess.Popen | None
+    """
+    with _clients() as clients:
+        clients.discard(os.getpid())
+
+        if clients:
+            print(f"Leaving Postgres running for {len(clients)} other process(es).")
+        elif process is not None:
+            stop_postgres(process)
+        elif (pid := running_postmaster_pid()) is not None:
+            _stop_postmaster(pid)
+
+
+def test_postgres_connection(process: subprocess.Popen | None = None) -> None:
+    """Wait until the PostgreSQL server accepts connections.
+
+    Checks are spaced by an exponential backoff from STARTUP_POLL_MIN to STARTUP_POLL_MAX
+    seconds, so a server that comes up quickly is noticed within milliseconds. For a
+    server started from DATA_DIR, postmaster.pid is read until it reports ready before any
+    connection is attempted, and a server process that exits ends the wait early.
+
+    :param process: Local server process that was just started, if any.
+    :type process: subprocess.Popen | None
+    :raises SystemExit: If the server isn't accepting connections within STARTUP_TIMEOUT
+        seconds, or the server process exits.
+    """
+    started = time.perf_counter()
+    delay = STARTUP_POLL_MIN
+    waited = 0.0
+
+    while True:
+        if process is None or postmaster_ready():
+            try:
+                conn = psycopg.connect(**get_connection_params('postgres'))
+                conn.close()
+                print(f"Postgres is ready ({(time.perf_counter() - started) * 1000:.0f} ms).")
+                return
+            except psycopg.OperationalError:
+                pass
+
+        if process is not None and process.poll() is not None:
+            print(f"Error: Postgres exited with code {process.returncode} during startup.")
+            break
+
+        if waited >= STARTUP_TIMEOUT:
+            print(f"Error: Could not connect to Postgres after {STARTUP_TIMEOUT:g} seconds.")
             break
-        except psycopg.OperationalError:
+
+        if waited == 0:
             print("Waiting for Postgres connection...")
-            time.sleep(1)
-    else:
-        print("Error: Could not connect to Postgres after 15 seconds.")
-        sys.exit(1)
 
+        # Tracked as the sum of the delays rather than the clock, so it's bounded by the
+        # number of checks
+        time.sleep(delay)
+        waited += delay
+        delay = min(delay * 2, STARTUP_POLL_MAX)
 
-def start_postgres() -> subprocess.Popen:
-    """Start PostgreSQL server process.
-    
-    Initializes database, starts server, and creates project database.
-    
-    :returns: PostgreSQL server process.
-    :rtype: subprocess.Popen
-    :raises SystemExit: If PostgreSQL fails to start within 15 seconds.
+    sys.exit(1)
+
+
+def start_postgres() -> subprocess.Popen | None:
+    """Start PostgreSQL server process, or attach to one already running on DATA_DIR.
+
+    Initializes database, starts server if needed, and creates project database. Every
+    process using the server is recorded in CLIENTS_FILE, and the server is only stopped
+    when the last of them exits, so the app, the loader and the tests can share it.
+
+    :returns: PostgreSQL server process, or None when attached to a running server.
+    :rtype: subprocess.Popen | None
+    :raises SystemExit: If PostgreSQL fails to start within STARTUP_TIMEOUT seconds.
     """
     # Check Postgres installation
     check_postgres_installed()
@@ -168,14 +1009,36 @@ def start_postgres() -> subprocess.Popen:
     # Initialize data directory if necessary
     init_db()
 
-    # Start Postgres server
-    print("Starting Postgres...")
+    process = None
+
+    # Hold the registry lock until the server is ready, so a concurrent start attaches
+    # instead of launching a second server on the same directory
+    with _clients() as clients:
+        if (pid := running_postmaster_pid()) is not None:
+            print(f"Attaching to running Postgres (pid {pid})...")
+        else:
+            print("Starting Postgres...")
+
+            socket_args = []
+
+            if SOCKET_DIR:
+                os.makedirs(SOCKET_DIR, exist_ok=True)
+                os.chmod(SOCKET_DIR, 0o700)
+
+                # The server resolves relative paths against the data directory
+                socket_args = ["-k", os.path.abspath(SOCKET_DIR)]
+
+            # Own session, so the server outlives this process while others still use it
+            process = subprocess.Popen(
+                ["postgres", "-D", DATA_DIR, "-p", str(PG_PORT), *socket_args],
+                start_new_session=True,
+            )
 
-    process = subprocess.Popen(["postgres", "-D", DATA_DIR, "-p", str(PG_PORT)])
+        atexit.register(release_postgres, process)  # Ensure graceful shutdown
 
-    atexit.register(stop_postgres, process)  # Ensure graceful shutdown
+        test_postgres_connection(process)
 
-    test_postgres_connection()
+        clients.add(os.getpid())
 
     # Ensure project user and database exist
     setup_db()
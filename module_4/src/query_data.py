@@ -1,6 +1,7 @@
 """Predefined database queries for admissions data analysis."""
 
-from model import AdmissionResult, get_table
+import asyncio
+from model import AdmissionResult, get_table, register_query
 
 
 def safe_format(value, fmt: str = "{:.2f}") -> str:
@@ -17,25 +18,31 @@ def safe_format(value, fmt: str = "{:.2f}") -> str:
     return fmt.format(value)
 
 
-def answer_questions() -> list[dict]:
-    """Execute predefined queries and return formatted results.
-    
-    :returns: List of dictionaries with prompt, answer, and formatted fields.
+def _questions() -> list[dict]:
+    """Build the predefined questions.
+
+    Each has a ``name`` its statement is registered under, a ``prompt``, a ``query`` as
+    (SQL, params), an ``answer`` function picking the answer out of the result rows, and a
+    ``formatted`` function rendering that answer.
+
+    :returns: Question definitions, in display order.
     :rtype: list[dict]
-    :raises psycopg.Error: If database query fails.
     """
-    queries = [
+    return [
         {
+            "name": "fall_2025_count",
             "prompt": "How many entries do you have in your database who have applied for Fall 2025?",
-            "answer": AdmissionResult.execute_raw(
+            "query": (
                 f"SELECT COUNT(*) as count FROM {get_table()} WHERE year=%s AND season=%s;",
                 (2025, "fall"),
-            )[0]["count"],
+            ),
+            "answer": lambda rows: rows[0]["count"],
             "formatted": lambda result: f"Applicant count: {str(result)}",
         },
         {
+            "name": "international_share",
             "prompt": "What percentage of entries are from international students?",
-            "answer": AdmissionResult.execute_raw(
+            "query": (
                 f"""
                 SELECT intl_student_count * 100.0 / NULLIF(total, 0) as pct
                 FROM (
@@ -46,12 +53,14 @@ def answer_questions() -> list[dict]:
                 ) AS intl_students;
             """,
                 ["international"],
-            )[0]["pct"],
+            ),
+            "answer": lambda rows: rows[0]["pct"],
             "formatted": lambda result: f"Percent international: {safe_format(result)}%",
         },
         {
+            "name": "average_scores",
             "prompt": """What is the average GPA, GRE, GRE V, GRE AW of applicants who provide these metrics?""",
-            "answer": AdmissionResult.execute_raw(
+            "query": (
                 f"""
                 SELECT
                     AVG(gpa) as avg_gpa,
@@ -61,7 +70,8 @@ def answer_questions() -> list[dict]:
                 FROM {get_table()};
             """,
                 [],
-            )[0],
+            ),
+            "answer": lambda rows: rows[0],
             "formatted": lambda result: ', '.join([
                 f"GPA: {safe_format(result['avg_gpa'])}",
                 f"GRE: {safe_format(result['avg_gre'])}",
@@ -70,20 +80,23 @@ def answer_questions() -> list[dict]:
             ]),
         },
         {
+            "name": "american_fall_2025_gpa",
             "prompt": "What is the average GPA of American students in Fall 2025?",
-            "answer": AdmissionResult.execute_raw(
+            "query": (
                 f"""
                 SELECT AVG(gpa) as avg_gpa
                 FROM {get_table()}
                 WHERE year=%s AND season=%s AND us_or_international != %s;
             """,
                 [2025, "fall", "international"],
-            )[0]["avg_gpa"],
+            ),
+            "answer": lambda rows: rows[0]["avg_gpa"],
             "formatted": lambda result: f"Average GPA: {safe_format(result)}",
         },
         {
+            "name": "fall_2025_acceptance_rate",
             "prompt": "What percent of entries for Fall 2025 are Acceptances?",
-            "answer": AdmissionResult.execute_raw(
+            "query": (
                 f"""
                 SELECT accepted * 100.0 / NULLIF(total, 0) as pct
                 FROM (
@@ -94,36 +107,42 @@ def answer_questions() -> list[dict]:
                 ) AS fall_2025_students;
             """,
                 ["accepted", 2025, "fall"],
-            )[0]["pct"],
+            ),
+            "answer": lambda rows: rows[0]["pct"],
             "formatted": lambda result: f"Percent accepted: {safe_format(result)}%",
         },
         {
+            "name": "fall_2025_accepted_gpa",
             "prompt": "What is the average GPA of applicants who applied for Fall 2025 who are Acceptances?",
-            "answer": AdmissionResult.execute_raw(
+            "query": (
                 f"""
                 SELECT AVG(gpa) as avg_gpa
                 FROM {get_table()}
                 WHERE status=%s AND year=%s AND season=%s;
             """,
                 ["accepted", 2025, "fall"],
-            )[0]["avg_gpa"],
+            ),
+            "answer": lambda rows: rows[0]["avg_gpa"],
             "formatted": lambda result: f"Average GPA: {safe_format(result)}",
         },
         {
+            "name": "jhu_cs_masters_count",
             "prompt": "How many entries are from applicants who applied to JHU for a masters degrees in Computer Science?",
-            "answer": AdmissionResult.execute_raw(
+            "query": (
                 f"""
                 SELECT COUNT(*) as count
                 FROM {get_table()}
                 WHERE degree=%s AND llm_generated_university=%s AND llm_generated_program=%s;
             """,
                 ["masters", "Johns Hopkins University", "Computer Science"],
-            )[0]["count"],
+            ),
+            "answer": lambda rows: rows[0]["count"],
             "formatted": lambda result: f"Applicant count: {str(result)}",
         },
         {
+            "name": "georgetown_cs_phd_2025_accepted",
             "prompt": "How many entries from 2025 are acceptances from applicants who applied to Georgetown University for a PhD in Computer Science?",
-            "answer": AdmissionResult.execute_raw(
+            "query": (
                 f"""
                 SELECT COUNT(*) as count
                 FROM {get_table()}
@@ -131,12 +150,14 @@ def answer_questions() -> list[dict]:
                       AND year=%s AND status=%s;
             """,
                 ["phd", "George Town University", "Computer Science", 2025, "accepted"],
-            )[0]["count"],
+            ),
+            "answer": lambda rows: rows[0]["count"],
             "formatted": lambda result: f"Applicant count: {str(result)}",
         },
         {
+            "name": "ucla_usc_accepted_gpa",
             "prompt": "What is the average GPA for students accepted to UCLA vs USC?",
-            "answer": AdmissionResult.execute_raw(
+            "query": (
                 f"""
                 SELECT
                     AVG(gpa) FILTER (WHERE llm_generated_university=%s) as avg_gpa_ucla,
@@ -145,25 +166,29 @@ def answer_questions() -> list[dict]:
                 WHERE status=%s;
             """,
                 ["University of California, Los Angeles (Ucla)", "University of Southern California", "accepted"],
-            )[0],
+            ),
+            "answer": lambda rows: rows[0],
             "formatted": lambda result: ', '.join([
                 f"UCLA average GPA: {safe_format(result['avg_gpa_ucla'])}",
                 f"USC average GPA: {safe_format(result['avg_gpa_usc'])}",
             ]),
         },
         {
+            "name": "gre_by_year",
             "prompt": "What is the average GRE for students in the past 4 years?",
-            "answer": AdmissionResult.execute_raw(
+            "query": (
                 f"""
                 SELECT
                     AVG(gre) FILTER (WHERE year=%s) as avg_gre_2021,
                     AVG(gre) FILTER (WHERE year=%s) as avg_gre_2022,
                     AVG(gre) FILTER (WHERE year=%s) as avg_gre_2023,
                     AVG(gre) FILTER (WHERE year=%s) as avg_gre_2024
-                FROM {get_table()};
+                FROM {get_table()}
+                WHERE year BETWEEN %s AND %s;
             """,
-                [2021, 2022, 2023, 2024],
-            )[0],
+                [2021, 2022, 2023, 2024, 2021, 2024],
+            ),
+            "answer": lambda rows: rows[0],
             "formatted": lambda result: ', '.join([
                 f"2021 average GRE: {safe_format(result['avg_gre_2021'])}",
                 f"2022 average GRE: {safe_format(result['avg_gre_2022'])}",
@@ -173,7 +198,69 @@ def answer_questions() -> list[dict]:
         },
     ]
 
-    for question in queries:
-        question["formatted"] = question["formatted"](question["answer"])
 
-    return queries
+def _answer(question: dict, rows: list[dict]) -> dict:
+    """Pick and format the answer to one question.
+
+    :param question: Definition from _questions().
+    :type question: dict
+    :param rows: Result rows of the question's query.
+    :type rows: list[dict]
+    :returns: Dictionary with prompt, answer, and formatted fields.
+    :rtype: dict
+    """
+    answer = question["answer"](rows)
+
+    return {
+        "prompt": question["prompt"],
+        "answer": answer,
+        "formatted": question["formatted"](answer),
+    }
+
+
+def _registered_questions() -> list[dict]:
+    """Build the predefined questions and register their statements by name.
+
+    Registration is repeated on every call, so a changed table name takes effect.
+
+    :returns: Question definitions, in display order.
+    :rtype: list[dict]
+    """
+    questions = _questions()
+
+    for question in questions:
+        register_query(question["name"], question["query"][0])
+
+    return questions
+
+
+def answer_questions() -> list[dict]:
+    """Execute predefined queries and return formatted results.
+
+    Queries run as prepared statements by name, see AdmissionResult.execute_named().
+    
+    :returns: List of dictionaries with prompt, answer, and formatted fields.
+    :rtype: list[dict]
+    :raises psycopg.Error: If database query fails.
+    """
+    return [
+        _answer(question, AdmissionResult.execute_named(question["name"], question["query"][1]))
+        for question in _registered_questions()
+    ]
+
+
+async def answer_questions_async() -> list[dict]:
+    """Execute predefined queries concurrently over the async pool.
+
+    :returns: Same results as answer_questions().
+    :rtype: list[dict]
+    :raises psycopg.Error: If database query fails.
+    """
+    questions = _registered_questions()
+
+    results = await asyncio.gather(*(
+        AdmissionResult.execute_named_async(question["name"], question["query"][1])
+        for question in questions
+    ))
+
+    return [_answer(question, rows) for question, rows in zip(questions, results)]
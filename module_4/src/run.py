@@ -5,11 +5,41 @@ Handles PostgreSQL database initialization and JSON data loading.
 """
 
 import os
+import click
 from flask import Flask
 from blueprints.portfolio.routes import bp as portfolio
 from blueprints.grad_data.routes import bp as grad_data
 from postgres_manager import check_and_configure_postgres
 import load_data
+import model
+
+
+@click.command("slow-queries")
+@click.option("--limit", default=10, show_default=True, help="Statements to list.")
+@click.option("--plans", is_flag=True, help="Print the latest captured plan of each.")
+def slow_queries_command(limit: int, plans: bool) -> None:
+    """List the slowest statements captured in the slow-query table.
+
+    Statements are captured while DB_CAPTURE_SLOW_QUERIES is set; see
+    model.slow_query_report().
+    """
+    check_and_configure_postgres()
+
+    rows = model.slow_query_report(limit)
+
+    if not rows:
+        click.echo("No slow queries captured.")
+
+    for row in rows:
+        click.echo(
+            f"{row['total_ms']:10.1f} ms total {row['calls']:6} calls "
+            f"{row['mean_ms']:9.1f} ms mean {row['max_ms']:9.1f} ms max  {row['label'] or '-'}"
+        )
+        click.echo(f"    {row['query']}")
+
+        if plans and row["plan"]:
+            for line in row["plan"].splitlines():
+                click.echo(f"    | {line}")
 
 
 def create_app() -> Flask:
@@ -27,6 +57,9 @@ def create_app() -> Flask:
     # Register the blueprint for the graduate data analysis section.
     # This handles "/grad-data/analysis".
     app.register_blueprint(grad_data, url_prefix="/grad-data")
+
+    # Maintenance commands, e.g. "flask --app run slow-queries"
+    app.cli.add_command(slow_queries_command)
     
     return app
 
@@ -12,7 +12,7 @@ import urllib.robotparser
 
 from bs4 import BeautifulSoup
 from bs4.element import Tag
-from model import AdmissionResult
+from model import AdmissionBatch, AdmissionResult
 
 
 def _check_robots_permission(url: ParsedURL, user_agent: str) -> bool:
@@ -116,7 +116,7 @@ def scrape_page(page: int) -> tuple[list[AdmissionResult], bool]:
     return admission_results, has_more_pages
 
 
-def scrape_data(page: int, limit: int | None = None, stop_at_id: int | None = None) -> list[AdmissionResult]:
+def scrape_data(page: int, limit: int | None = None, stop_at_id: int | None = None) -> AdmissionBatch:
     """Scrape admission results from multiple pages.
     
     :param page: Starting page number.
@@ -125,14 +125,14 @@ def scrape_data(page: int, limit: int | None = None, stop_at_id: int | None = No
     :type limit: int | None
     :param stop_at_id: Stop when this ID encountered.
     :type stop_at_id: int | None
-    :returns: List of scraped admission results.
-    :rtype: list[AdmissionResult]
+    :returns: Scraped admission results, stored column-wise.
+    :rtype: AdmissionBatch
     :raises Exception: If page scraping fails.
     """
     pages_crawled = 0
     more_pages = True
 
-    admission_results: list[AdmissionResult] = []
+    admission_results = AdmissionBatch()
 
     try:
         # Start with the first page and iterate up to the limit or no more pages.
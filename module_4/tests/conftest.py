@@ -1,6 +1,6 @@
 """Test configuration and fixtures for the Grad Café analytics application."""
 
-import os
+import hashlib
 import io
 from pathlib import Path
 import pytest
@@ -8,28 +8,46 @@ from unittest.mock import MagicMock
 import threading
 import postgres_manager
 import model
+import clean
 import urllib.robotparser
 import urllib3
 import scrape
-from psycopg import sql
-
-
-test_table_name = "test_admission_results"
 
 
 def pytest_configure(config):
     """Configure pytest test session setup.
     
     Pytest hook that runs once at the start of the test session to initialize
-    the test environment. Sets up PostgreSQL database, creates necessary tables,
-    and configures environment variables for testing.
+    the test environment. Sets up PostgreSQL, builds a template database with the tables
+    created (rebuilt whenever the schema may differ, see the key below), and points the
+    session at a private clone of it, so parallel sessions never share tables.
     
     :param config: Pytest configuration object
     :type config: pytest.Config
     """
     postgres_manager.check_and_configure_postgres()
-    model.init_tables()
-    os.environ["DB_TABLE"] = test_table_name
+
+    # Everything deciding which tables init_tables() creates and how
+    schema = hashlib.sha256()
+    for source in (model, clean):
+        schema.update(Path(source.__file__).read_bytes())
+    schema.update(repr((
+        model.SCHEMA_VERSION, model.get_table(), model.use_year_partitions()
+    )).encode())
+
+    postgres_manager.build_template(model.init_tables, key=schema.hexdigest())
+    postgres_manager.use_database(postgres_manager.clone_database())
+
+
+def pytest_unconfigure(config):
+    """Drop the session's database clone.
+
+    :param config: Pytest configuration object
+    :type config: pytest.Config
+    """
+    clone = postgres_manager.PG_DB
+    postgres_manager.use_database(postgres_manager.db_config["database"])
+    postgres_manager.drop_database(clone)
 
 
 @pytest.fixture
@@ -103,6 +121,12 @@ def mock_answer_questions():
     return MOCK_QUESTIONS_DATA
 
 
+@pytest.fixture(autouse=True)
+def llm_cache():
+    """Start each test with empty LLM result caches."""
+    clean.clear_cache(persistent=True)
+
+
 @pytest.fixture
 def mock_llm(mocker):
     """Patch `clean._load_llm` to return a mock LLM."""
@@ -119,35 +143,46 @@ def mock_llm(mocker):
 
 @pytest.fixture
 def empty_table(mocker):
-    """Create an empty table with the same schema as admission_result."""
-    from model import DB_TABLE
-
-    create_table_sql = sql.SQL("""
-        CREATE TABLE IF NOT EXISTS {} 
-        (LIKE {} INCLUDING ALL);
-        TRUNCATE TABLE {} RESTART IDENTITY;
-    """).format(
-        sql.Identifier(test_table_name),
-        sql.Identifier(DB_TABLE),
-        sql.Identifier(test_table_name),
-    )
-
+    """Create empty admissions tables in the session's database."""
     try:
-        with postgres_manager.get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(create_table_sql)
-            conn.commit()
+        model.drop_tables()
+        model.init_tables()
 
-        yield test_table_name
+        yield model.get_table()
 
     finally:
         # Cleanup after test
-        with postgres_manager.get_connection() as conn:
-            with conn.cursor() as cur:
-                query = sql.SQL("DROP TABLE IF EXISTS {};").format(sql.Identifier(test_table_name))
+        model.drop_tables()
+
+
+@pytest.fixture
+def read_replica(monkeypatch):
+    """Route reads to a second, empty database standing in for a read replica."""
+    from psycopg import sql
+
+    replica = f"{postgres_manager.PG_DB}_replica"
+    name = sql.Identifier(replica)
+
+    with postgres_manager.get_connection() as conn:
+        conn.autocommit = True
+        conn.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE);").format(name))
+        conn.execute(sql.SQL("CREATE DATABASE {};").format(name))
 
-                cur.execute(query)
-            conn.commit()
+    postgres_manager.close_pool()
+    monkeypatch.setattr(
+        postgres_manager, "read_db_config", {**postgres_manager.db_config, "database": replica}
+    )
+    monkeypatch.setattr(postgres_manager, "_last_write", None)
+
+    try:
+        yield replica
+
+    finally:
+        postgres_manager.close_pool()
+
+        with postgres_manager.get_connection() as conn:
+            conn.autocommit = True
+            conn.execute(sql.SQL("DROP DATABASE {} WITH (FORCE);").format(name))
 
 
 @pytest.fixture
@@ -267,3 +267,74 @@ def test_call_llm_partial_json_extraction(mock_normalize, mock_load_llm):
         "standardized_program": "Mathematics",
         "standardized_university": "Stanford University",
     }
+
+
+@pytest.mark.db
+@patch("clean._load_llm")
+def test_call_llm_cached(mock_load_llm, monkeypatch):
+    """Test repeated inputs are answered from memory, then from the cache table."""
+    import clean
+
+    mock_load_llm.return_value.create_chat_completion.return_value = {
+        "choices": [{"message": {"content": '{"standardized_program": "Mathematics",'
+                                            '"standardized_university": "Stanford University"}'}}]
+    }
+
+    first = call_llm("Math, Stanford")
+    assert call_llm("  math,   STANFORD ") == first
+    assert mock_load_llm.call_count == 1
+
+    # Results outlive the process through the table
+    clean.clear_cache()
+    assert call_llm("Math, Stanford") == first
+    assert mock_load_llm.call_count == 1
+
+    stats = clean.cache_stats()
+    assert (stats["memory_hits"], stats["table_hits"], stats["misses"]) == (0, 1, 0)
+    assert stats["hit_rate"] == 1.0
+
+    # Rows of another cleaner version are ignored
+    monkeypatch.setattr(clean, "CLEANER_VERSION", "other")
+    clean.clear_cache()
+    call_llm("Math, Stanford")
+    assert mock_load_llm.call_count == 2
+
+    # A small in-process cache evicts the least recently used entry
+    monkeypatch.setattr(clean, "LLM_CACHE_SIZE", 1)
+    call_llm("Physics, MIT")
+    assert clean.cache_stats()["memory_size"] == 1
+
+    # Table errors degrade to misses rather than failing the call
+    monkeypatch.setattr(clean, "LLM_CACHE_TABLE", "missing_table")
+    clean.clear_cache()
+    assert call_llm("Math, Stanford") == first
+    assert clean.cache_stats()["misses"] == 1
+
+
+@pytest.mark.db
+@patch("clean._load_llm")
+def test_call_llm_fast_path(mock_load_llm):
+    """Test close canonical matches skip inference and are counted."""
+    import clean
+
+    assert call_llm("computer science, stanford university") == {
+        "standardized_program": "Computer Science",
+        "standardized_university": "Stanford University",
+    }
+    assert call_llm("Computer Sciences @ UBC") == {
+        "standardized_program": "Computer Science",
+        "standardized_university": "University of British Columbia",
+    }
+    mock_load_llm.assert_not_called()
+
+    # Unknown universities and loose matches still go to the model
+    mock_load_llm.return_value.create_chat_completion.return_value = {
+        "choices": [{"message": {"content": "not json"}}]
+    }
+    call_llm("Computer Science")
+    call_llm("Math, Stanford")
+    assert mock_load_llm.call_count == 2
+
+    stats = clean.cache_stats()
+    assert (stats["misses"], stats["fast_path"]) == (4, 2)
+    assert stats["fast_path_rate"] == 0.5
@@ -1,7 +1,10 @@
 """Tests for database writes and query operations."""
 
+import asyncio
 import pytest
-from model import AdmissionResult, get_table
+from model import AdmissionBatch, AdmissionResult, get_table, query_stats
+from query_data import answer_questions, answer_questions_async
+import postgres_manager
 
 
 # a. Test insert on pull
@@ -61,3 +64,29 @@ def test_simple_query_function_returns_expected_dict(client, mock_scrape):
     assert "gpa" in row
     assert "year" in row
     assert "status" in row
+
+
+@pytest.mark.db
+def test_answer_questions_async_matches_sync(empty_table):
+    """Test that the concurrent question runner gives the same answers."""
+    # Seeded directly: mock_scrape runs threads inline, which the async DNS lookup needs
+    with postgres_manager.connection() as conn:
+        with conn.cursor() as cursor:
+            AdmissionResult.save_many(cursor, AdmissionBatch.from_dicts([
+                {"id": 1, "school": "MIT", "season": "fall", "year": 2025, "gpa": 3.5,
+                 "decision_status": "accepted", "applicant_region": "international"},
+                {"id": 2, "school": "MIT", "season": "fall", "year": 2024, "gre_general": 320},
+            ]))
+
+    async def run():
+        try:
+            return await answer_questions_async()
+        finally:
+            await postgres_manager.close_async_pool()
+
+    assert asyncio.run(run()) == answer_questions()
+
+    # Both runners go through the named statements
+    stats = {row["name"]: row["calls"] for row in query_stats()}
+    assert len(stats) >= 10
+    assert stats["fall_2025_count"] >= 2
@@ -2,6 +2,8 @@
 
 import pytest
 from bs4 import BeautifulSoup
+import model
+import postgres_manager
 
 
 # a. Test app factory / Config: Assert a testable Flask app is created with required routes (e.g.
@@ -33,6 +35,9 @@ def test_required_routes_registered(app):
         "/contact",  # Portfolio contact
         "/projects",  # Portfolio projects
         "/grad-data/analysis",  # Analysis page
+        "/grad-data/search",  # Comment search
+        "/grad-data/autocomplete",  # School/program suggestions
+        "/grad-data/cancel/<request_id>",  # Query cancellation
     ]
 
     for route in required_routes:
@@ -97,3 +102,88 @@ def test_grad_data_route(client, mocker, mock_answer_questions, empty_table):
     page_text = response.get_data(as_text=True)
     answer_count = page_text.count("A:")
     assert answer_count >= 1, "Page should contain at least one 'Answer:' label"
+
+
+@pytest.mark.web
+def test_search_route_pages_results(client, empty_table):
+    """Test that "/grad-data/search" returns ranked JSON results with a next cursor."""
+    with postgres_manager.get_connection() as conn:
+        with conn.cursor() as cur:
+            model.AdmissionResult.save_many(cur, model.AdmissionBatch.from_dicts(
+                {"id": i, "comments": f"funding offer {i}"} for i in range(1, 4)
+            ))
+
+    response = client.get("/grad-data/search?q=funding&limit=2")
+    assert response.status_code == 200
+    page = response.get_json()
+    assert [r["p_id"] for r in page["results"]] == [3, 2]
+    assert page["next"]
+
+    response = client.get(f"/grad-data/search?q=funding&limit=2&after={page['next']}")
+    page = response.get_json()
+    assert [r["p_id"] for r in page["results"]] == [1]
+    assert page["next"] is None
+
+
+@pytest.mark.web
+@pytest.mark.parametrize("query", ["", "?q=%20", "?q=x&limit=ten", "?q=x&after=1.5",
+                                   "?q=x&after=nan:1", "?q=x&after=inf:1"])
+def test_search_route_rejects_bad_parameters(client, query):
+    """Test that "/grad-data/search" answers 400 for missing terms or bad paging."""
+    response = client.get(f"/grad-data/search{query}")
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+@pytest.mark.web
+def test_autocomplete_route_suggests_names(client, empty_table):
+    """Test that "/grad-data/autocomplete" returns matching names for a field."""
+    model.get_dimension_cache("programs").resolve(["Computer Science", "Physics"])
+
+    response = client.get("/grad-data/autocomplete?field=program&q=comp")
+    assert response.status_code == 200
+    assert [m["name"] for m in response.get_json()["matches"]] == ["Computer Science"]
+
+
+@pytest.mark.web
+@pytest.mark.parametrize("query", ["?field=term&q=x", "?q=x&limit=all"])
+def test_autocomplete_route_rejects_bad_parameters(client, query):
+    """Test that "/grad-data/autocomplete" answers 400 for unknown fields or limits."""
+    response = client.get(f"/grad-data/autocomplete{query}")
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+@pytest.mark.web
+def test_routes_cancel_and_time_out_queries(client, empty_table, mocker):
+    """Test request-scoped cancellation and the 503 answer for canceled queries."""
+    import psycopg
+
+    def search(text, limit, after, timeout):
+        assert timeout == 5000
+        assert client.post("/grad-data/cancel/req-1").get_json() == {"canceled": True}
+        with postgres_manager.connection() as conn:
+            conn.execute("SELECT 1;")
+
+    mocker.patch("model.AdmissionResult.search", side_effect=search)
+
+    response = client.get("/grad-data/search?q=funding", headers={"X-Request-ID": "req-1"})
+    assert response.status_code == 503
+    assert response.get_json() == {"error": "Query timed out or was canceled"}
+
+    assert client.post("/grad-data/cancel/req-1").get_json() == {"canceled": False}
+
+    mocker.patch("model.fuzzy_lookup", side_effect=psycopg.errors.QueryCanceled())
+    response = client.get("/grad-data/autocomplete?q=comp")
+    assert response.status_code == 503
+
+    # The dashboard's queries are cancelable too, and it answers with a page
+    def answer_questions():
+        assert postgres_manager._cancel_key.get() == "req-3"
+        raise psycopg.errors.QueryCanceled()
+
+    mocker.patch("blueprints.grad_data.routes.answer_questions", side_effect=answer_questions)
+    response = client.get("/grad-data/analysis", headers={"X-Request-ID": "req-3"})
+    assert response.status_code == 503
+    assert response.mimetype == "text/html"
+    assert b"timed out or were canceled" in response.data
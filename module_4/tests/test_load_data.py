@@ -1,15 +1,33 @@
 """Tests for the load_data module."""
 
 import pytest
+from pathlib import Path
 from load_data import load_admissions_results
 from model import AdmissionResult
 
+FIXTURE = Path(__file__).parent / "fixture_data" / "admissions_sample.json"
+
 
 @pytest.mark.db
 def test_load_admissions_results_success(empty_table):
     """Test successful loading of admissions results."""
-    load_admissions_results("src/admissions_info.json")
+    load_admissions_results(FIXTURE)
+
+    assert AdmissionResult.count() == 3
+
 
-    assert AdmissionResult.count() > 0
 
 
+@pytest.mark.db
+def test_load_admissions_results_bulk(empty_table, monkeypatch, capsys):
+    """Test that a bulk load through the staging table loads, analyzes and reports its rate."""
+    monkeypatch.setenv("DB_BULK_LOAD", "yes")
+    load_admissions_results(FIXTURE, staging=True)
+
+    assert AdmissionResult.count() == 3
+    assert "rows/s, bulk=True, staging=True" in capsys.readouterr().out
+
+    rows = AdmissionResult.execute_raw(
+        "SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s);", [f"{empty_table}_data"]
+    )
+    assert rows == [{"reltuples": 3}]
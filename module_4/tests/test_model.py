@@ -1,7 +1,12 @@
 """Tests for data model and HTML parsing functionality."""
 
+import asyncio
 import pytest
 from datetime import datetime
+import model
+import postgres_manager
+import psycopg
+from psycopg import sql
 from model import _decision_from_soup, _tags_from_soup
 
 
@@ -52,3 +57,895 @@ def test_tags_from_soup_full():
     assert result["gre_general"] == 320
     assert result["gre_verbal"] == 160
     assert result["gre_analytical_writing"] == 3.5
+
+
+# ------------------------
+# sync_indexes
+# ------------------------
+
+
+def _index_names(table: str) -> set[str]:
+    rows = model.AdmissionResult.execute_raw(
+        "SELECT indexname FROM pg_indexes WHERE tablename = %s;", [table]
+    )
+    return {row["indexname"] for row in rows}
+
+
+@pytest.mark.db
+def test_sync_indexes_creates_versioned_set(empty_table):
+    """Test that every managed index is created and a second run is a no-op."""
+    model.sync_indexes()
+    model.sync_indexes()
+
+    names = _index_names(model.get_data_table())
+    for suffix in model.INDEXES:
+        assert f"{model.get_data_table()}_{suffix}_v{model.INDEX_VERSION}" in names
+
+
+@pytest.mark.db
+def test_sync_indexes_replaces_old_version(empty_table, monkeypatch):
+    """Test that bumping INDEX_VERSION drops the previous set."""
+    model.sync_indexes()
+
+    monkeypatch.setattr(model, "INDEX_VERSION", model.INDEX_VERSION + 1)
+    model.sync_indexes()
+
+    names = _index_names(model.get_data_table())
+    for suffix in model.INDEXES:
+        assert f"{model.get_data_table()}_{suffix}_v{model.INDEX_VERSION - 1}" not in names
+        assert f"{model.get_data_table()}_{suffix}_v{model.INDEX_VERSION}" in names
+
+
+@pytest.mark.db
+def test_sync_indexes_keeps_unmanaged(empty_table, monkeypatch):
+    """Test that hand-made indexes survive while retired managed ones are dropped."""
+    data = model.get_data_table()
+    with postgres_manager.get_connection() as conn:
+        conn.execute(sql.SQL("CREATE INDEX {} ON {} (gpa);").format(
+            sql.Identifier(f"{data}_my_idx_v2"), sql.Identifier(data)
+        ))
+        conn.execute(sql.SQL("CREATE INDEX {} ON {} (gre);").format(
+            sql.Identifier(f"{data}_old_v1"), sql.Identifier(data)
+        ))
+
+    monkeypatch.setattr(model, "RETIRED_INDEXES", ("old",))
+    model.sync_indexes()
+
+    names = _index_names(data)
+    assert f"{data}_my_idx_v2" in names
+    assert f"{data}_old_v1" not in names
+
+
+# ------------------------
+# dimension tables
+# ------------------------
+
+
+@pytest.mark.db
+def test_init_tables_migrates_legacy_table(empty_table):
+    """Test that a plain admissions table from an older version is migrated into the view."""
+    model.drop_tables()
+
+    with postgres_manager.get_connection() as conn:
+        conn.execute(sql.SQL("""
+            CREATE TABLE {} (
+                p_id INTEGER PRIMARY KEY, school TEXT, program_name TEXT, program TEXT,
+                comments TEXT, date_added DATE, url TEXT, status TEXT, decision_date DATE,
+                season TEXT, year INTEGER, term TEXT, us_or_international TEXT, gpa FLOAT,
+                gre FLOAT, gre_v FLOAT, gre_aw FLOAT, degree TEXT,
+                llm_generated_program TEXT, llm_generated_university TEXT
+            );
+        """).format(sql.Identifier(empty_table)))
+        conn.execute(sql.SQL("""
+            INSERT INTO {} (p_id, school, program_name, program, status, year,
+                            llm_generated_program, llm_generated_university)
+            VALUES (1, 'JHU', 'CS', 'JHU CS', 'accepted', 2025,
+                    'Computer Science', 'Johns Hopkins University');
+        """).format(sql.Identifier(empty_table)))
+
+    model.init_tables()
+
+    rows = model.AdmissionResult.execute_raw(f"SELECT * FROM {empty_table};", [])
+    assert len(rows) == 1
+    assert rows[0]["school"] == "JHU"
+    assert rows[0]["program"] == "JHU CS"
+    assert rows[0]["llm_generated_university"] == "Johns Hopkins University"
+
+
+@pytest.mark.db
+def test_dimension_cache_resolves_once(empty_table, mocker):
+    """Test that names are inserted once and then served from memory."""
+    cache = model.get_dimension_cache("schools")
+    cache.resolve(["JHU", "MIT", None, "JHU"])
+
+    assert cache.get(None) is None
+    assert cache.get("JHU") != cache.get("MIT")
+
+    spy = mocker.spy(model.postgres_manager, "connection")
+    cache.resolve(["MIT", "JHU"])
+    spy.assert_not_called()
+
+    assert model.get_dimension_cache("schools") is cache
+
+
+def _result(**values) -> model.AdmissionResult:
+    return model.AdmissionResult.from_dict({
+        "id": 1, "school": "MIT", "program_name": "Physics", "degree_type": "phd",
+        "added_on": "2025-01-02", "decision_status": "accepted", "decision_date": None,
+        "season": "fall", "year": 2025, "applicant_region": "american", "gre_general": None,
+        "gre_verbal": None, "gre_analytical_writing": None, "gpa": 3.9, "comments": "",
+        "full_info_url": "/result/1", "llm_generated_program": "Physics",
+        "llm_generated_university": "Massachusetts Institute of Technology",
+        **values,
+    })
+
+
+def _save(results: list[model.AdmissionResult]) -> None:
+    with postgres_manager.get_connection() as conn:
+        with conn.cursor() as cur:
+            model.AdmissionResult.save_many(cur, results)
+
+
+@pytest.mark.db
+def test_save_to_db_single_row(empty_table):
+    """Test that a single result round-trips through the dimension tables."""
+    result = _result(id=7)
+
+    with postgres_manager.get_connection() as conn:
+        with conn.cursor() as cur:
+            result.save_to_db(cur)
+
+    row = model.AdmissionResult.execute_raw(f"SELECT * FROM {empty_table};", [])[0]
+    assert row["p_id"] == 7
+    assert row["program"] == "MIT Physics"
+    assert row["term"] == "fall 2025"
+
+    # Both are derived by the view rather than stored
+    columns = model.AdmissionResult.execute_raw(
+        "SELECT column_name FROM information_schema.columns WHERE table_name = %s;",
+        [model.get_data_table()],
+    )
+    assert not {"program", "program_id", "term"} & {c["column_name"] for c in columns}
+
+
+# ------------------------
+# enum columns
+# ------------------------
+
+
+@pytest.mark.db
+def test_to_db_enum_mapping():
+    """Test label mapping, OTHER fallback and missing values."""
+    assert model.to_db_enum(model.DecisionStatus, "accepted") == "accepted"
+    assert model.to_db_enum(model.DecisionStatus, model.DecisionStatus.REJECTED) == "rejected"
+    assert model.to_db_enum(model.DegreeType, "mstat") == "other"
+    assert model.to_db_enum(model.SchoolSeason, "autumn") is None
+    assert model.to_db_enum(model.SchoolRegion, False) is None
+
+
+@pytest.mark.db
+def test_init_tables_converts_text_columns(empty_table):
+    """Test that TEXT status/degree columns from an older schema become enums."""
+    with postgres_manager.get_connection() as conn:
+        conn.execute(sql.SQL("DROP VIEW {};").format(sql.Identifier(empty_table)))
+        model._drop_managed_indexes(conn.cursor())
+        conn.execute(sql.SQL("""
+            ALTER TABLE {data} ALTER COLUMN status TYPE TEXT, ALTER COLUMN degree TYPE TEXT;
+            INSERT INTO {data} (p_id, status, degree) VALUES (1, 'accepted', 'mstat');
+        """).format(data=sql.Identifier(model.get_data_table())))
+
+    model.init_tables()
+
+    rows = model.AdmissionResult.execute_raw(
+        f"SELECT status, degree, pg_typeof(status)::text AS type FROM {empty_table};", []
+    )
+    assert rows == [{"status": "accepted", "degree": "other", "type": "admission_status"}]
+
+    # Filters written against the old TEXT columns keep working
+    rows = model.AdmissionResult.execute_raw(
+        f"SELECT COUNT(*) AS count FROM {empty_table} WHERE status=%s;", ["accepted"]
+    )
+    assert rows[0]["count"] == 1
+
+
+# ------------------------
+# year partitioning
+# ------------------------
+
+
+@pytest.fixture
+def partitioned_table(empty_table, monkeypatch):
+    """Recreate the test tables with year partitioning enabled."""
+    monkeypatch.setenv("DB_PARTITION_BY_YEAR", "1")
+    model.drop_tables()
+    model.init_tables()
+
+    yield empty_table
+
+    with postgres_manager.get_connection() as conn:
+        conn.execute(sql.SQL("DROP TABLE IF EXISTS {};").format(
+            sql.Identifier(f"{model.get_data_table()}_y2024")
+        ))
+
+
+@pytest.mark.db
+def test_partitioned_save_creates_partitions(partitioned_table):
+    """Test that ingest creates one partition per year, including NULL years."""
+    _save([_result(id=1, year=2024), _result(id=2, year=2025), _result(id=3, year=None)])
+    # A row whose year changed moves to the new partition instead of being duplicated
+    _save([_result(id=1, year=2025)])
+
+    rows = model.AdmissionResult.execute_raw(
+        f"SELECT tableoid::regclass::text AS part, p_id FROM {model.get_data_table()} "
+        "ORDER BY p_id;", []
+    )
+    data = model.get_data_table()
+    assert [(r["part"], r["p_id"]) for r in rows] == [
+        (f"{data}_y2025", 1), (f"{data}_y2025", 2), (f"{data}_ynull", 3),
+    ]
+    assert model.AdmissionResult.count() == 3
+
+    # Queries through the view only touch the matching partition
+    plan = model.AdmissionResult.execute_raw(
+        f"EXPLAIN SELECT COUNT(*) FROM {partitioned_table} WHERE year=%s;", [2025]
+    )
+    plan_text = "\n".join(row["QUERY PLAN"] for row in plan)
+    assert f"{data}_y2025" in plan_text
+    assert f"{data}_ynull" not in plan_text
+
+
+@pytest.mark.db
+def test_partitions_created_in_caller_transaction(partitioned_table):
+    """Test that new partitions share the caller's transaction and roll back with it."""
+    with postgres_manager.get_connection() as conn:
+        with conn.cursor() as cur:
+            # Two new years in one open transaction must not wait on each other
+            _result(id=1, year=2020).save_to_db(cur)
+            _result(id=2, year=2021).save_to_db(cur)
+
+    data = model.get_data_table()
+    assert model.AdmissionResult.count() == 2
+
+    with postgres_manager.get_connection() as conn:
+        with conn.cursor() as cur:
+            _result(id=3, year=2022).save_to_db(cur)
+        conn.rollback()
+
+    _save([_result(id=3, year=2022)])
+    assert model.AdmissionResult.count() == 3
+    assert {r["part"] for r in model.AdmissionResult.execute_raw(
+        f"SELECT tableoid::regclass::text AS part FROM {data};", []
+    )} == {f"{data}_y2020", f"{data}_y2021", f"{data}_y2022"}
+
+
+@pytest.mark.db
+def test_partitioned_save_through_staging(partitioned_table):
+    """Test that the staging path upserts like the direct one, twice in one transaction."""
+    _save([_result(id=1, year=2024, gpa=3.0)])
+
+    with postgres_manager.get_connection() as conn:
+        with conn.cursor() as cur:
+            batch = [_result(id=1, year=2025), _result(id=2), _result(id=2, gpa=3.5)]
+            model.AdmissionResult.save_many(cur, batch, staging=True)
+            model.AdmissionResult.save_many(cur, [_result(id=3, year=None)], staging=True)
+
+    rows = model.AdmissionResult.execute_raw(
+        f"SELECT p_id, year, gpa FROM {partitioned_table} ORDER BY p_id;", []
+    )
+    assert rows == [
+        {"p_id": 1, "year": 2025, "gpa": 3.9},
+        {"p_id": 2, "year": 2025, "gpa": 3.5},
+        {"p_id": 3, "year": None, "gpa": 3.9},
+    ]
+
+
+@pytest.mark.db
+def test_partitioned_indexes_and_detach(partitioned_table):
+    """Test that managed indexes exist on partitions and a year can be detached."""
+    _save([_result(id=1, year=2024), _result(id=2, year=2025)])
+    model.sync_indexes()
+
+    assert _index_names(f"{model.get_data_table()}_y2024")
+
+    assert model.detach_year_partition(2024) == f"{model.get_data_table()}_y2024"
+    assert model.AdmissionResult.count() == 1
+
+
+@pytest.mark.db
+def test_partitioning_ignored_for_existing_table(empty_table, monkeypatch, capsys):
+    """Test that an existing unpartitioned table is left as is."""
+    monkeypatch.setenv("DB_PARTITION_BY_YEAR", "true")
+    model.init_tables()
+
+    assert "is not partitioned" in capsys.readouterr().out
+    _save([_result(id=1)])
+    assert model.AdmissionResult.count() == 1
+
+
+@pytest.mark.db
+def test_partitioned_legacy_migration(empty_table, monkeypatch):
+    """Test that a legacy table is migrated into year partitions."""
+    model.drop_tables()
+    monkeypatch.setenv("DB_PARTITION_BY_YEAR", "1")
+
+    with postgres_manager.get_connection() as conn:
+        conn.execute(sql.SQL("""
+            CREATE TABLE {} (
+                p_id INTEGER PRIMARY KEY, school TEXT, program_name TEXT, program TEXT,
+                comments TEXT, date_added DATE, url TEXT, status TEXT, decision_date DATE,
+                season TEXT, year INTEGER, term TEXT, us_or_international TEXT, gpa FLOAT,
+                gre FLOAT, gre_v FLOAT, gre_aw FLOAT, degree TEXT,
+                llm_generated_program TEXT, llm_generated_university TEXT
+            );
+            INSERT INTO {} (p_id, year) VALUES (1, 2023), (2, NULL);
+        """).format(sql.Identifier(empty_table), sql.Identifier(empty_table)))
+
+    model.init_tables()
+
+    assert model.AdmissionResult.count() == 2
+
+
+# ------------------------
+# iter_where
+# ------------------------
+
+
+@pytest.mark.db
+def test_iter_where_streams_matching_rows(empty_table):
+    """Test filtering, ID ordering and conversion back to AdmissionResult."""
+    _save([
+        _result(id=3, decision_status="rejected"),
+        _result(id=1),
+        _result(id=2, year=2024, llm_generated_university=None),
+    ])
+
+    results = list(model.AdmissionResult.iter_where({"year": 2025}, batch_size=1))
+    assert [r.id for r in results] == [1, 3]
+    assert isinstance(results[0], model.AdmissionResult)
+    assert results[0].llm_generated_university == "Massachusetts Institute of Technology"
+
+    rows = list(model.AdmissionResult.iter_where(
+        {"status": ["accepted", "interview"], "llm_generated_university": None},
+        as_tuples=True,
+    ))
+    assert [row[0] for row in rows] == [2]
+
+    assert len(list(model.AdmissionResult.iter_where())) == 3
+
+
+@pytest.mark.db
+def test_iter_where_leaves_pool_alone(empty_table):
+    """Test that interleaved, abandoned iterators neither clash nor hold pool connections."""
+    _save([_result(id=1), _result(id=2), _result(id=3)])
+    postgres_manager.close_pool()
+
+    first = model.AdmissionResult.iter_where(batch_size=1)
+    second = model.AdmissionResult.iter_where(batch_size=1)
+    assert [next(first).id, next(second).id, next(first).id] == [1, 1, 2]
+
+    assert model.AdmissionResult.count(exact=True) == 3
+    stats = postgres_manager.pool_stats()
+    assert stats["pool_available"] == stats["pool_size"]
+
+    first.close()
+    second.close()
+
+
+@pytest.mark.db
+def test_iter_where_enum_labels(empty_table):
+    """Test that enum filters accept members and match nothing for unknown labels."""
+    _save([_result(id=1), _result(id=2, decision_status="rejected")])
+
+    assert list(model.AdmissionResult.iter_where({"status": "bogus"})) == []
+    assert list(model.AdmissionResult.iter_where({"status": ["bogus", None]})) == []
+
+    results = model.AdmissionResult.iter_where({"status": model.DecisionStatus.REJECTED})
+    assert [r.id for r in results] == [2]
+
+    rows = model.AdmissionResult.execute_raw(
+        f"SELECT p_id FROM {empty_table} WHERE status::text ILIKE %s;", ["ACC%"]
+    )
+    assert rows == [{"p_id": 1}]
+
+
+@pytest.mark.db
+def test_iter_where_unknown_column(empty_table):
+    """Test that filters are restricted to view columns."""
+    with pytest.raises(ValueError):
+        list(model.AdmissionResult.iter_where({"1=1; --": 1}))
+
+
+# ------------------------
+# AdmissionBatch
+# ------------------------
+
+
+@pytest.mark.db
+def test_admission_batch_round_trip():
+    """Test that rows survive columnar storage, including missing values."""
+    first = _result(id=1, gre_general=320, gre_analytical_writing=4.5)
+    second = _result(id=2, added_on=None, year=None, gpa=None, school="JHU")
+
+    batch = model.AdmissionBatch.from_results([first, second])
+
+    assert len(batch) == 2
+    assert list(batch) == [first, second]
+    assert isinstance(batch[0].gre_general, int)
+    assert batch.values("year") == [2025, None]
+    assert batch.values("added_on") == [datetime(2025, 1, 2), None]
+    assert batch.values("school") == ["MIT", "JHU"]
+
+    second.gpa = 3.1
+    batch[1] = second
+    assert batch[1].gpa == 3.1
+
+
+@pytest.mark.db
+def test_admission_batch_from_dicts():
+    """Test that dictionaries load like AdmissionResult.from_dict()."""
+    entries = [
+        {"id": 3, "school": "MIT", "added_on": "2025-01-02", "decision_date": "2025-02-03"},
+        {"id": 4, "added_on": "", "gpa": 3.2},
+        {"id": 5, "added_on": "2025-09-17T00:00:00", "year": 2024, "gre_general": None},
+    ]
+
+    batch = model.AdmissionBatch.from_dicts(entries)
+
+    assert list(batch) == [
+        model.AdmissionResult.from_dict({field: entry.get(field) for field in model.BATCH_COLUMNS})
+        for entry in entries
+    ]
+    assert batch[1].added_on is None
+
+
+@pytest.mark.db
+@pytest.mark.filterwarnings("error")
+def test_admission_batch_from_dicts_ignores_offsets():
+    """Test that UTC offsets don't shift the stored day away from from_dict()'s."""
+    entry = {"id": 1, "added_on": "2025-09-17T00:00:00+05:00", "decision_date": "2025-09-18"}
+
+    batch = model.AdmissionBatch.from_dicts([entry])
+
+    assert batch[0].added_on == datetime(2025, 9, 17)
+    expected = model.AdmissionResult.from_dict(
+        {field: entry.get(field) for field in model.BATCH_COLUMNS}
+    )
+    assert batch[0].added_on.date() == expected.added_on.date()
+    assert batch[0].decision_date == datetime(2025, 9, 18)
+
+
+@pytest.mark.db
+def test_admission_batch_cleans_distinct_inputs_once(mocker):
+    """Test that rows sharing a program and school are cleaned by one call."""
+    call_llm = mocker.patch("clean.call_llm", side_effect=lambda text: {
+        "standardized_program": text.split(",")[0].strip().title(),
+        "standardized_university": text.split(",")[1].strip().upper(),
+    })
+    batch = model.AdmissionBatch.from_results([
+        _result(id=1, program_name="cs", school="mit"),
+        _result(id=2, program_name="Physics", school="JHU"),
+        _result(id=3, program_name="CS", school="MIT"),
+        _result(id=4, program_name="cs", school="mit"),
+    ])
+
+    assert batch.clean_and_augment() == 2
+    assert call_llm.call_count == 2
+    assert batch.values("llm_generated_program") == ["Cs", "Physics", "Cs", "Cs"]
+    assert batch.values("llm_generated_university") == ["MIT", "JHU", "MIT", "MIT"]
+
+    # A single row cleans the same way
+    row = batch[1]
+    row.clean_and_augment()
+    assert (row.llm_generated_program, row.llm_generated_university) == ("Physics", "JHU")
+
+
+@pytest.mark.db
+def test_admission_result_has_no_instance_dict():
+    """Test that results use slots instead of a per-instance dict."""
+    assert not hasattr(_result(), "__dict__")
+
+
+@pytest.mark.db
+def test_save_many_accepts_batch(empty_table):
+    """Test saving a batch directly."""
+    batch = model.AdmissionBatch()
+    batch.extend([_result(id=1), _result(id=2, year=None, decision_status="wait listed")])
+
+    _save(batch)
+
+    rows = model.AdmissionResult.execute_raw(
+        f"SELECT p_id, year, status FROM {empty_table} ORDER BY p_id;", []
+    )
+    assert [(r["p_id"], r["year"], r["status"]) for r in rows] == [
+        (1, 2025, "accepted"), (2, None, "other"),
+    ]
+
+
+@pytest.mark.db
+def test_save_many_last_duplicate_wins(empty_table):
+    """Test that a batch repeating an id stores its last row."""
+    _save([_result(id=1, gpa=3.0), _result(id=2), _result(id=1, gpa=3.5, added_on=None)])
+
+    rows = model.AdmissionResult.execute_raw(
+        f"SELECT p_id, gpa, date_added FROM {empty_table} ORDER BY p_id;", []
+    )
+    assert [(r["p_id"], r["gpa"], r["date_added"]) for r in rows] == [
+        (1, 3.5, None), (2, 3.9, datetime(2025, 1, 2).date()),
+    ]
+
+
+# ------------------------
+# table stats
+# ------------------------
+
+
+def _stats_match_exact() -> bool:
+    return (
+        model.AdmissionResult.count() == model.AdmissionResult.count(exact=True)
+        and model.AdmissionResult.get_latest_id()
+        == model.AdmissionResult.get_latest_id(exact=True)
+    )
+
+
+@pytest.mark.db
+def test_stats_track_writes(empty_table):
+    """Test that the stats row follows inserts, upserts, deletes and truncation."""
+    assert model.get_stats()["row_count"] == 0
+    assert model.AdmissionResult.get_latest_id() is None
+
+    _save([_result(id=5), _result(id=9)])
+    stamp = model.get_stats()["last_modified"]
+    assert model.AdmissionResult.count() == 2
+    assert model.AdmissionResult.get_latest_id() == 9
+
+    _save([_result(id=9, gpa=3.0), _result(id=12)])
+    assert model.AdmissionResult.count() == 3
+    assert model.get_stats()["last_modified"] > stamp
+
+    with postgres_manager.get_connection() as conn:
+        conn.execute(sql.SQL("DELETE FROM {} WHERE p_id = 12;").format(
+            sql.Identifier(model.get_data_table())
+        ))
+        conn.execute(sql.SQL("UPDATE {} SET p_id = 1 WHERE p_id = 9;").format(
+            sql.Identifier(model.get_data_table())
+        ))
+        conn.execute(sql.SQL("DELETE FROM {} WHERE p_id = 404;").format(
+            sql.Identifier(model.get_data_table())
+        ))
+    assert model.AdmissionResult.count() == 2
+    assert model.AdmissionResult.get_latest_id() == 5
+    assert _stats_match_exact()
+
+    with postgres_manager.get_connection() as conn:
+        conn.execute(sql.SQL("TRUNCATE {};").format(sql.Identifier(model.get_data_table())))
+    assert model.AdmissionResult.count() == 0
+    assert model.AdmissionResult.get_latest_id() is None
+
+
+@pytest.mark.db
+def test_stats_fallback_and_refresh(empty_table):
+    """Test the exact fallback and recomputing stats from the data table."""
+    _save([_result(id=3)])
+
+    with postgres_manager.get_connection() as conn:
+        conn.execute(sql.SQL("DELETE FROM {};").format(sql.Identifier(model.get_stats_table())))
+
+    assert model.get_stats() is None
+    assert model.AdmissionResult.count() == 1
+    assert model.AdmissionResult.get_latest_id() == 3
+
+    model.init_tables()
+    assert model.get_stats()["row_count"] == 1
+
+    with postgres_manager.get_connection() as conn:
+        conn.execute(sql.SQL("UPDATE {} SET row_count = 40;").format(
+            sql.Identifier(model.get_stats_table())
+        ))
+
+    model.refresh_stats()
+    assert _stats_match_exact()
+
+
+# ------------------------
+# comment search
+# ------------------------
+
+
+@pytest.mark.db
+def test_search_ranks_and_pages(empty_table):
+    """Test ranking, highlighting and keyset pagination of comment search."""
+    _save([
+        _result(id=1, comments="Funding offered, great funding package"),
+        _result(id=2, comments="Rejected without funding"),
+        _result(id=3, comments="Interview next week"),
+        _result(id=4, comments="Full funding and stipend"),
+        _result(id=5, comments=None),
+    ])
+
+    results = model.AdmissionResult.search("funding")
+    assert [r["p_id"] for r in results][0] == 1
+    assert {r["p_id"] for r in results} == {1, 2, 4}
+    assert "<b>funding</b>" in results[0]["headline"]
+    assert results[0]["program"] == "MIT Physics"
+
+    first = model.AdmissionResult.search("funding", limit=2)
+    rest = model.AdmissionResult.search(
+        "funding", limit=2, after=(first[-1]["rank"], first[-1]["p_id"])
+    )
+    assert [r["p_id"] for r in first + rest] == [r["p_id"] for r in results]
+
+    assert [r["p_id"] for r in model.AdmissionResult.search('"full funding" -rejected')] == [4]
+
+
+@pytest.mark.db
+def test_search_escapes_headline(empty_table):
+    """Test that markup in comments is escaped and only highlights are tags."""
+    _save([_result(id=1, comments='Funding for R&D <script>alert("x")</script> <b>yes</b>')])
+
+    headline = model.AdmissionResult.search("funding")[0]["headline"]
+    assert headline.startswith("<b>Funding</b> for R&amp;D &lt;script&gt;")
+    assert "<script>" not in headline
+    assert "&lt;b&gt;yes&lt;/b&gt;" in headline
+
+    # Words that also name entities only match the comment text itself
+    _save([_result(id=2, comments="Q&A about amp sizes \x02 5 < lt")])
+    assert model.AdmissionResult.search("amp")[0]["headline"] == (
+        "Q&amp;A about <b>amp</b> sizes  5 &lt; lt"
+    )
+    assert model.AdmissionResult.search("lt")[0]["headline"].endswith("5 &lt; <b>lt</b>")
+
+
+@pytest.mark.db
+def test_search_uses_gin_index(empty_table):
+    """Test that the comments_tsv GIN index serves matches."""
+    with postgres_manager.get_connection() as conn:
+        conn.execute("SET enable_seqscan = off;")
+        plan = conn.execute(sql.SQL(
+            "EXPLAIN SELECT p_id FROM {} WHERE comments_tsv @@ to_tsquery('english', 'x');"
+        ).format(sql.Identifier(model.get_data_table()))).fetchall()
+
+    assert model._index_name("comments_search") in " ".join(row[0] for row in plan)
+
+
+@pytest.mark.db
+def test_reads_routed_to_replica(empty_table, read_replica):
+    """Test that analytics reads use the replica and refreshes read their own writes."""
+    query = "SELECT current_database() AS db;"
+    assert model.AdmissionResult.execute_raw(query, []) == [{"db": read_replica}]
+    assert model.AdmissionResult.execute_raw(query, [], primary=True)[0]["db"] != read_replica
+
+    # The replica has no tables, while the next scrape must start from the primary's data
+    _save([_result(id=7)])
+    postgres_manager._last_write = None
+    assert model.AdmissionResult.get_latest_id() == 7
+    assert _run_async(model.AdmissionResult.get_latest_id_async(exact=True)) == 7
+    with pytest.raises(psycopg.errors.UndefinedTable):
+        model.AdmissionResult.count()
+
+    # After saving, this process reads from the primary
+    _save([_result(id=8)])
+    assert model.AdmissionResult.count() == 2
+    assert [r.id for r in model.AdmissionResult.iter_where()] == [7, 8]
+
+
+# ------------------------
+# named queries
+# ------------------------
+
+
+@pytest.mark.db
+def test_execute_named_prepares_once_per_connection(empty_table, monkeypatch):
+    """Test that registered statements are prepared once per connection and counted."""
+    _save([_result(id=1), _result(id=2, year=2024)])
+    postgres_manager.close_pool()
+    monkeypatch.setattr(postgres_manager, "POOL_MAX_SIZE", 1)
+    model.reset_query_stats()
+
+    model.register_query("count_by_year", f"SELECT COUNT(*) AS n FROM {empty_table} WHERE year=%s;")
+    assert model.AdmissionResult.execute_named("count_by_year", [2025]) == [{"n": 1}]
+    assert model.AdmissionResult.execute_named("count_by_year", [2024]) == [{"n": 1}]
+
+    stats = {row["name"]: row for row in model.query_stats()}["count_by_year"]
+    assert stats["calls"] == 2
+    assert stats["first_runs"] == 1
+    assert stats["repeat_runs"] == 1
+    assert stats["mean_ms"] > 0
+
+    with postgres_manager.connection() as conn:
+        prepared = conn.execute(
+            "SELECT statement, generic_plans + custom_plans FROM pg_prepared_statements;"
+        ).fetchall()
+    assert [runs for statement, runs in prepared if "WHERE year=$1" in statement] == [2]
+
+    # A connection replacing a closed one is a first run, even with the same backend PID
+    postgres_manager.close_pool()
+    assert model.AdmissionResult.execute_named("count_by_year", [2025]) == [{"n": 1}]
+    stats = {row["name"]: row for row in model.query_stats()}["count_by_year"]
+    assert (stats["calls"], stats["first_runs"]) == (3, 2)
+
+    # New text is prepared again; re-registering the same text changes nothing
+    model.register_query("count_by_year", f"SELECT COUNT(*) AS n FROM {empty_table} WHERE year<%s;")
+    model.register_query("count_by_year", f"SELECT COUNT(*) AS n FROM {empty_table} WHERE year<%s;")
+    assert model.AdmissionResult.execute_named("count_by_year", [2025]) == [{"n": 1}]
+    stats = {row["name"]: row for row in model.query_stats()}["count_by_year"]
+    assert (stats["calls"], stats["first_runs"]) == (4, 3)
+
+    model.reset_query_stats()
+    stats = {row["name"]: row for row in model.query_stats()}["count_by_year"]
+    assert (stats["calls"], stats["first_runs"], stats["mean_ms"]) == (0, 0, 0.0)
+
+    with pytest.raises(ValueError):
+        model.AdmissionResult.execute_named("missing", [])
+
+    postgres_manager.close_pool()
+
+
+# ------------------------
+# slow-query log
+# ------------------------
+
+
+@pytest.mark.db
+def test_slow_queries_logged_and_captured(empty_table, monkeypatch, capsys):
+    """Test that slow statements are printed, explained and summarized worst first."""
+    _save([_result(id=1)])
+    monkeypatch.setattr(model, "SLOW_QUERY_MS", 0)
+
+    # Only printed unless capture is enabled
+    model.AdmissionResult.execute_raw(f"SELECT p_id FROM {empty_table} WHERE year=%s;", [2025])
+    assert "Slow query execute_raw (" in capsys.readouterr().out
+    assert model.slow_query_report() == []
+
+    monkeypatch.setenv("DB_CAPTURE_SLOW_QUERIES", "1")
+    model.AdmissionResult.execute_raw(f"SELECT p_id FROM {empty_table} WHERE year=%s;", [2025])
+    model.AdmissionResult.execute_raw(f"SELECT p_id FROM {empty_table} WHERE year=%s;", [2024])
+    assert _run_async(model.AdmissionResult.count_async(exact=True)) == 1
+
+    # Writes are recorded but never re-run by EXPLAIN ANALYZE
+    with postgres_manager.connection() as conn:
+        with conn.cursor() as cur:
+            model._timed_fetch(cur, sql.SQL("UPDATE {} SET gpa = 4 RETURNING p_id;").format(
+                sql.Identifier(model.get_data_table())
+            ), label="bump")
+
+    report = {row["query"]: row for row in model.slow_query_report()}
+    assert len(report) == 3
+    raw = report[f"SELECT p_id FROM {empty_table} WHERE year=%s;"]
+    assert (raw["label"], raw["calls"]) == ("execute_raw", 2)
+    assert "actual time" in raw["plan"] and "Buffers" in raw["plan"]
+    assert raw["max_ms"] >= raw["mean_ms"] > 0
+    bump = [row for row in report.values() if row["label"] == "bump"]
+    assert bump[0]["plan"] is None
+    assert model.slow_query_report(limit=1)[0]["total_ms"] == max(
+        row["total_ms"] for row in report.values()
+    )
+
+    # Capture problems never fail the query itself
+    with postgres_manager.connection() as conn:
+        conn.execute(sql.SQL("DROP TABLE {};").format(sql.Identifier(model.get_slow_query_table())))
+
+    assert model.AdmissionResult.count(exact=True) == 1
+    assert _run_async(model.AdmissionResult.count_async(exact=True)) == 1
+    model.flush_slow_queries()
+    assert capsys.readouterr().out.count("Could not capture slow query") == 2
+
+
+# ------------------------
+# fuzzy name lookup
+# ------------------------
+
+
+@pytest.mark.db
+def test_fuzzy_lookup_without_trigram(empty_table):
+    """Test the word-matching fallback used when pg_trgm isn't installed."""
+    model.get_dimension_cache("schools").resolve([
+        "Johns Hopkins University", "Johns Hopkins SAIS", "Hopkins 100%", "MIT",
+    ])
+    model._trigram_available[model.get_data_table()] = False
+
+    matches = model.fuzzy_lookup("schools", "  johns  hop ")
+    assert [(m["name"], m["score"]) for m in matches] == [
+        ("Johns Hopkins SAIS", 1), ("Johns Hopkins University", 1), ("Hopkins 100%", 0.5),
+    ]
+
+    # Words that match nothing lower the score instead of excluding the name
+    matches = model.fuzzy_lookup("schools", "johns hopkins cs", limit=2)
+    assert [m["name"] for m in matches] == ["Johns Hopkins SAIS", "Johns Hopkins University"]
+    assert matches[0]["score"] == pytest.approx(2 / 3)
+    assert model.fuzzy_lookup("schools", "ohns") == []
+
+    assert [m["name"] for m in model.fuzzy_lookup("schools", "hopkins", limit=1)] == [
+        "Hopkins 100%"
+    ]
+    assert [m["name"] for m in model.fuzzy_lookup("schools", "100%")] == ["Hopkins 100%"]
+    assert model.fuzzy_lookup("schools", "   ") == []
+
+    with pytest.raises(ValueError):
+        model.fuzzy_lookup("universities", "mit")
+
+
+@pytest.mark.db
+def test_fuzzy_lookup_with_trigram(empty_table):
+    """Test the pg_trgm query on a server that ships the extension."""
+    if not model.AdmissionResult.execute_raw(
+        "SELECT name FROM pg_available_extensions WHERE name = 'pg_trgm';", []
+    ):
+        pytest.skip("pg_trgm is not available on this server")
+
+    model.get_dimension_cache("schools").resolve([
+        "Johns Hopkins University", "University of California, Los Angeles", "UCLA",
+    ])
+
+    matches = model.fuzzy_lookup("schools", "jonhs hopkins")
+    assert matches[0]["name"] == "Johns Hopkins University"
+    assert 0 < matches[0]["score"] <= 1
+
+    assert [m["name"] for m in model.fuzzy_lookup("schools", "ucl", limit=1)] == ["UCLA"]
+    assert model._trigram_available[model.get_data_table()] is True
+
+
+@pytest.mark.db
+def test_enable_trigram_indexes_names(mocker):
+    """Test that trigram indexes are created once the extension installs."""
+    cursor = mocker.MagicMock()
+
+    assert model._enable_trigram(cursor) is True
+    statements = [c[0][0] for c in cursor.execute.call_args_list[1:]]
+    assert all("gin_trgm_ops" in s.as_string() for s in statements)
+    assert len(statements) == len(model.DIMENSIONS)
+
+
+# ------------------------
+# async API
+# ------------------------
+
+
+def _run_async(coroutine):
+    async def run():
+        try:
+            return await coroutine
+        finally:
+            await postgres_manager.close_async_pool()
+
+    return asyncio.run(run())
+
+
+@pytest.mark.db
+def test_async_api_matches_sync(empty_table):
+    """Test async writes and concurrent async reads over the async pool."""
+    async def scenario():
+        async with postgres_manager.async_connection() as conn:
+            async with conn.cursor() as cur:
+                await model.AdmissionResult.save_many_async(cur, [_result(id=4), _result(id=8)])
+                await model.AdmissionResult.save_many_async(cur, [_result(id=6, gpa=3.1)])
+
+        return await asyncio.gather(
+            model.AdmissionResult.count_async(),
+            model.AdmissionResult.count_async(exact=True),
+            model.AdmissionResult.get_latest_id_async(),
+            model.AdmissionResult.get_latest_id_async(exact=True),
+            model.AdmissionResult.execute_raw_async(
+                f"SELECT p_id, gpa FROM {empty_table} WHERE p_id = %s;", [6]
+            ),
+        )
+
+    assert _run_async(scenario()) == [3, 3, 8, 8, [{"p_id": 6, "gpa": 3.1}]]
+    assert model.AdmissionResult.count() == 3
+
+
+@pytest.mark.db
+def test_async_save_creates_partitions(partitioned_table):
+    """Test that the async writer creates missing year partitions."""
+    async def scenario():
+        async with postgres_manager.async_connection() as conn:
+            async with conn.cursor() as cur:
+                await model.AdmissionResult.save_many_async(cur, [_result(id=1, year=2019)])
+                await model.AdmissionResult.save_many_async(cur, [_result(id=2, year=2019)])
+
+    _run_async(scenario())
+
+    assert model.AdmissionResult.count() == 2
+    rows = model.AdmissionResult.execute_raw(
+        "SELECT to_regclass(%s) IS NOT NULL AS exists;", [f"{model.get_data_table()}_y2019"]
+    )
+    assert rows == [{"exists": True}]
@@ -94,40 +94,561 @@ def test_get_connection(mocker):
     get_connection()
 
 
+@pytest.mark.db
+def test_connection_params_prefer_local_socket(tmp_path, monkeypatch):
+    """Test that a server on DATA_DIR is reached through its socket when it's local."""
+    import os
+    import postgres_manager
+
+    monkeypatch.setattr(postgres_manager, "DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(postgres_manager, "PG_HOST", "localhost")
+    port = postgres_manager.PG_PORT
+    assert postgres_manager.get_connection_params()["host"] == "localhost"
+
+    pid_file = tmp_path / "postmaster.pid"
+    pid_file.write_text(f"{os.getppid()}\n{tmp_path}\n0\n{port}\n{tmp_path}\nlocalhost\n")
+    assert postgres_manager.local_socket_dir() is None  # no socket file yet
+
+    (tmp_path / f".s.PGSQL.{port}").touch()
+    assert postgres_manager.get_connection_params()["host"] == str(tmp_path)
+
+    # Another port, a dead server or a remote host all keep TCP
+    pid_file.write_text(f"{os.getppid()}\n{tmp_path}\n0\n{port + 1}\n{tmp_path}\n")
+    assert postgres_manager.local_socket_dir() is None
+    pid_file.write_text(f"999999999\n{tmp_path}\n0\n{port}\n{tmp_path}\n")
+    assert postgres_manager.local_socket_dir() is None
+    pid_file.write_text(f"{os.getppid()}\n{tmp_path}\n0\n{port}\n{tmp_path}\n")
+    monkeypatch.setattr(postgres_manager, "PG_HOST", "db.example.com")
+    assert postgres_manager.get_connection_params()["host"] == "db.example.com"
+
+
+# ------------------------
+# connection pool
+# ------------------------
+@pytest.mark.db
+def test_connection_pool_reuses_connections():
+    """Test pooled checkout, commit/rollback on exit and pool statistics."""
+    import postgres_manager
+
+    postgres_manager.close_pool()
+    assert postgres_manager.pool_stats() == {}
+
+    with postgres_manager.connection() as conn:
+        conn.execute("CREATE TABLE pool_check (n INT);")
+        conn.execute("INSERT INTO pool_check VALUES (1);")
+
+    with pytest.raises(ZeroDivisionError):
+        with postgres_manager.connection() as conn:
+            conn.execute("INSERT INTO pool_check VALUES (2);")
+            1 / 0
+
+    with postgres_manager.connection() as conn:
+        assert conn.execute("SELECT n FROM pool_check;").fetchall() == [(1,)]
+        conn.execute("DROP TABLE pool_check;")
+
+    stats = postgres_manager.pool_stats()
+    assert stats["pool_min"] == postgres_manager.POOL_MIN_SIZE
+    assert stats["pool_max"] == postgres_manager.POOL_MAX_SIZE
+    assert stats["requests_num"] == 3
+    assert 1 <= stats["pool_size"] <= postgres_manager.POOL_MAX_SIZE
+
+    postgres_manager.close_pool()
+    postgres_manager.close_pool()
+    assert postgres_manager.pool_stats() == {}
+
+
+@pytest.mark.db
+def test_async_pool_per_event_loop():
+    """Test that each event loop gets its own async pool and stale ones are dropped."""
+    import asyncio
+    import postgres_manager
+
+    async def open_pool():
+        pool = await postgres_manager.get_async_pool()
+        assert await postgres_manager.get_async_pool() is pool
+
+        async with postgres_manager.async_connection() as conn:
+            assert (await (await conn.execute("SELECT 1;")).fetchone()) == (1,)
+
+        return pool
+
+    first = asyncio.run(open_pool())
+    assert len(postgres_manager._async_pools) == 1
+
+    async def replace_pool():
+        pool = await open_pool()
+        assert list(postgres_manager._async_pools.values()) == [pool]
+
+        await postgres_manager.close_async_pool()
+        await postgres_manager.close_async_pool()
+        return pool
+
+    assert asyncio.run(replace_pool()) is not first
+    assert postgres_manager._async_pools == {}
+
+
+@pytest.mark.db
+def test_read_routing(read_replica, monkeypatch):
+    """Test that reads go to the replica, except right after a write or when forced."""
+    import asyncio
+    import postgres_manager
+
+    def database(conn):
+        return conn.execute("SELECT current_database();").fetchone()[0]
+
+    assert postgres_manager.reads_from_replica()
+
+    with postgres_manager.read_connection() as conn:
+        assert database(conn) == read_replica
+    with postgres_manager.read_connection(primary=True) as conn:
+        assert database(conn) == postgres_manager.PG_DB
+    with postgres_manager.get_connection(read=True) as conn:
+        assert database(conn) == read_replica
+
+    assert postgres_manager.pool_stats(read=True)["requests_num"] == 1
+
+    async def async_database(primary=False):
+        async with postgres_manager.async_read_connection(primary) as conn:
+            row = await (await conn.execute("SELECT current_database();")).fetchone()
+
+        return row[0]
+
+    async def both():
+        try:
+            return [await async_database(), await async_database(primary=True)]
+        finally:
+            await postgres_manager.close_async_pool()
+
+    assert asyncio.run(both()) == [read_replica, postgres_manager.PG_DB]
+
+    # Reads stay on the primary within the window after a write
+    postgres_manager.note_write()
+    assert not postgres_manager.reads_from_replica()
+    with postgres_manager.read_connection() as conn:
+        assert database(conn) == postgres_manager.PG_DB
+
+    monkeypatch.setattr(postgres_manager, "READ_YOUR_WRITES_WINDOW", 0)
+    assert postgres_manager.reads_from_replica()
+
+    postgres_manager.close_pool()
+    assert postgres_manager.pool_stats(read=True) == {}
+
+    monkeypatch.setattr(postgres_manager, "read_db_config", None)
+    assert not postgres_manager.reads_from_replica()
+    assert postgres_manager.get_read_connection_params() == postgres_manager.get_connection_params()
+
+
+# ------------------------
+# statement timeouts and cancellation
+# ------------------------
+@pytest.mark.db
+def test_statement_timeouts(monkeypatch, read_replica):
+    """Test the pools' default statement timeouts and per-transaction overrides."""
+    import asyncio
+    import postgres_manager
+
+    monkeypatch.setattr(postgres_manager, "STATEMENT_TIMEOUT_MS", 50)
+    monkeypatch.setattr(postgres_manager, "READ_STATEMENT_TIMEOUT_MS", 40)
+
+    with postgres_manager.connection() as conn:
+        assert conn.execute("SHOW statement_timeout;").fetchone() == ("50ms",)
+        with pytest.raises(psycopg.errors.QueryCanceled):
+            conn.execute("SELECT pg_sleep(0.2);")
+
+    with postgres_manager.connection(timeout=0) as conn:
+        conn.execute("SELECT pg_sleep(0.1);")
+
+    with postgres_manager.read_connection() as conn:
+        assert conn.execute("SHOW statement_timeout;").fetchone() == ("40ms",)
+    with postgres_manager.read_connection(timeout=1000) as conn:
+        assert conn.execute("SHOW statement_timeout;").fetchone() == ("1s",)
+
+    # The override ends with the transaction
+    with postgres_manager.connection() as conn:
+        assert conn.execute("SHOW statement_timeout;").fetchone() == ("50ms",)
+
+    async def settings():
+        try:
+            async with postgres_manager.async_connection(timeout=0) as conn:
+                await conn.execute("SELECT pg_sleep(0.1);")
+            async with postgres_manager.async_read_connection(timeout=30) as conn:
+                row = await (await conn.execute("SHOW statement_timeout;")).fetchone()
+            async with postgres_manager.async_read_connection(primary=True) as conn:
+                with pytest.raises(psycopg.errors.QueryCanceled):
+                    await conn.execute("SELECT pg_sleep(0.2);")
+            return row
+        finally:
+            await postgres_manager.close_async_pool()
+
+    assert asyncio.run(settings()) == ("30ms",)
+
+
+@pytest.mark.db
+def test_cancel_running_statements():
+    """Test that cancel() interrupts a statement running in a cancellable() block."""
+    import threading
+    import time
+    import postgres_manager
+
+    errors = []
+
+    def work():
+        with postgres_manager.cancellable("req-1"):
+            try:
+                with postgres_manager.connection() as conn:
+                    conn.execute("SELECT pg_sleep(10);")
+            except psycopg.errors.QueryCanceled as e:
+                errors.append(e)
+
+            # Later checkouts in the canceled block fail straight away
+            try:
+                with postgres_manager.connection():
+                    pass
+            except psycopg.errors.QueryCanceled as e:
+                errors.append(e)
+
+    assert not postgres_manager.cancel("req-1")
+
+    worker = threading.Thread(target=work)
+    started = time.monotonic()
+    worker.start()
+
+    while not postgres_manager._cancellable.get("req-1"):
+        time.sleep(0.01)
+
+    assert postgres_manager.cancel("req-1")
+    worker.join()
+
+    assert time.monotonic() - started < 5
+    assert len(errors) == 2
+    assert "req-1" not in postgres_manager._cancellable
+    assert not postgres_manager._canceled
+
+    # The canceled connection went back to the pool in a usable state
+    with postgres_manager.connection() as conn:
+        assert conn.execute("SELECT 1;").fetchone() == (1,)
+
+
+@pytest.mark.db
+def test_cancel_from_another_process(read_replica):
+    """Test that cancel() finds statements of other processes through pg_stat_activity."""
+    import os
+    import subprocess
+    import sys
+    import time
+    import postgres_manager
+
+    worker = subprocess.Popen([sys.executable, "-c", """
+import psycopg, postgres_manager
+with postgres_manager.cancellable("req-2"):
+    try:
+        with postgres_manager.connection(timeout=20000) as conn:
+            conn.execute("SELECT pg_sleep(10);")
+    except psycopg.errors.QueryCanceled:
+        print("canceled")
+"""], env={**os.environ, "PYTHONPATH": "src"}, stdout=subprocess.PIPE, text=True)
+
+    started = time.monotonic()
+    name = postgres_manager._cancel_application_name("req-2")
+
+    with postgres_manager.get_connection() as conn:
+        conn.autocommit = True
+        while not conn.execute(
+            "SELECT 1 FROM pg_stat_activity WHERE application_name = %s AND state = 'active';",
+            [name],
+        ).fetchone():
+            time.sleep(0.05)
+
+    assert "req-2" not in postgres_manager._cancellable
+    assert postgres_manager.cancel("req-2")
+    assert worker.communicate(timeout=10)[0].strip() == "canceled"
+    assert time.monotonic() - started < 10
+
+    assert not postgres_manager.cancel("req-2")
+
+
+# ------------------------
+# template databases
+# ------------------------
+@pytest.mark.db
+def test_template_clones(mocker):
+    """Test building a seeded template once and cloning it into isolated databases."""
+    import asyncio
+    import os
+    import postgres_manager
+
+    template = f"{postgres_manager.PG_DB}_seed_check"
+    session = postgres_manager.PG_DB
+    mocker.patch("builtins.print")
+
+    def seed():
+        with postgres_manager.connection() as conn:
+            conn.execute("CREATE TABLE seeded AS SELECT current_database() AS source;")
+
+    seed = mocker.Mock(side_effect=seed)
+
+    try:
+        assert postgres_manager.build_template(seed, template, key="v1")
+        assert not postgres_manager.build_template(seed, template, key="v1")
+        assert seed.call_count == 1
+        assert postgres_manager.PG_DB == session
+
+        clone = postgres_manager.clone_database(template=template)
+        assert clone == f"{session}_{os.getpid()}"
+
+        postgres_manager.use_database(clone)
+        with postgres_manager.connection() as conn:
+            assert conn.execute("SELECT source FROM seeded;").fetchall() == [(template,)]
+            conn.execute("DROP TABLE seeded;")
+
+        async def async_database():
+            try:
+                async with postgres_manager.async_connection() as conn:
+                    cur = await conn.execute("SELECT current_database();")
+                    return (await cur.fetchone())[0]
+            finally:
+                await postgres_manager.close_async_pool()
+
+        assert asyncio.run(async_database()) == clone
+
+        # Clones are independent of each other and of the template
+        assert postgres_manager.clone_database("clone_check", template) == "clone_check"
+
+        # Pools of event loops that ended without closing them are forgotten
+        closed_loop = asyncio.new_event_loop()
+        closed_loop.close()
+        postgres_manager._async_pools[closed_loop] = mocker.Mock()
+
+        postgres_manager.use_database("clone_check")
+        assert postgres_manager._async_pools == {}
+        with postgres_manager.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM seeded;").fetchone() == (1,)
+
+        # A failed seed leaves the template marked stale, and a new key rebuilds it
+        seed.side_effect = ZeroDivisionError
+        with pytest.raises(ZeroDivisionError):
+            postgres_manager.build_template(seed, template, key="v2")
+        assert postgres_manager.PG_DB == "clone_check"
+
+        seed.side_effect = None
+        assert postgres_manager.build_template(seed, template, key="v2")
+
+    finally:
+        postgres_manager.use_database(session)
+        for name in [template, "clone_check", f"{session}_{os.getpid()}"]:
+            postgres_manager.drop_database(name)
+
+
+# ------------------------
+# bulk_load
+# ------------------------
+def _setting(name: str) -> str:
+    import postgres_manager
+
+    with postgres_manager.get_connection() as conn:
+        return conn.execute(f"SHOW {name};").fetchone()[0]
+
+
+@pytest.mark.db
+def test_bulk_load_profile():
+    """Test that the profile lasts for the transaction only."""
+    import postgres_manager
+
+    with postgres_manager.get_connection() as conn:
+        with conn.cursor() as cur:
+            with postgres_manager.bulk_load(cur):
+                cur.execute("SHOW synchronous_commit;")
+                assert cur.fetchone() == ("off",)
+                assert _setting("synchronous_commit") == "on"
+
+        conn.commit()
+        assert conn.execute("SHOW synchronous_commit;").fetchone() == ("on",)
+
+
 # ------------------------
 # start_postgres
 # ------------------------
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point DATA_DIR and SOCKET_DIR at an empty temporary directory."""
+    monkeypatch.setattr("postgres_manager.DATA_DIR", str(tmp_path))
+    monkeypatch.setattr("postgres_manager.SOCKET_DIR", str(tmp_path / "sockets"))
+    return tmp_path
+
+
 @pytest.mark.db
-def test_start_postgres_timeout(mocker):
+def test_start_postgres_timeout(mocker, data_dir):
     """Test PostgreSQL startup timeout handling."""
     mocker.patch("postgres_manager.check_postgres_installed")
     mocker.patch("postgres_manager.init_db")
     mock_process = MagicMock()
+    mock_process.poll.return_value = None
     mocker.patch("subprocess.Popen", return_value=mock_process)
     mocker.patch("atexit.register")
     mocker.patch("postgres_manager.setup_db")  # fully mock to prevent real DB calls
+    mocker.patch("postgres_manager.postmaster_ready", return_value=True)
     mocker.patch("psycopg.connect", side_effect=psycopg.OperationalError())
-    mocker.patch("time.sleep", lambda x: None)
-    mocker.patch("sys.exit")
+    sleep = mocker.patch("time.sleep")
+    mock_exit = mocker.patch("sys.exit")
     mocker.patch("builtins.print")
+    import postgres_manager
     from postgres_manager import start_postgres
 
     start_postgres()
 
+    mock_exit.assert_called_once_with(1)
+    delays = [c.args[0] for c in sleep.call_args_list]
+    assert delays[0] == postgres_manager.STARTUP_POLL_MIN
+    assert max(delays) == postgres_manager.STARTUP_POLL_MAX
+    assert postgres_manager.STARTUP_TIMEOUT <= sum(delays) < postgres_manager.STARTUP_TIMEOUT + 1
+
 
 @pytest.mark.db
-def test_start_postgres_eventual_success(mocker):
+def test_start_postgres_eventual_success(mocker, data_dir):
     """Test successful PostgreSQL startup after initial connection failures."""
     mocker.patch("postgres_manager.check_postgres_installed")
     mocker.patch("postgres_manager.init_db")
     mock_process = MagicMock()
-    mocker.patch("subprocess.Popen", return_value=mock_process)
+    mock_process.poll.return_value = None
+    Popen = mocker.patch("subprocess.Popen", return_value=mock_process)
     mocker.patch("atexit.register")
     mocker.patch("postgres_manager.setup_db")
     mocker.patch("builtins.print")
-    mocker.patch("time.sleep", lambda x: None)
-    side_effects = [psycopg.OperationalError(), psycopg.OperationalError(), MagicMock()]
-    mocker.patch("psycopg.connect", side_effect=side_effects)
+    sleep = mocker.patch("time.sleep")
+    # The pid file reports ready on the second check, then one connection attempt fails
+    mocker.patch("postgres_manager.postmaster_ready", side_effect=[False, True, True])
+    side_effects = [psycopg.OperationalError(), MagicMock()]
+    connect = mocker.patch("psycopg.connect", side_effect=side_effects)
     from postgres_manager import start_postgres
 
     start_postgres()
+
+    assert connect.call_count == 2
+    socket_dir = data_dir / "sockets"
+    assert Popen.call_args.args[0][-2:] == ["-k", str(socket_dir)]
+    assert socket_dir.stat().st_mode & 0o777 == 0o700
+    assert [c.args[0] for c in sleep.call_args_list] == [0.005, 0.01]
+
+
+@pytest.mark.db
+def test_start_postgres_server_exits(mocker, data_dir):
+    """Test that a server process exiting during startup ends the wait immediately."""
+    mocker.patch("postgres_manager.check_postgres_installed")
+    mocker.patch("postgres_manager.init_db")
+    mock_process = MagicMock(returncode=1)
+    mock_process.poll.return_value = 1
+    mocker.patch("subprocess.Popen", return_value=mock_process)
+    mocker.patch("atexit.register")
+    mocker.patch("postgres_manager.setup_db")
+    mocker.patch("postgres_manager.postmaster_ready", return_value=False)
+    sleep = mocker.patch("time.sleep")
+    mocker.patch("builtins.print")
+    from postgres_manager import start_postgres
+
+    with pytest.raises(SystemExit):
+        start_postgres()
+
+    sleep.assert_not_called()
+
+
+@pytest.mark.db
+def test_postmaster_ready(tmp_path, monkeypatch):
+    """Test reading the server state from postmaster.pid."""
+    import postgres_manager
+
+    monkeypatch.setattr(postgres_manager, "DATA_DIR", str(tmp_path))
+    assert not postgres_manager.postmaster_ready()
+
+    pid_file = tmp_path / "postmaster.pid"
+    header = "123\n/data\n1700000000\n5432\n/tmp\nlocalhost\n  1234   5678\n"
+    pid_file.write_text(header + "starting\n")
+    assert not postgres_manager.postmaster_ready()
+
+    pid_file.write_text(header + "ready   \n")
+    assert postgres_manager.postmaster_ready()
+
+
+@pytest.mark.db
+def test_start_postgres_attaches_to_running_server(mocker, data_dir):
+    """Test that a live server on the data directory is reused instead of started."""
+    import os
+    import postgres_manager
+
+    (data_dir / "postmaster.pid").write_text(f"{os.getppid()}\n{data_dir}\n")
+    mocker.patch("postgres_manager.check_postgres_installed")
+    mocker.patch("postgres_manager.init_db")
+    popen = mocker.patch("subprocess.Popen")
+    register = mocker.patch("atexit.register")
+    ready = mocker.patch("postgres_manager.test_postgres_connection")
+    mocker.patch("postgres_manager.setup_db")
+    mocker.patch("builtins.print")
+
+    assert postgres_manager.start_postgres() is None
+    assert postgres_manager.running_postmaster_pid() == os.getppid()
+
+    popen.assert_not_called()
+    ready.assert_called_once_with(None)
+    register.assert_called_once_with(postgres_manager.release_postgres, None)
+    assert (data_dir / postgres_manager.CLIENTS_FILE).read_text() == f"{os.getpid()}\n"
+
+
+@pytest.mark.db
+def test_release_postgres_reference_counts(mocker, data_dir):
+    """Test that only the last process using the server stops it."""
+    import os
+    import postgres_manager
+
+    clients = data_dir / postgres_manager.CLIENTS_FILE
+    stop = mocker.patch("postgres_manager.stop_postgres")
+    stop_pid = mocker.patch("postgres_manager._stop_postmaster")
+    mocker.patch("builtins.print")
+    process = MagicMock()
+
+    # Another live process still uses the server; a dead one is forgotten
+    clients.write_text(f"{os.getpid()}\n{os.getppid()}\n999999999\n")
+    postgres_manager.release_postgres(process)
+    stop.assert_not_called()
+    assert clients.read_text() == f"{os.getppid()}\n"
+
+    clients.write_text(f"{os.getpid()}\n")
+    postgres_manager.release_postgres(process)
+    stop.assert_called_once_with(process)
+
+    # A server started by another process is stopped through postmaster.pid
+    (data_dir / "postmaster.pid").write_text(f"{os.getppid()}\n")
+    postgres_manager.release_postgres()
+    stop_pid.assert_called_once_with(os.getppid())
+    assert clients.read_text() == ""
+
+
+@pytest.mark.db
+def test_stop_postmaster_waits_for_exit(mocker):
+    """Test that a server stopped by PID is signalled and waited for."""
+    import signal
+    import postgres_manager
+
+    kill = mocker.patch("os.kill")
+    mocker.patch("postgres_manager._pid_alive", side_effect=[True, True, False])
+    sleep = mocker.patch("time.sleep")
+    mocker.patch("builtins.print")
+
+    postgres_manager._stop_postmaster(1234)
+
+    kill.assert_called_once_with(1234, signal.SIGTERM)
+    assert sleep.call_count == 2
+
+    mocker.patch("postgres_manager._pid_alive", return_value=True)
+    postgres_manager._stop_postmaster(1234)
+    assert sum(c.args[0] for c in sleep.call_args_list) >= postgres_manager.STARTUP_TIMEOUT
+
+
+@pytest.mark.db
+def test_pid_alive(mocker):
+    """Test process detection, including processes owned by other users."""
+    import os
+    from postgres_manager import _pid_alive
+
+    assert _pid_alive(os.getpid())
+    assert not _pid_alive(999999999)
+    mocker.patch("os.kill", side_effect=PermissionError())
+    assert _pid_alive(1)
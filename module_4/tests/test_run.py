@@ -28,3 +28,28 @@ def test_start_with_data_file(mocker):
     # Call with a filename
     start("file.json")
     mock_load.assert_called_once()
+
+
+@pytest.mark.db
+def test_slow_queries_command(runner, empty_table, mocker, monkeypatch):
+    """Test the CLI report of captured slow statements."""
+    import model
+
+    mocker.patch("run.check_and_configure_postgres")
+
+    result = runner.invoke(args=["slow-queries"])
+    assert result.exit_code == 0
+    assert result.output == "No slow queries captured.\n"
+
+    monkeypatch.setattr(model, "SLOW_QUERY_MS", 0)
+    monkeypatch.setenv("DB_CAPTURE_SLOW_QUERIES", "1")
+    model.AdmissionResult.count(exact=True)
+    model.get_stats()
+
+    result = runner.invoke(args=["slow-queries", "--limit", "1", "--plans"])
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[0].split()[-1] in ("count", "get_stats")
+    assert lines[1].startswith("    SELECT ")
+    assert any(line.startswith("    | ") and "actual time" in line for line in lines)
+    assert not any(line.startswith("    SELECT ") for line in lines[2:])
@@ -20,7 +20,7 @@ def test_scrape_data_exception(mocker):
     mocker.patch("scrape.scrape_page", side_effect=Exception("boom"))
     results = scrape_data(1)
     # Should catch the exception and return an empty list
-    assert results == []
+    assert len(results) == 0
 
 
 @pytest.mark.web
@@ -30,4 +30,4 @@ def test_from_soup_exception(mocker, mock_scrape):
     mocker.patch("scrape.AdmissionResult.from_soup", side_effect=Exception("Test parse error"))
     results = scrape_data(1)
     # Should catch the exception and return an empty list
-    assert results == []
+    assert len(results) == 0